@@ -1,16 +1,11 @@
 from __future__ import annotations
 
-import asyncio
 import re
 from collections import defaultdict
-from datetime import datetime
 from random import choice
 from typing import TYPE_CHECKING, Optional
 
 from disnake import (
-    NotFound,
-    HTTPException,
-    Forbidden,
     VoiceChannel,
     Member,
     Activity,
@@ -22,10 +17,10 @@ from disnake import (
 from disnake.ext.tasks import loop
 from loguru import logger
 
-from utils.basic import CogUI, IntFormatter, EmbedUI
+from utils.basic import CogUI, IntFormatter
 from utils.basic.services.draw import DrawService
 from utils.basic.services.draw.types import ContentType
-from utils.consts import ERROR_EMOJI
+from utils.handlers.management.banners import BannerScheduler
 from utils.i18n import ChisatoLocalStore
 
 if TYPE_CHECKING:
@@ -39,15 +34,21 @@ class Banners(CogUI):
         super().__init__(bot)
 
         self.most_active: dict[Guild, dict[Member, int]] = defaultdict(defaultdict)
+        # The member shown while nobody is active, kept as long as it stays in the guild
+        self.fallback_members: dict[int, int] = {}
+
+        self.scheduler = BannerScheduler(self._banner_inputs, self._apply_banner)
 
     async def cog_load(self) -> None:
         await self.bot.wait_until_first_connect()
 
+        self.scheduler.start()
         self.banner_change_task.start()
         self.check_boosts.start()
         self.clear_most_activity.start()
 
     def cog_unload(self) -> None:
+        self.scheduler.close()
         self.banner_change_task.cancel()
         self.check_boosts.cancel()
         self.clear_most_activity.cancel()
@@ -123,76 +124,64 @@ class Banners(CogUI):
                 locale=member.guild.preferred_locale
             )
 
-    async def _change_banner_task_background(
-            self,
-            guild: Guild,
-            banner_name: str
-    ) -> None:
-        if not await DrawService(self.bot.session).get_status():
-            await self.bot.webhooks.post(
-                {
-                    "embed": EmbedUI(
-                        title=f"{ERROR_EMOJI} Проблема с API",
-                        description=f"> **Причина:** `API не дает ответа.`\n"
-                                    f"> **Гильдия:** `{guild.name} | {guild.id} ({guild.owner.name} "
-                                    f"| {guild.owner.id})`\n"
-                                    f"> **Время:** {(n := datetime.now())} | `{n.timestamp()}`"
-                    )
-                },
-                type='command'
-            )
-            return logger.warning("Api offline... Banner don't changed background")
+    def get_fallback_member(self, guild: Guild) -> Member:
+        candidates = sum(map(lambda channel: channel.members, guild.voice_channels), []) or guild.members
+        if (
+                (member := guild.get_member(self.fallback_members.get(guild.id, 0)))
+                and member in candidates
+        ):
+            return member
+
+        member = choice(candidates)
+        self.fallback_members[guild.id] = member.id
+        return member
 
-        member = (
-                self.get_most_activity_member(guild)
-                or choice(sum(map(lambda channel: channel.members, guild.voice_channels), []) or guild.members)
+    def _banner_inputs(self, guild: Guild, banner_name: str) -> dict[str, str | int]:
+        member = self.get_most_activity_member(guild) or self.get_fallback_member(guild)
+        statuses = _t.get(
+            "banners.activities.list",
+            locale=guild.preferred_locale
         )
+
+        return dict(
+            bannerName=banner_name,
+            guildLanguage=str(guild.preferred_locale).replace("-", "_"),
+            guildMembers=m if (
+                                  m := len(guild.members)
+                              ) < 999999 else IntFormatter(m).format_number(),
+            voiceMembers=v if (
+                                  v := self.get_voice_members(guild.voice_channels)
+                              ) < 9999 else IntFormatter(v).format_number(),
+            activityMemberAvatarUrl=member.display_avatar.url,
+            activityMemberName=member.name,
+            # Picked by member rather than at random, so unchanged inputs give the same banner
+            activityMemberStatus=statuses[member.id % len(statuses)]
+        )
+
+    async def _apply_banner(self, guild: Guild, inputs: dict[str, str | int]) -> None:
         async with DrawService(self.bot.session) as r:
             file = await r.draw_image(
                 "guild_banner",
                 cache=False,
                 content_type=ContentType.BYTES,
-                bannerName=banner_name,
-                guildLanguage=str(guild.preferred_locale).replace("-", "_"),
-                guildMembers=m if (
-                                      m := len(guild.members)
-                                  ) < 999999 else IntFormatter(m).format_number(),
-                voiceMembers=v if (
-                                      v := self.get_voice_members(guild.voice_channels)
-                                  ) < 9999 else IntFormatter(v).format_number(),
-                activityMemberAvatarUrl=member.display_avatar.url,
-                activityMemberName=member.name,
-                activityMemberStatus=choice(
-                    _t.get(
-                        "banners.activities.list",
-                        locale=guild.preferred_locale
-                    )
-                )
+                **inputs
             )
 
-        try:
-            await guild.edit(banner=file)
-        except NotFound:
-            pass
-        except Forbidden:
-            pass
-        except HTTPException as e:
-            logger.warning(f"{e.__class__.__name__}: {e}")
+        await guild.edit(banner=file)
 
     @loop(minutes=1)
     async def banner_change_task(self) -> None:
         if not hasattr(self.bot.databases, "settings"):
             return
 
+        if not DrawService.health.available:
+            return logger.warning("Api offline... Banners are not changed")
+
         for guild_id, banner_name in (
                 await self.bot.databases.settings.get_guilds_with_banners()
         ):
             if guild := self.bot.get_guild(guild_id):
-                asyncio.create_task(
-                    self._change_banner_task_background(
-                        guild, banner_name
-                    )
-                )
+                self.scheduler.schedule(guild, banner_name)
 
 
 def setup(bot: ChisatoBot) -> None:
@@ -34,6 +34,7 @@ from disnake.abc import GuildChannel
 from disnake.utils import format_dt
 
 from utils.basic import CogUI, EmbedUI, EmbedErrorUI
+from utils.handlers.management.logs import LogsDispatcher, LogsCategory, AuditLogService
 from utils.i18n import ChisatoLocalStore
 
 if TYPE_CHECKING:
@@ -43,17 +44,35 @@ _t: ChisatoLocalStore = ChisatoLocalStore.load(__file__)
 
 
 class LoggingCog(CogUI):
+    def __init__(self, bot: 'ChisatoBot') -> None:
+        self.dispatcher = LogsDispatcher(bot)
+        self.audit = AuditLogService()
+        super().__init__(bot)
+
+    async def cog_load(self) -> None:
+        await self.bot.wait_until_first_connect()
+
+        self.dispatcher.start()
+
+    def cog_unload(self) -> None:
+        self.dispatcher.stop()
 
     @CogUI.listener()
-    async def on_automod_action_execution(self, execution: AutoModActionExecution) -> None:
-        try:
-            settings: Record = await self.bot.databases.settings.get_logs_settings(guild=execution.guild)
-            channel_send: TextChannel | None = execution.guild.get_channel(settings[5])
-        except Exception as e:
-            _ = e
-            return None
+    async def on_audit_log_entry_create(self, entry: AuditLogEntry) -> None:
+        if entry.guild.id in self.dispatcher:
+            self.audit.add(entry)
+
+    @CogUI.listener()
+    async def on_guild_remove(self, guild: Guild) -> None:
+        self.audit.forget(guild)
 
-        if channel_send is None:
+    @CogUI.listener()
+    async def on_logs_settings_update(self, guild: Guild, settings: Record | None) -> None:
+        self.dispatcher.update(guild, settings)
+
+    @CogUI.listener()
+    async def on_automod_action_execution(self, execution: AutoModActionExecution) -> None:
+        if not (channel_send := self.dispatcher.get_channel(execution.guild, LogsCategory.AUTOMOD)):
             return
 
         try:
@@ -75,7 +94,7 @@ class LoggingCog(CogUI):
             }
 
             embed: EmbedErrorUI = EmbedErrorUI(error_messages[type(error)], member=execution.guild.owner)
-            await channel_send.send(embed=embed)
+            self.dispatcher.send(channel_send, embed)
         else:
             embed: EmbedUI = EmbedUI(
                 title=_t.get(key="logging.title.automod", locale=execution.guild.preferred_locale),
@@ -94,21 +113,11 @@ class LoggingCog(CogUI):
                 )
             )
 
-            try:
-                await channel_send.send(embed=embed)
-            except (HTTPException, Forbidden, TypeError, ValueError, AttributeError):
-                pass
+            self.dispatcher.send(channel_send, embed)
 
     @CogUI.listener()
     async def on_automod_rule_create(self, rule: AutoModRule) -> None:
-        try:
-            settings: Record = await self.bot.databases.settings.get_logs_settings(guild=rule.guild)
-            channel_send: TextChannel | None = rule.guild.get_channel(settings[5])
-        except Exception as e:
-            _ = e
-            return None
-
-        if channel_send is None:
+        if not (channel_send := self.dispatcher.get_channel(rule.guild, LogsCategory.AUTOMOD)):
             return
 
         not_ind: str = _t.get(key="logging.not_indicated", locale=rule.guild.preferred_locale)
@@ -134,21 +143,11 @@ class LoggingCog(CogUI):
             )
         )
 
-        try:
-            await channel_send.send(embed=embed)
-        except (HTTPException, Forbidden, TypeError, ValueError, AttributeError):
-            pass
+        self.dispatcher.send(channel_send, embed)
 
     @CogUI.listener()
     async def on_automod_rule_delete(self, rule: AutoModRule) -> None:
-        try:
-            settings: Record = await self.bot.databases.settings.get_logs_settings(guild=rule.guild)
-            channel_send: TextChannel | None = rule.guild.get_channel(settings[5])
-        except Exception as e:
-            _ = e
-            return None
-
-        if channel_send is None:
+        if not (channel_send := self.dispatcher.get_channel(rule.guild, LogsCategory.AUTOMOD)):
             return
 
         not_ind: str = _t.get(key="logging.not_indicated", locale=rule.guild.preferred_locale)
@@ -174,28 +173,15 @@ class LoggingCog(CogUI):
             )
         )
 
-        try:
-            await channel_send.send(embed=embed)
-        except (HTTPException, Forbidden, TypeError, ValueError, AttributeError):
-            pass
+        self.dispatcher.send(channel_send, embed)
 
     @CogUI.listener()
     async def on_guild_channel_create(self, channel: GuildChannel) -> None:
-        try:
-            settings: Record = await self.bot.databases.settings.get_logs_settings(guild=channel.guild)
-            channel_send: TextChannel | None = channel.guild.get_channel(settings[2])
-        except Exception as e:
-            _ = e
-            return None
-
-        if channel_send is None:
+        if not (channel_send := self.dispatcher.get_channel(channel.guild, LogsCategory.CHANNELS)):
             return
 
         not_ind: str = _t.get(key="logging.not_indicated", locale=channel.guild.preferred_locale)
-        creator = await channel.guild.audit_logs(
-            limit=1,
-            action=AuditLogAction.channel_create
-        ).flatten()
+        creator = await self.audit.fetch(channel.guild, AuditLogAction.channel_create)
 
         if isinstance(channel, TextChannel):
             duration: Dict[int, str] = {
@@ -226,10 +212,7 @@ class LoggingCog(CogUI):
                 )
             )
 
-            try:
-                await channel_send.send(embed=embed)
-            except (HTTPException, Forbidden, TypeError, ValueError, AttributeError):
-                pass
+            self.dispatcher.send(channel_send, embed)
 
         elif isinstance(channel, VoiceChannel):
             embed: EmbedUI = EmbedUI(
@@ -252,10 +235,7 @@ class LoggingCog(CogUI):
                     )
                 )
             )
-            try:
-                await channel_send.send(embed=embed)
-            except (HTTPException, Forbidden, TypeError, ValueError, AttributeError):
-                pass
+            self.dispatcher.send(channel_send, embed)
 
         elif isinstance(channel, CategoryChannel):
             embed: EmbedUI = EmbedUI(
@@ -273,10 +253,7 @@ class LoggingCog(CogUI):
                 )
             )
 
-            try:
-                await channel_send.send(embed=embed)
-            except (HTTPException, Forbidden, TypeError, ValueError, AttributeError):
-                pass
+            self.dispatcher.send(channel_send, embed)
 
         elif isinstance(channel, StageChannel):
             embed: EmbedUI = EmbedUI(
@@ -302,10 +279,7 @@ class LoggingCog(CogUI):
                 )
             )
 
-            try:
-                await channel_send.send(embed=embed)
-            except (HTTPException, Forbidden, TypeError, ValueError, AttributeError):
-                pass
+            self.dispatcher.send(channel_send, embed)
 
         elif isinstance(channel, ForumChannel):
             duration: Dict[int, str] = {
@@ -338,28 +312,15 @@ class LoggingCog(CogUI):
                 )
             )
 
-            try:
-                await channel_send.send(embed=embed)
-            except (HTTPException, Forbidden, TypeError, ValueError, AttributeError):
-                pass
+            self.dispatcher.send(channel_send, embed)
 
     @CogUI.listener()
     async def on_guild_channel_delete(self, channel: GuildChannel) -> None:
-        try:
-            settings: Record = await self.bot.databases.settings.get_logs_settings(guild=channel.guild)
-            channel_send: TextChannel | None = channel.guild.get_channel(settings[2])
-        except Exception as e:
-            _ = e
-            return None
-
-        if channel_send is None:
+        if not (channel_send := self.dispatcher.get_channel(channel.guild, LogsCategory.CHANNELS)):
             return
 
         not_ind: str = _t.get(key="logging.not_indicated", locale=channel.guild.preferred_locale)
-        deleter = await channel.guild.audit_logs(
-            limit=1,
-            action=AuditLogAction.channel_delete
-        ).flatten()
+        deleter = await self.audit.fetch(channel.guild, AuditLogAction.channel_delete)
 
         if isinstance(channel, TextChannel):
             embed: EmbedUI = EmbedUI(
@@ -381,10 +342,7 @@ class LoggingCog(CogUI):
                 )
             )
 
-            try:
-                await channel_send.send(embed=embed)
-            except (HTTPException, Forbidden, TypeError, ValueError, AttributeError):
-                pass
+            self.dispatcher.send(channel_send, embed)
 
         elif isinstance(channel, VoiceChannel):
             embed: EmbedUI = EmbedUI(
@@ -408,10 +366,7 @@ class LoggingCog(CogUI):
                 )
             )
 
-            try:
-                await channel_send.send(embed=embed)
-            except (HTTPException, Forbidden, TypeError, ValueError, AttributeError):
-                pass
+            self.dispatcher.send(channel_send, embed)
 
         elif isinstance(channel, CategoryChannel):
             embed: EmbedUI = EmbedUI(
@@ -429,10 +384,7 @@ class LoggingCog(CogUI):
                 )
             )
 
-            try:
-                await channel_send.send(embed=embed)
-            except (HTTPException, Forbidden, TypeError, ValueError, AttributeError):
-                pass
+            self.dispatcher.send(channel_send, embed)
 
         elif isinstance(channel, StageChannel):
             embed: EmbedUI = EmbedUI(
@@ -458,10 +410,7 @@ class LoggingCog(CogUI):
                 )
             )
 
-            try:
-                await channel_send.send(embed=embed)
-            except (HTTPException, Forbidden, TypeError, ValueError, AttributeError):
-                pass
+            self.dispatcher.send(channel_send, embed)
 
         elif isinstance(channel, ForumChannel):
             duration: Dict[int, str] = {
@@ -494,28 +443,15 @@ class LoggingCog(CogUI):
                 )
             )
 
-            try:
-                await channel_send.send(embed=embed)
-            except (HTTPException, Forbidden, TypeError, ValueError, AttributeError):
-                pass
+            self.dispatcher.send(channel_send, embed)
 
     @CogUI.listener()
     async def on_guild_channel_update(self, before: GuildChannel, after: GuildChannel) -> None:
-        try:
-            settings: Record = await self.bot.databases.settings.get_logs_settings(guild=before.guild)
-            channel_send: TextChannel | None = before.guild.get_channel(settings[2])
-        except Exception as e:
-            _ = e
-            return None
-
-        if channel_send is None:
+        if not (channel_send := self.dispatcher.get_channel(before.guild, LogsCategory.CHANNELS)):
             return
 
         not_ind: str = _t.get(key="logging.not_indicated", locale=after.guild.preferred_locale)
-        updater = await channel_send.guild.audit_logs(
-            limit=1,
-            action=AuditLogAction.channel_update
-        ).flatten()
+        updater = await self.audit.fetch(channel_send.guild, AuditLogAction.channel_update)
 
         if isinstance(before, TextChannel) and isinstance(after, TextChannel):
             embed: EmbedUI = EmbedUI(
@@ -576,10 +512,7 @@ class LoggingCog(CogUI):
                     values=(before.nsfw, after.nsfw)
                 )
 
-            try:
-                await channel_send.send(embed=embed)
-            except (HTTPException, Forbidden, TypeError, ValueError, AttributeError):
-                pass
+            self.dispatcher.send(channel_send, embed)
 
         elif isinstance(before, VoiceChannel) and isinstance(after, VoiceChannel):
             embed: EmbedUI = EmbedUI(
@@ -652,10 +585,7 @@ class LoggingCog(CogUI):
                     values=(before.slowmode_delay, after.slowmode_delay)
                 )
 
-            try:
-                await channel_send.send(embed=embed)
-            except (HTTPException, Forbidden, TypeError, ValueError, AttributeError):
-                pass
+            self.dispatcher.send(channel_send, embed)
 
         elif isinstance(before, CategoryChannel) and isinstance(after, CategoryChannel):
             embed: EmbedUI = EmbedUI(
@@ -693,10 +623,7 @@ class LoggingCog(CogUI):
                     values=(before.nsfw, after.nsfw)
                 )
 
-            try:
-                await channel_send.send(embed=embed)
-            except (HTTPException, Forbidden, TypeError, ValueError, AttributeError):
-                pass
+            self.dispatcher.send(channel_send, embed)
 
         elif isinstance(before, StageChannel) and isinstance(after, StageChannel):
             embed: EmbedUI = EmbedUI(
@@ -778,10 +705,7 @@ class LoggingCog(CogUI):
                     values=(before.slowmode_delay, after.slowmode_delay)
                 )
 
-            try:
-                await channel_send.send(embed=embed)
-            except (HTTPException, Forbidden, TypeError, ValueError, AttributeError):
-                pass
+            self.dispatcher.send(channel_send, embed)
 
         elif isinstance(before, ForumChannel) and isinstance(after, ForumChannel):
             duration: Dict[int, str] = {
@@ -865,26 +789,14 @@ class LoggingCog(CogUI):
                     values=(before.default_layout, after.default_layout)
                 )
 
-            try:
-                await channel_send.send(embed=embed)
-            except (HTTPException, Forbidden, TypeError, ValueError, AttributeError):
-                pass
+            self.dispatcher.send(channel_send, embed)
 
     @CogUI.listener()
     async def on_guild_channel_pins_update(self, channel: GuildChannel | Thread, _) -> None:
-        try:
-            settings: Record = await self.bot.databases.settings.get_logs_settings(guild=channel.guild)
-            channel_send: TextChannel | None = channel.guild.get_channel(settings[2])
-        except Exception as e:
-            _ = e
-            return None
-
-        if channel_send is None:
+        if not (channel_send := self.dispatcher.get_channel(channel.guild, LogsCategory.CHANNELS)):
             return
 
-        piner_unpiner: List[AuditLogEntry] = await channel_send.guild.audit_logs(
-            limit=1,
-        ).flatten()
+        piner_unpiner: List[AuditLogEntry] = await self.audit.fetch(channel_send.guild)
 
         embed: EmbedUI = EmbedUI(
             title=_t.get(key="logging.on_guild_channel_pins_update.title", locale=channel.guild.preferred_locale),
@@ -907,21 +819,11 @@ class LoggingCog(CogUI):
             case _:  # :D
                 return
 
-        try:
-            await channel_send.send(embed=embed)
-        except (HTTPException, Forbidden, TypeError, ValueError, AttributeError):
-            pass
+        self.dispatcher.send(channel_send, embed)
 
     @CogUI.listener()
     async def on_guild_emojis_update(self, guild: Guild, before: Sequence[Emoji], after: Sequence[Emoji]) -> None:
-        try:
-            settings: Record = await self.bot.databases.settings.get_logs_settings(guild=guild)
-            channel_send: TextChannel | None = guild.get_channel(settings[1])
-        except Exception as e:
-            _ = e
-            return None
-
-        if channel_send is None:
+        if not (channel_send := self.dispatcher.get_channel(guild, LogsCategory.SERVER)):
             return
 
         embed: EmbedUI = EmbedUI(
@@ -930,10 +832,7 @@ class LoggingCog(CogUI):
         )
 
         if len(before) > len(after):
-            deleter: list[AuditLogEntry] = await guild.audit_logs(
-                limit=1,
-                action=AuditLogAction.emoji_delete
-            ).flatten()
+            deleter: list[AuditLogEntry] = await self.audit.fetch(guild, AuditLogAction.emoji_delete)
 
             deleted_emojis: set[Emoji] = set(before) - set(after)
             deleted_emojis_str: str = ", ".join([str(emoji) for emoji in deleted_emojis])
@@ -945,10 +844,7 @@ class LoggingCog(CogUI):
             )
 
         elif len(before) < len(after):
-            creator: list[AuditLogEntry] = await guild.audit_logs(
-                limit=1,
-                action=AuditLogAction.emoji_create
-            ).flatten()
+            creator: list[AuditLogEntry] = await self.audit.fetch(guild, AuditLogAction.emoji_create)
 
             created_emojis: set[Emoji] = set(after) - set(before)
             created_emojis_str: str = ", ".join([str(emoji) for emoji in created_emojis])
@@ -960,10 +856,7 @@ class LoggingCog(CogUI):
             )
 
         elif len(before) == len(after):
-            updater: list[AuditLogEntry] = await guild.audit_logs(
-                limit=1,
-                action=AuditLogAction.emoji_update
-            ).flatten()
+            updater: list[AuditLogEntry] = await self.audit.fetch(guild, AuditLogAction.emoji_update)
 
             embed.description += _t.get(
                 key="logging.on_guild_emojis_update.changed",
@@ -982,27 +875,14 @@ class LoggingCog(CogUI):
         else:
             return
 
-        try:
-            await channel_send.send(embed=embed)
-        except (HTTPException, Forbidden, TypeError, ValueError, AttributeError):
-            pass
+        self.dispatcher.send(channel_send, embed)
 
     @CogUI.listener()
     async def on_guild_role_create(self, role: Role) -> None:
-        try:
-            settings: Record = await self.bot.databases.settings.get_logs_settings(guild=role.guild)
-            channel_send: TextChannel | None = role.guild.get_channel(settings[1])
-        except Exception as e:
-            _ = e
-            return None
-
-        if channel_send is None:
+        if not (channel_send := self.dispatcher.get_channel(role.guild, LogsCategory.SERVER)):
             return
 
-        creator: list[AuditLogEntry] = await channel_send.guild.audit_logs(
-            limit=1,
-            action=AuditLogAction.role_create
-        ).flatten()
+        creator: list[AuditLogEntry] = await self.audit.fetch(channel_send.guild, AuditLogAction.role_create)
 
         embed: EmbedUI = EmbedUI(
             title=_t.get(key="logging.on_guild_role.title", locale=role.guild.preferred_locale),
@@ -1013,27 +893,14 @@ class LoggingCog(CogUI):
             )
         )
 
-        try:
-            await channel_send.send(embed=embed)
-        except (HTTPException, Forbidden, TypeError, ValueError, AttributeError):
-            pass
+        self.dispatcher.send(channel_send, embed)
 
     @CogUI.listener()
     async def on_guild_role_delete(self, role: Role) -> None:
-        try:
-            settings: Record = await self.bot.databases.settings.get_logs_settings(guild=role.guild)
-            channel_send: TextChannel | None = role.guild.get_channel(settings[1])
-        except Exception as e:
-            _ = e
-            return None
-
-        if channel_send is None:
+        if not (channel_send := self.dispatcher.get_channel(role.guild, LogsCategory.SERVER)):
             return
 
-        deleter: list[AuditLogEntry] = await channel_send.guild.audit_logs(
-            limit=1,
-            action=AuditLogAction.role_delete
-        ).flatten()
+        deleter: list[AuditLogEntry] = await self.audit.fetch(channel_send.guild, AuditLogAction.role_delete)
 
         role_emoji_info: str = _t.get(key="logging.not_indicated", locale=role.guild.preferred_locale)
         role_icon_info: str = _t.get(key="logging.not_indicated", locale=role.guild.preferred_locale)
@@ -1083,30 +950,17 @@ class LoggingCog(CogUI):
             )
         )
 
-        try:
-            await channel_send.send(embed=embed)
-        except (HTTPException, Forbidden, TypeError, ValueError, AttributeError):
-            pass
+        self.dispatcher.send(channel_send, embed)
 
     @CogUI.listener()
     async def on_guild_role_update(self, before: Role, after: Role) -> None:
-        try:
-            settings: Record = await self.bot.databases.settings.get_logs_settings(guild=before.guild)
-            channel_send: TextChannel | None = before.guild.get_channel(settings[1])
-        except Exception as e:
-            _ = e
-            return None
-
-        if channel_send is None:
+        if not (channel_send := self.dispatcher.get_channel(before.guild, LogsCategory.SERVER)):
             return
 
         if before.position != after.position:
             return
 
-        updater: list[AuditLogEntry] = await channel_send.guild.audit_logs(
-            limit=1,
-            action=AuditLogAction.role_update
-        ).flatten()
+        updater: list[AuditLogEntry] = await self.audit.fetch(channel_send.guild, AuditLogAction.role_update)
 
         not_ind: str = _t.get(key="logging.not_indicated", locale=before.guild.preferred_locale)
 
@@ -1243,21 +1097,11 @@ class LoggingCog(CogUI):
                         values=(removed_changes_string,)
                     )
 
-        try:
-            await channel_send.send(embed=embed)
-        except (HTTPException, Forbidden, TypeError, ValueError, AttributeError):
-            pass
+        self.dispatcher.send(channel_send, embed)
 
     @CogUI.listener()
     async def on_guild_scheduled_event_create(self, event: GuildScheduledEvent) -> None:
-        try:
-            settings: Record = await self.bot.databases.settings.get_logs_settings(guild=event.guild)
-            channel_send: TextChannel | None = event.guild.get_channel(settings[1])
-        except Exception as e:
-            _ = e
-            return None
-
-        if channel_send is None:
+        if not (channel_send := self.dispatcher.get_channel(event.guild, LogsCategory.SERVER)):
             return
 
         not_ind: str = _t.get(key="logging.not_indicated", locale=event.guild.preferred_locale)
@@ -1293,27 +1137,16 @@ class LoggingCog(CogUI):
                 )
             )
         )
-        try:
-            await channel_send.send(embed=embed)
-        except (HTTPException, Forbidden, TypeError, ValueError, AttributeError):
-            pass
+        self.dispatcher.send(channel_send, embed)
 
     @CogUI.listener()
     async def on_guild_scheduled_event_delete(self, event: GuildScheduledEvent) -> None:
-        try:
-            settings: Record = await self.bot.databases.settings.get_logs_settings(guild=event.guild)
-            channel_send: TextChannel | None = event.guild.get_channel(settings[1])
-        except Exception as e:
-            _ = e
-            return None
-
-        if channel_send is None:
+        if not (channel_send := self.dispatcher.get_channel(event.guild, LogsCategory.SERVER)):
             return
 
-        deleter: list[AuditLogEntry] = await channel_send.guild.audit_logs(
-            limit=1,
-            action=AuditLogAction.guild_scheduled_event_delete
-        ).flatten()
+        deleter: list[AuditLogEntry] = await self.audit.fetch(
+            channel_send.guild, AuditLogAction.guild_scheduled_event_delete
+        )
 
         not_ind: str = _t.get(key="logging.not_indicated", locale=event.guild.preferred_locale)
 
@@ -1349,27 +1182,16 @@ class LoggingCog(CogUI):
             )
         )
 
-        try:
-            await channel_send.send(embed=embed)
-        except (HTTPException, Forbidden, TypeError, ValueError, AttributeError):
-            pass
+        self.dispatcher.send(channel_send, embed)
 
     @CogUI.listener()
     async def on_guild_scheduled_event_update(self, before: GuildScheduledEvent, after: GuildScheduledEvent) -> None:
-        try:
-            settings: Record = await self.bot.databases.settings.get_logs_settings(guild=before.guild)
-            channel_send: TextChannel | None = before.guild.get_channel(settings[1])
-        except Exception as e:
-            _ = e
-            return None
-
-        if channel_send is None:
+        if not (channel_send := self.dispatcher.get_channel(before.guild, LogsCategory.SERVER)):
             return
 
-        updater: list[AuditLogEntry] = await channel_send.guild.audit_logs(
-            limit=1,
-            action=AuditLogAction.guild_scheduled_event_update
-        ).flatten()
+        updater: list[AuditLogEntry] = await self.audit.fetch(
+            channel_send.guild, AuditLogAction.guild_scheduled_event_update
+        )
 
         not_ind: str = _t.get(key="logging.not_indicated", locale=before.guild.preferred_locale)
 
@@ -1463,10 +1285,7 @@ class LoggingCog(CogUI):
                     values=(before.image.url, after.image.url)
                 )
 
-        try:
-            await channel_send.send(embed=embed)
-        except (HTTPException, Forbidden, TypeError, ValueError, AttributeError):
-            pass
+        self.dispatcher.send(channel_send, embed)
 
     @CogUI.listener()
     async def on_guild_stickers_update(
@@ -1475,14 +1294,7 @@ class LoggingCog(CogUI):
             before: Sequence[GuildSticker],
             after: Sequence[GuildSticker]
     ) -> None:
-        try:
-            settings: Record = await self.bot.databases.settings.get_logs_settings(guild=guild)
-            channel_send: TextChannel | None = guild.get_channel(settings[1])
-        except Exception as e:
-            _ = e
-            return None
-
-        if channel_send is None:
+        if not (channel_send := self.dispatcher.get_channel(guild, LogsCategory.SERVER)):
             return
 
         embed: EmbedUI = EmbedUI(
@@ -1493,10 +1305,7 @@ class LoggingCog(CogUI):
         not_ind: str = _t.get(key="logging.not_indicated", locale=guild.preferred_locale)
 
         if len(before) > len(after):
-            deleter: list[AuditLogEntry] = await guild.audit_logs(
-                limit=1,
-                action=AuditLogAction.sticker_delete
-            ).flatten()
+            deleter: list[AuditLogEntry] = await self.audit.fetch(guild, AuditLogAction.sticker_delete)
 
             deleted_sticker: set[GuildSticker] = set(before) - set(after)
 
@@ -1514,10 +1323,7 @@ class LoggingCog(CogUI):
                 )
 
         elif len(before) < len(after):
-            creator: list[AuditLogEntry] = await guild.audit_logs(
-                limit=1,
-                action=AuditLogAction.sticker_create
-            ).flatten()
+            creator: list[AuditLogEntry] = await self.audit.fetch(guild, AuditLogAction.sticker_create)
 
             created_sticker: set[GuildSticker] = set(after) - set(before)
 
@@ -1535,10 +1341,7 @@ class LoggingCog(CogUI):
                 )
 
         elif len(before) == len(after):
-            updater: list[AuditLogEntry] = await guild.audit_logs(
-                limit=1,
-                action=AuditLogAction.sticker_update
-            ).flatten()
+            updater: list[AuditLogEntry] = await self.audit.fetch(guild, AuditLogAction.sticker_update)
 
             embed.description += _t.get(
                 key="logging.on_guild_stickers_update.sticker_updated",
@@ -1570,21 +1373,11 @@ class LoggingCog(CogUI):
         else:
             return
 
-        try:
-            await channel_send.send(embed=embed)
-        except (HTTPException, Forbidden, TypeError, ValueError, AttributeError):
-            pass
+        self.dispatcher.send(channel_send, embed)
 
     @CogUI.listener()
     async def on_guild_update(self, before: Guild, after: Guild) -> None:
-        try:
-            settings: Record = await self.bot.databases.settings.get_logs_settings(guild=before)
-            channel_send: TextChannel | None = before.get_channel(settings[1])
-        except Exception as e:
-            _ = e
-            return None
-
-        if channel_send is None:
+        if not (channel_send := self.dispatcher.get_channel(before, LogsCategory.SERVER)):
             return
 
         if before.widget_enabled != after.widget_enabled:
@@ -1931,27 +1724,14 @@ class LoggingCog(CogUI):
                 locale=after.preferred_locale
             )
 
-        try:
-            await channel_send.send(embed=embed)
-        except (HTTPException, Forbidden, TypeError, ValueError, AttributeError):
-            pass
+        self.dispatcher.send(channel_send, embed)
 
     @CogUI.listener()
     async def on_bulk_message_delete(self, messages: List[Message]) -> None:
-        try:
-            settings: Record = await self.bot.databases.settings.get_logs_settings(guild=messages[0].guild)
-            channel_send: TextChannel | None = messages[0].guild.get_channel(settings[4])
-        except Exception as e:
-            _ = e
-            return None
-
-        if channel_send is None:
+        if not (channel_send := self.dispatcher.get_channel(messages[0].guild, LogsCategory.MESSAGES)):
             return
 
-        deleter: list[AuditLogEntry] = await channel_send.guild.audit_logs(
-            limit=1,
-            action=AuditLogAction.message_bulk_delete
-        ).flatten()
+        deleter: list[AuditLogEntry] = await self.audit.fetch(channel_send.guild, AuditLogAction.message_bulk_delete)
 
         embed: EmbedUI = EmbedUI(
             title=_t.get(key="logging.on_bulk_message.title", locale=messages[0].guild.preferred_locale),
@@ -1968,21 +1748,11 @@ class LoggingCog(CogUI):
             )
         )
 
-        try:
-            await channel_send.send(embed=embed)
-        except (HTTPException, Forbidden, TypeError, ValueError, AttributeError):
-            pass
+        self.dispatcher.send(channel_send, embed)
 
     @CogUI.listener()
     async def on_invite_create(self, invite: Invite) -> None:
-        try:
-            settings: Record = await self.bot.databases.settings.get_logs_settings(guild=invite.guild)
-            channel_send: TextChannel | None = invite.guild.get_channel(settings[1])
-        except Exception as e:
-            _ = e
-            return None
-
-        if channel_send is None:
+        if not (channel_send := self.dispatcher.get_channel(invite.guild, LogsCategory.SERVER)):
             return
 
         embed: EmbedUI = EmbedUI(
@@ -2002,27 +1772,14 @@ class LoggingCog(CogUI):
             )
         )
 
-        try:
-            await channel_send.send(embed=embed)
-        except (HTTPException, Forbidden, TypeError, ValueError, AttributeError):
-            pass
+        self.dispatcher.send(channel_send, embed)
 
     @CogUI.listener()
     async def on_invite_delete(self, invite: Invite) -> None:
-        try:
-            settings: Record = await self.bot.databases.settings.get_logs_settings(guild=invite.guild)
-            channel_send: TextChannel | None = invite.guild.get_channel(settings[1])
-        except Exception as e:
-            _ = e
-            return None
-
-        if channel_send is None:
+        if not (channel_send := self.dispatcher.get_channel(invite.guild, LogsCategory.SERVER)):
             return
 
-        deleter: list[AuditLogEntry] = await channel_send.guild.audit_logs(
-            limit=1,
-            action=AuditLogAction.invite_delete
-        ).flatten()
+        deleter: list[AuditLogEntry] = await self.audit.fetch(channel_send.guild, AuditLogAction.invite_delete)
 
         embed: EmbedUI = EmbedUI(
             title=_t.get(key="logging.on_invite.title", locale=invite.guild.preferred_locale),
@@ -2042,21 +1799,11 @@ class LoggingCog(CogUI):
             )
         )
 
-        try:
-            await channel_send.send(embed=embed)
-        except (HTTPException, Forbidden, TypeError, ValueError, AttributeError):
-            pass
+        self.dispatcher.send(channel_send, embed)
 
     @CogUI.listener()
     async def on_member_join(self, member: Member) -> None:
-        try:
-            settings: Record = await self.bot.databases.settings.get_logs_settings(guild=member.guild)
-            channel_send: TextChannel | None = member.guild.get_channel(settings[3])
-        except Exception as e:
-            _ = e
-            return None
-
-        if channel_send is None:
+        if not (channel_send := self.dispatcher.get_channel(member.guild, LogsCategory.MEMBERS)):
             return
 
         embed: EmbedUI = EmbedUI(
@@ -2072,21 +1819,11 @@ class LoggingCog(CogUI):
             )
         )
 
-        try:
-            await channel_send.send(embed=embed)
-        except (HTTPException, Forbidden, TypeError, ValueError, AttributeError):
-            pass
+        self.dispatcher.send(channel_send, embed)
 
     @CogUI.listener()
     async def on_member_remove(self, member: Member) -> None:
-        try:
-            settings: Record = await self.bot.databases.settings.get_logs_settings(guild=member.guild)
-            channel_send: TextChannel | None = member.guild.get_channel(settings[3])
-        except Exception as e:
-            _ = e
-            return None
-
-        if channel_send is None:
+        if not (channel_send := self.dispatcher.get_channel(member.guild, LogsCategory.MEMBERS)):
             return
 
         try:
@@ -2106,23 +1843,13 @@ class LoggingCog(CogUI):
                 )
             )
 
-            try:
-                await channel_send.send(embed=embed)
-            except (HTTPException, Forbidden, TypeError, ValueError, AttributeError):
-                pass
+            self.dispatcher.send(channel_send, embed)
         else:
             return
 
     @CogUI.listener()
     async def on_member_update(self, before: Member, after: Member) -> None:
-        try:
-            settings: Record = await self.bot.databases.settings.get_logs_settings(guild=before.guild)
-            channel_send: TextChannel | None = before.guild.get_channel(settings[3])
-        except Exception as e:
-            _ = e
-            return None
-
-        if channel_send is None:
+        if not (channel_send := self.dispatcher.get_channel(before.guild, LogsCategory.MEMBERS)):
             return
 
         if before.roles != after.roles:
@@ -2203,21 +1930,11 @@ class LoggingCog(CogUI):
         if embed.description == description:
             return
 
-        try:
-            await channel_send.send(embed=embed)
-        except (HTTPException, Forbidden, TypeError, ValueError, AttributeError):
-            pass
+        self.dispatcher.send(channel_send, embed)
 
     @CogUI.listener()
     async def on_message_delete(self, message: Message) -> None:
-        try:
-            settings: Record = await self.bot.databases.settings.get_logs_settings(guild=message.guild)
-            channel_send: TextChannel | None = message.guild.get_channel(settings[4])
-        except Exception as e:
-            _ = e
-            return None
-
-        if channel_send is None:
+        if not (channel_send := self.dispatcher.get_channel(message.guild, LogsCategory.MESSAGES)):
             return
 
         if message.author.bot:
@@ -2239,21 +1956,11 @@ class LoggingCog(CogUI):
             )
         )
 
-        try:
-            await channel_send.send(embed=embed)
-        except (HTTPException, Forbidden, TypeError, ValueError, AttributeError):
-            pass
+        self.dispatcher.send(channel_send, embed)
 
     @CogUI.listener()
     async def on_message_edit(self, before: Message, after: Message) -> None:
-        try:
-            settings: Record = await self.bot.databases.settings.get_logs_settings(guild=before.guild)
-            channel_send: TextChannel | None = before.guild.get_channel(settings[4])
-        except Exception as e:
-            _ = e
-            return None
-
-        if channel_send is None:
+        if not (channel_send := self.dispatcher.get_channel(before.guild, LogsCategory.MESSAGES)):
             return
 
         if before.author.bot:
@@ -2287,21 +1994,11 @@ class LoggingCog(CogUI):
                 values=(before.content, after.content)
             )
 
-        try:
-            await channel_send.send(embed=embed)
-        except (HTTPException, Forbidden, TypeError, ValueError, AttributeError):
-            pass
+        self.dispatcher.send(channel_send, embed)
 
     @CogUI.listener()
     async def on_reaction_add(self, reaction: Reaction, user: Member | User) -> None:
-        try:
-            settings: Record = await self.bot.databases.settings.get_logs_settings(guild=reaction.message.guild)
-            channel_send: TextChannel | None = reaction.message.guild.get_channel(settings[4])
-        except Exception as e:
-            _ = e
-            return None
-
-        if channel_send is None:
+        if not (channel_send := self.dispatcher.get_channel(reaction.message.guild, LogsCategory.MESSAGES)):
             return
 
         embed: EmbedUI = EmbedUI(
@@ -2320,21 +2017,11 @@ class LoggingCog(CogUI):
             )
         )
 
-        try:
-            await channel_send.send(embed=embed)
-        except (HTTPException, Forbidden, TypeError, ValueError, AttributeError):
-            pass
+        self.dispatcher.send(channel_send, embed)
 
     @CogUI.listener()
     async def on_reaction_remove(self, reaction: Reaction, user: Member | User) -> None:
-        try:
-            settings: Record = await self.bot.databases.settings.get_logs_settings(guild=reaction.message.guild)
-            channel_send: TextChannel | None = reaction.message.guild.get_channel(settings[4])
-        except Exception as e:
-            _ = e
-            return None
-
-        if channel_send is None:
+        if not (channel_send := self.dispatcher.get_channel(reaction.message.guild, LogsCategory.MESSAGES)):
             return
 
         embed: EmbedUI = EmbedUI(
@@ -2353,21 +2040,11 @@ class LoggingCog(CogUI):
             )
         )
 
-        try:
-            await channel_send.send(embed=embed)
-        except (HTTPException, Forbidden, TypeError, ValueError, AttributeError):
-            pass
+        self.dispatcher.send(channel_send, embed)
 
     @CogUI.listener()
     async def on_thread_create(self, thread: Thread) -> None:
-        try:
-            settings: Record = await self.bot.databases.settings.get_logs_settings(guild=thread.guild)
-            channel_send: TextChannel | None = thread.guild.get_channel(settings[2])
-        except Exception as e:
-            _ = e
-            return None
-
-        if channel_send is None:
+        if not (channel_send := self.dispatcher.get_channel(thread.guild, LogsCategory.CHANNELS)):
             return
 
         embed: EmbedUI = EmbedUI(
@@ -2386,27 +2063,14 @@ class LoggingCog(CogUI):
             )
         )
 
-        try:
-            await channel_send.send(embed=embed)
-        except (HTTPException, Forbidden, TypeError, ValueError, AttributeError):
-            pass
+        self.dispatcher.send(channel_send, embed)
 
     @CogUI.listener()
     async def on_thread_delete(self, thread: Thread) -> None:
-        try:
-            settings: Record = await self.bot.databases.settings.get_logs_settings(guild=thread.guild)
-            channel_send: TextChannel | None = thread.guild.get_channel(settings[2])
-        except Exception as e:
-            _ = e
-            return None
-
-        if channel_send is None:
+        if not (channel_send := self.dispatcher.get_channel(thread.guild, LogsCategory.CHANNELS)):
             return
 
-        deleter: list[AuditLogEntry] = await channel_send.guild.audit_logs(
-            limit=1,
-            action=AuditLogAction.thread_delete
-        ).flatten()
+        deleter: list[AuditLogEntry] = await self.audit.fetch(channel_send.guild, AuditLogAction.thread_delete)
 
         embed: EmbedUI = EmbedUI(
             title=_t.get(key="logging.on_thread.title", locale=thread.guild.preferred_locale),
@@ -2424,21 +2088,11 @@ class LoggingCog(CogUI):
             )
         )
 
-        try:
-            await channel_send.send(embed=embed)
-        except (HTTPException, Forbidden, TypeError, ValueError, AttributeError):
-            pass
+        self.dispatcher.send(channel_send, embed)
 
     @CogUI.listener()
     async def on_thread_member_join(self, member: ThreadMember) -> None:
-        try:
-            settings: Record = await self.bot.databases.settings.get_logs_settings(guild=member.thread.guild)
-            channel_send: TextChannel | None = member.thread.guild.get_channel(settings[3])
-        except Exception as e:
-            _ = e
-            return None
-
-        if channel_send is None:
+        if not (channel_send := self.dispatcher.get_channel(member.thread.guild, LogsCategory.MEMBERS)):
             return
 
         _member: Member = member.thread.guild.get_member(member.id)
@@ -2459,21 +2113,11 @@ class LoggingCog(CogUI):
             )
         )
 
-        try:
-            await channel_send.send(embed=embed)
-        except (HTTPException, Forbidden, TypeError, ValueError, AttributeError):
-            pass
+        self.dispatcher.send(channel_send, embed)
 
     @CogUI.listener()
     async def on_thread_member_remove(self, member: ThreadMember) -> None:
-        try:
-            settings: Record = await self.bot.databases.settings.get_logs_settings(guild=member.thread.guild)
-            channel_send: TextChannel | None = member.thread.guild.get_channel(settings[3])
-        except Exception as e:
-            _ = e
-            return None
-
-        if channel_send is None:
+        if not (channel_send := self.dispatcher.get_channel(member.thread.guild, LogsCategory.MEMBERS)):
             return
 
         _member: Member = member.thread.guild.get_member(member.id)
@@ -2494,27 +2138,14 @@ class LoggingCog(CogUI):
             )
         )
 
-        try:
-            await channel_send.send(embed=embed)
-        except (HTTPException, Forbidden, TypeError, ValueError, AttributeError):
-            pass
+        self.dispatcher.send(channel_send, embed)
 
     @CogUI.listener()
     async def on_thread_update(self, before: Thread, after: Thread) -> None:
-        try:
-            settings: Record = await self.bot.databases.settings.get_logs_settings(guild=before.guild)
-            channel_send: TextChannel | None = before.guild.get_channel(settings[2])
-        except Exception as e:
-            _ = e
-            return None
-
-        if channel_send is None:
+        if not (channel_send := self.dispatcher.get_channel(before.guild, LogsCategory.CHANNELS)):
             return
 
-        updater: list[AuditLogEntry] = await channel_send.guild.audit_logs(
-            limit=1,
-            action=AuditLogAction.thread_delete
-        ).flatten()
+        updater: list[AuditLogEntry] = await self.audit.fetch(channel_send.guild, AuditLogAction.thread_delete)
 
         embed: EmbedUI = EmbedUI(
             title=_t.get(key="logging.on_thread.title", locale=before.guild.preferred_locale),
@@ -2546,21 +2177,11 @@ class LoggingCog(CogUI):
                 values=(before.locked, after.locked)
             )
 
-        try:
-            await channel_send.send(embed=embed)
-        except (HTTPException, Forbidden, TypeError, ValueError, AttributeError):
-            pass
+        self.dispatcher.send(channel_send, embed)
 
     @CogUI.listener()
     async def on_voice_state_update(self, member: Member, before: VoiceState, after: VoiceState) -> None:
-        try:
-            settings: Record = await self.bot.databases.settings.get_logs_settings(guild=member.guild)
-            channel_send: TextChannel | None = member.guild.get_channel(settings[3])
-        except Exception as e:
-            _ = e
-            return None
-
-        if channel_send is None:
+        if not (channel_send := self.dispatcher.get_channel(member.guild, LogsCategory.MEMBERS)):
             return
 
         embed: EmbedUI = EmbedUI(
@@ -2623,10 +2244,7 @@ class LoggingCog(CogUI):
                     values=(before.channel.mention, before.channel.name, not_ind)
                 )
 
-        try:
-            await channel_send.send(embed=embed)
-        except (HTTPException, Forbidden, TypeError, ValueError, AttributeError):
-            pass
+        self.dispatcher.send(channel_send, embed)
 
 
 def setup(bot: 'ChisatoBot') -> None:
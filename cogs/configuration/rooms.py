@@ -1,3 +1,4 @@
+import asyncio
 import random
 
 from disnake import (
@@ -87,7 +88,7 @@ class ConfigureModal(ui.Modal):
     @room_leader_check
     async def callback(self, interaction: ModalInteraction) -> None:
         values = await self.bot.databases.rooms.temp_room_values(guild=interaction.guild.id, user=interaction.author.id)
-        voice = interaction.guild.get_channel(values[1])
+        voice = interaction.guild.get_channel(values.voice_id)
         result = await self.bot.databases.rooms.room_req_check(guild=interaction.guild.id, voice=voice.id)
 
         if self.arg == "edit":
@@ -194,7 +195,7 @@ class ConfigureSelectUser(ui.UserSelect):
         values = await self.bot.databases.rooms.temp_room_values(
             guild=interaction.guild.id, user=interaction.author.id
         )
-        voice = interaction.guild.get_channel(values[1])
+        voice = interaction.guild.get_channel(values.voice_id)
         member = self.values[0]
 
         if self.arg == "mute":
@@ -377,7 +378,7 @@ class ConfigureSelectUser(ui.UserSelect):
                     await self.bot.databases.rooms.temp_room_values(
                         guild=interaction.guild.id, user=interaction.author.id
                     )
-                )[1]
+                ).voice_id
             )
 
             overs = voice.overwrites_for(member)
@@ -423,6 +424,9 @@ class RoomButtons(View):
 
         super().__init__(timeout=None, store=_t if not translate else translate, guild=guild)
 
+    async def interaction_check(self, interaction: MessageInteraction) -> bool:
+        return await self.bot.panels.validate(interaction)
+
     class Party(Snowflake):
         class Types:
             poker = 755827207812677713
@@ -488,7 +492,7 @@ class RoomButtons(View):
                 await self.bot.databases.rooms.temp_room_values(
                     guild=inter.guild.id, user=inter.author.id
                 )
-            )[1]
+            ).voice_id
         )
 
         await inter.response.send_message(
@@ -523,7 +527,7 @@ class RoomButtons(View):
     @room_leader_check
     async def close(self, _, inter: MessageInteraction) -> None:
         voice = inter.guild.get_channel(
-            (await self.bot.databases.rooms.temp_room_values(guild=inter.guild.id, user=inter.author.id))[1]
+            (await self.bot.databases.rooms.temp_room_values(guild=inter.guild.id, user=inter.author.id)).voice_id
         )
 
         if voice.overwrites_for(inter.guild.default_role).connect is False:
@@ -561,7 +565,7 @@ class RoomButtons(View):
     @room_leader_check
     async def vision(self, _, inter: MessageInteraction) -> None:
         voice = inter.guild.get_channel(
-            (await self.bot.databases.rooms.temp_room_values(guild=inter.guild.id, user=inter.author.id))[1]
+            (await self.bot.databases.rooms.temp_room_values(guild=inter.guild.id, user=inter.author.id)).voice_id
         )
 
         overs = voice.overwrites_for(inter.guild.default_role)
@@ -700,7 +704,7 @@ class RoomButtons(View):
                     "rooms.button.info.embed.description", locale=inter.guild_locale,
                     values=(
                         inter.author.voice.channel.mention,
-                        inter.guild.get_member(check[2]).mention,
+                        inter.guild.get_member(check.leader).mention,
                         len(inter.author.voice.channel.members),
                         utils.format_dt(inter.author.voice.channel.created_at, style="f"),
                         SUCCESS_EMOJI if def_perms.view_channel else ERROR_EMOJI,
@@ -719,10 +723,12 @@ class RoomButtons(View):
 
 class Rooms(CogUI):
     def __init__(self, bot: "ChisatoBot") -> None:
-        self.check_message_loop = 0
-
         super().__init__(bot=bot)
 
+        self.bot.panels.kind(
+            "rooms", lambda guild: RoomButtons(bot=self.bot, guild=guild), is_current=self._is_current_panel
+        )
+
     @loop(minutes=1)
     async def rooms_request_checking(self) -> None:
         if hasattr(self.bot.databases, 'rooms'):
@@ -730,18 +736,35 @@ class Rooms(CogUI):
                 for row in rows:
                     await self.bot.databases.rooms.room_req_remove(guild=row[0], voice=row[1])
 
-    @loop(seconds=30)
-    async def rooms_exception(self) -> None:
+    async def _remove_if_empty(self, guild: Guild, voice_id: int) -> bool:
+        voice = guild.get_channel(voice_id)
+        if voice and voice.members:
+            return False
+
+        await self.bot.databases.rooms.remove_room(guild=guild.id, voice=voice_id)
+        if voice:
+            try:
+                await voice.delete()
+            except (Forbidden, NotFound, HTTPException):
+                pass
+
+        return True
+
+    @loop(minutes=10)
+    async def rooms_reconcile(self) -> None:
+        """
+        Removes the rooms that were left empty while no voice event could be received,
+        going over the guilds that have temporary rooms only.
+        """
         if hasattr(self.bot.databases, 'rooms'):
-            for guild in self.bot.guilds:
-                if voices := await self.bot.databases.rooms.rooms_voice_channels_fetch(guild=guild.id):
-                    for vc in voices:
-                        try:
-                            if len((voice_obj := guild.get_channel(vc[1])).members) == 0:
-                                await voice_obj.delete()
-                                await self.bot.databases.rooms.remove_room(guild=guild.id, voice=vc[1])
-                        except (Forbidden, NotFound, HTTPException, AttributeError):
-                            await self.bot.databases.rooms.remove_room(guild=guild.id, voice=vc[1])
+            await self.bot.databases.rooms.load()
+
+            for guild_id in self.bot.databases.rooms.guilds_with_rooms():
+                if not (guild := self.bot.get_guild(guild_id)):
+                    continue
+
+                for room in self.bot.databases.rooms.rooms_of(guild_id):
+                    await self._remove_if_empty(guild, room.voice_id)
 
     @CogUI.listener()
     async def on_voice_state_update(self, member: Member, before: VoiceState, after: VoiceState) -> None:
@@ -754,141 +777,107 @@ class Rooms(CogUI):
             elif after.self_deaf or after.self_mute or after.self_video or after.self_stream:
                 return
 
-        if check := await self.bot.databases.rooms.room_check_find(guild=member.guild.id):
-            if (
-                    before.channel
-                    and before.channel.id != check[2]
-                    and len(before.channel.members) == 0
-                    and await self.bot.databases.rooms.temp_room_values_with_channel(
-                guild=member.guild.id, channel=before.channel.id
-            )
-            ):
-                await self.bot.databases.rooms.remove_room(guild=before.channel.guild.id, voice=before.channel.id)
-                try:
-                    await before.channel.delete()
-                except NotFound:
-                    pass
+        if (
+                before.channel
+                and before.channel != after.channel
+                and (room := await self.bot.databases.rooms.temp_room_values_with_channel(
+                    guild=member.guild.id, channel=before.channel.id
+                ))
+                and not await self._remove_if_empty(member.guild, before.channel.id)
+                and room.leader == member.id
+        ):
+            user = random.choice(before.channel.members)
 
-            if after.channel and after.channel.id == check[2]:
-                overwrites = {
-                    member: PermissionOverwrite(manage_channels=True)
-                }
+            await self.bot.databases.rooms.room_update_leader(
+                guild=member.guild.id, voice=before.channel.id, new_leader=user.id
+            )
+            await before.channel.edit(overwrites={user: PermissionOverwrite(manage_channels=True)})
 
-                if result := await self.bot.databases.rooms.settings_values(guild=member.guild.id, user=member.id):
-                    private_channel = await member.guild.create_voice_channel(
-                        name=result[2] if result[2] else f"{random.choice(emojis)} {member.name}",
-                        category=after.channel.category, user_limit=result[3], overwrites=overwrites
-                    )
-                else:
-                    private_channel = await member.guild.create_voice_channel(
-                        name=f"{random.choice(emojis)} {member.name}", category=after.channel.category,
-                        overwrites=overwrites, user_limit=2
+            await before.channel.send(
+                embed=EmbedUI(
+                    title=_t.get("rooms.callback.title", locale=member.guild.preferred_locale),
+                    description=_t.get(
+                        "rooms.on_voice.embed.description",
+                        locale=member.guild.preferred_locale, values=(user.mention, user,)
                     )
+                )
+            )
 
-                await self.bot.databases.rooms.create_room(guild=member.guild.id, voice=private_channel.id, user=member)
+        if not after.channel or not (hub := await self.bot.databases.rooms.get_hub(guild=member.guild.id)):
+            return
 
-                try:
-                    await member.move_to(private_channel)
-                except errors.HTTPException:
-                    pass
+        if after.channel.id == hub.founder:
+            overwrites = {
+                member: PermissionOverwrite(manage_channels=True)
+            }
 
-            if after.channel and after.channel.id == check[5]:
-                if marry_data := await self.bot.databases.economy.get_marry_solo(
-                        guild=member.guild, member=member
-                ):
-                    overwrites = {}
-                    if user1 := member.guild.get_member(marry_data[2]):
-                        overwrites[user1] = PermissionOverwrite(connect=True, view_channel=True)
-
-                    if user2 := member.guild.get_member(marry_data[3]):
-                        overwrites[user2] = PermissionOverwrite(connect=True, view_channel=True)
-
-                    overwrites[member.guild.default_role] = PermissionOverwrite(connect=False, view_channel=False)
-                    private_channel = await member.guild.create_voice_channel(
-                        name=f"{user1} 💘 {user2}", category=after.channel.category,
-                        overwrites=overwrites,
-                        user_limit=2
-                    )
+            if result := await self.bot.databases.rooms.settings_values(guild=member.guild.id, user=member.id):
+                private_channel = await member.guild.create_voice_channel(
+                    name=result[2] if result[2] else f"{random.choice(emojis)} {member.name}",
+                    category=after.channel.category, user_limit=result[3], overwrites=overwrites
+                )
+            else:
+                private_channel = await member.guild.create_voice_channel(
+                    name=f"{random.choice(emojis)} {member.name}", category=after.channel.category,
+                    overwrites=overwrites, user_limit=2
+                )
 
-                    await self.bot.databases.rooms.create_love_room(
-                        guild=member.guild.id, voice=private_channel.id, user=member
-                    )
+            await self.bot.databases.rooms.create_room(guild=member.guild.id, voice=private_channel.id, user=member)
 
-                    try:
-                        await member.move_to(private_channel)
-                    except errors.HTTPException:
-                        pass
-                else:
-                    await member.edit(voice_channel=None)
+            try:
+                await member.move_to(private_channel)
+            except errors.HTTPException:
+                pass
 
-            if before.channel:
-                if not (
-                        result := await self.bot.databases.rooms.temp_room_values(
-                            guild=member.guild.id, user=member.id
-                        )
-                ):
-                    return
+        elif after.channel.id == hub.love_room:
+            if marry_data := await self.bot.databases.economy.get_marry_solo(
+                    guild=member.guild, member=member
+            ):
+                overwrites = {}
+                if user1 := member.guild.get_member(marry_data[2]):
+                    overwrites[user1] = PermissionOverwrite(connect=True, view_channel=True)
+
+                if user2 := member.guild.get_member(marry_data[3]):
+                    overwrites[user2] = PermissionOverwrite(connect=True, view_channel=True)
+
+                overwrites[member.guild.default_role] = PermissionOverwrite(connect=False, view_channel=False)
+                private_channel = await member.guild.create_voice_channel(
+                    name=f"{user1} 💘 {user2}", category=after.channel.category,
+                    overwrites=overwrites,
+                    user_limit=2
+                )
 
-                if (
-                        result[2] == member.id
-                        and len(before.channel.members) != 0
-                        and await self.bot.databases.rooms.temp_room_values_with_channel(
-                    guild=member.guild.id, channel=before.channel.id
+                await self.bot.databases.rooms.create_love_room(
+                    guild=member.guild.id, voice=private_channel.id, user=member
                 )
-                ):
-                    user = random.choice(before.channel.members)
 
-                    await self.bot.databases.rooms.room_update_leader(
-                        guild=member.guild.id, voice=before.channel.id, new_leader=user.id
-                    )
-                    await before.channel.edit(overwrites={user: PermissionOverwrite(manage_channels=True)})
+                try:
+                    await member.move_to(private_channel)
+                except errors.HTTPException:
+                    pass
+            else:
+                await member.edit(voice_channel=None)
 
-                    await before.channel.send(
-                        embed=EmbedUI(
-                            title=_t.get("rooms.callback.title", locale=member.guild.preferred_locale),
-                            description=_t.get(
-                                "rooms.on_voice.embed.description",
-                                locale=member.guild.preferred_locale, values=(user.mention, user,)
-                            )
-                        )
-                    )
+    async def _is_current_panel(self, guild: int, message_id: int) -> bool:
+        hub = await self.bot.databases.rooms.get_hub(guild=guild)
+        return bool(hub and hub.message_id == message_id)
 
-    @loop(minutes=1)
-    async def check_message(self) -> None:
-        if self.check_message_loop > 7:
-            return self.check_message.cancel()
+    async def register_panels(self) -> None:
+        await self.bot.wait_until_ready()
 
         if hasattr(self.bot.databases, 'rooms'):
-            if rows := await self.bot.databases.rooms.get_all_settings():
-                for row in rows:
-                    if guild_obj := self.bot.get_guild(row[0]):
-                        try:
-                            channel = await guild_obj.fetch_channel(row[4])
-                            await channel.fetch_message(row[3])
-                        except NotFound:
-                            pass
-                        except Forbidden:
-                            pass
-                        except HTTPException:
-                            pass
-                        else:
-                            self.bot.add_view(
-                                RoomButtons(bot=self.bot, guild=guild_obj), message_id=row[3]
-                            )
-
-        self.check_message_loop += 1
+            self.bot.panels.add_many("rooms", await self.bot.databases.rooms.panels())
 
     def cog_unload(self) -> None:
         self.rooms_request_checking.cancel()
-        self.rooms_exception.cancel()
-        self.check_message.cancel()
+        self.rooms_reconcile.cancel()
 
     async def cog_load(self) -> None:
         await self.bot.wait_until_first_connect()
 
-        self.check_message.start()
+        asyncio.create_task(self.register_panels())
         self.rooms_request_checking.start()
-        self.rooms_exception.start()
+        self.rooms_reconcile.start()
 
 
 def setup(bot: ChisatoBot) -> None:
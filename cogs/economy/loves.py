@@ -531,7 +531,7 @@ class Love(CogUI):
         )
     )
     async def profile(self, interaction: ApplicationCommandInteraction) -> None:
-        if not await DrawService(self.bot.session).get_status():
+        if not DrawService.health.available:
             return await interaction.response.send_message(
                 embed=EmbedErrorUI(
                     description=_t.get("eco.error.api_error", locale=interaction.guild_locale),
@@ -46,7 +46,7 @@ from utils.handlers.economy import (
     pet_stats_info,
     check_in_game
 )
-from utils.handlers.economy.pets.handlers import OwnerAlertManager
+from utils.handlers.economy.pets.handlers import OwnerAlertManager, AlertKind
 from utils.handlers.economy.pets.views import PetFightView
 from utils.i18n import ChisatoLocalStore
 
@@ -432,83 +432,32 @@ class PetsTasks(CogUI):
     async def cog_load(self) -> None:
         await self.bot.wait_until_first_connect()
 
+        self.owner_alert.start()
         self.pet_relaxing.start()
         self.pet_mana_reduction.start()
 
     def cog_unload(self) -> None:
         self.pet_relaxing.cancel()
         self.pet_mana_reduction.cancel()
-
-    async def tasks_backend(
-            self,
-            pets: list[Pet],
-            **pet_args
-    ) -> None:
-        for pet in pets:
-            member = None
-            if guild := self.bot.get_guild(pet.guild_id):
-                member = guild.get_member(pet.owner_id)
-
-            try:
-                await self.bot.databases.pets.pet_stats_update(
-                    member=pet.owner_id,
-                    guild=pet.guild_id,
-                    pet_type=pet.name,
-                    up_lvl=False,
-                    **pet_args
-                )
-
-            except PetLowStat:
-                if member and guild:
-                    await self.owner_alert.pet_owner_alert_low_stat(
-                        member=member,
-                        guild=guild
-                    )
-
-            except PetReachedMaxLvl:
-                if member and guild:
-                    await self.owner_alert.pet_owner_alert_reached_max_lvl(
-                        member=member,
-                        guild=guild
-                    )
-
-            except PetStatsZero:
-                if member and guild:
-                    await self.owner_alert.pet_owner_alert_died(
-                        member=member,
-                        guild=guild
-                    )
-
-            except Exception as e:
-                _ = e
+        self.owner_alert.stop()
 
     @tasks.loop(seconds=20)
     async def pet_relaxing(self) -> None:
         if not hasattr(self.bot.databases, 'pets'):
             return
 
-        if not (pets := await self.bot.databases.pets.select_all_pets()):
-            return
-
-        asyncio.create_task(self.tasks_backend(
-            pets=pets,
-            stamina=random.randint(1, 5),
-            up=True
-        ))
+        await self.bot.databases.pets.pets_stamina_tick(stamina=random.randint(1, 5))
 
     @tasks.loop(hours=3)
     async def pet_mana_reduction(self) -> None:
         if not hasattr(self.bot.databases, 'pets'):
             return
 
-        if not (pets := await self.bot.databases.pets.select_all_pets()):
-            return
-
-        asyncio.create_task(self.tasks_backend(
-            pets=pets,
-            mana=random.randint(1, 3),
-            up=False
-        ))
+        for pet in await self.bot.databases.pets.pets_mana_tick(mana=random.randint(1, 3)):
+            self.owner_alert.enqueue(
+                AlertKind.DIED if pet["died"] else AlertKind.LOW_STAT,
+                pet["guild_id"], pet["user_id"]
+            )
 
 
 def setup(bot: ChisatoBot) -> None:
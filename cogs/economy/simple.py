@@ -1,4 +1,3 @@
-from functools import partial
 from typing import Any
 
 from disnake import Localized, ApplicationCommandInteraction, Member, AppCommandInteraction
@@ -10,8 +9,7 @@ from utils.consts import REGULAR_CURRENCY
 from utils.dataclasses import Pet
 from utils.exceptions import NotEnoughMoney, DoesntHavePet
 from utils.handlers.economy import check_is_on, check_in_fight, check_in_game
-from utils.handlers.economy.views import ShopView
-from utils.handlers.pagination import PaginatorView
+from utils.handlers.economy.views import ShopView, TransactionsPaginator
 from utils.i18n import ChisatoLocalStore
 
 _t = ChisatoLocalStore.load(__file__)
@@ -38,13 +36,9 @@ class SimpleEconomy(CogUI):
             self, interaction: AppCommandInteraction
     ) -> None:
         await interaction.response.defer(ephemeral=True)
-        description = _t.get("simple.transactions.history.part", locale=interaction.guild_locale)
 
-        transactions_data = await self.bot.databases.transactions.get_all(
-            guild=interaction.guild.id, user=interaction.author.id
-        )
-
-        if not transactions_data:
+        view, embed = await TransactionsPaginator.generate(interaction)
+        if not view:
             return await interaction.followup.send(
                 embed=EmbedErrorUI(
                     description=_t.get(
@@ -55,37 +49,7 @@ class SimpleEconomy(CogUI):
                 )
             )
 
-        def format_transaction(*args) -> str:
-            return description.format(
-                args[0][0] + 1,
-                _t.get(args[0][1][3], locale=interaction.guild_locale),
-                IntFormatter(args[0][1][2]).format_number(),
-                REGULAR_CURRENCY,
-                _t.get(args[0][1][4], locale=interaction.guild_locale)
-            )
-
-        formatted_transactions = list(
-            map(partial(format_transaction), enumerate(transactions_data))
-        )
-
-        embeds = [
-            EmbedUI(
-                title=_t.get("simple.transactions.title", locale=interaction.guild_locale),
-                description="\n".join(formatted_transactions[i:i + 10])
-            )
-            for i in range(0, len(formatted_transactions), 10)
-        ]
-
-        await interaction.followup.send(
-            embed=embeds[0],
-            view=PaginatorView(
-                author=interaction.author,
-                embeds=embeds,
-                footer=True,
-                delete_button=True,
-                interaction=interaction
-            )
-        )
+        await interaction.followup.send(embed=embed, view=view)
 
     @_e.sub_command(
         name='profile',
@@ -107,7 +71,7 @@ class SimpleEconomy(CogUI):
             )
 
     ) -> None:
-        if not await DrawService(self.bot.session).get_status():
+        if not DrawService.health.available:
             return await interaction.response.send_message(
                 embed=EmbedErrorUI(
                     description=_t.get(
@@ -216,16 +180,8 @@ class SimpleEconomy(CogUI):
                 member=interaction.author.id,
                 member_pay=member.id,
                 guild=interaction.guild.id,
-                amount=money_count
-            )
-            await self.bot.databases.transactions.add(
-                guild=interaction.guild.id, user=interaction.author.id, amount=money_count,
-                locale_key="simple.transfer.transaction.outgoing", typing=False
-            )
-
-            await self.bot.databases.transactions.add(
-                guild=interaction.guild.id, user=member.id, amount=money_count,
-                locale_key="simple.transfer.transaction.incoming", typing=True
+                amount=money_count,
+                locale_keys=("simple.transfer.transaction.outgoing", "simple.transfer.transaction.incoming")
             )
 
             await interaction.followup.send(
@@ -98,7 +98,7 @@ class Cards(CogUI):
         if not self.bot.databases:
             return
 
-        if not await DrawService(self.bot.session).get_status():
+        if not DrawService.health.available:
             return await interaction.send(
                 embed=EmbedErrorUI(
                     description=_t.get(
@@ -138,7 +138,7 @@ class Cards(CogUI):
             self, select: ui.Select,
             interaction: ApplicationCommandInteraction | MessageInteraction
     ) -> None:
-        if not await DrawService(self._bot.session).get_status():
+        if not DrawService.health.available:
             return await interaction.response.send_message(
                 embed=EmbedErrorUI(
                     description=_t.get(
@@ -43,7 +43,7 @@ class Levels(CogUI):
                 default=lambda x: x.author
             )
     ) -> None:
-        if not await DrawService(self.bot.session).get_status():
+        if not DrawService.health.available:
             return await interaction.response.send_message(
                 embed=EmbedErrorUI(
                     description=_t.get(
@@ -38,7 +38,7 @@ from utils.handlers.entertainment.music.decorators import (
 )
 from utils.handlers.entertainment.music.enums import FromSourceEmoji
 from utils.handlers.entertainment.music.generators import PlayerEmbed
-from utils.handlers.entertainment.music.tools import ConvertTime, if_uri
+from utils.handlers.entertainment.music.tools import ConvertTime, if_uri, IdleScheduler, IdleReason
 from utils.handlers.entertainment.music.views import PlayerButtons, SelectTrackView
 from utils.handlers.entertainment.music.views.pagination import QueuePagination
 from utils.handlers.entertainment.music.views.playlists import Playlists
@@ -54,7 +54,7 @@ _t = ChisatoLocalStore.load(__file__)
 
 class Music(CogUI):
     def __init__(self, bot: ChisatoBot) -> None:
-        self._empty_voice_task: asyncio.Task | None = None
+        self.idle = IdleScheduler()
 
         super().__init__(bot)
 
@@ -79,6 +79,7 @@ class Music(CogUI):
         await self.setup_hook()
 
     def cog_unload(self) -> None:
+        self.idle.close()
         asyncio.create_task(Pool.close())
         for player in self.bot.voice_clients:
             player: Player
@@ -117,11 +118,10 @@ class Music(CogUI):
                 "karaoke_data": None,
             })
 
-            for member in payload.player.channel.members:
-                if not member.bot:
-                    await self.bot.databases.music.add_last_track(
-                        member=member, track=payload.track
-                    )
+            self.bot.databases.music.add_last_track(
+                members=[member for member in payload.player.channel.members if not member.bot],
+                track=payload.track
+            )
 
             if not payload.player.queue and not payload.player.auto_queue and not payload.player.current:
                 await self.player_exception(payload.player)
@@ -132,6 +132,9 @@ class Music(CogUI):
 
     @CogUI.listener("on_mystic_player_destroyed")
     async def on_mystic_player_destroyed(self, player: Player) -> None:
+        if player:
+            self.idle.cancel(player.guild.id)
+
         return await self.player_exception(player)
 
     @CogUI.listener("on_mystic_connection_lost")
@@ -141,30 +144,17 @@ class Music(CogUI):
                 await self.player_exception(player)
                 await player.disconnect()
 
-    @classmethod
-    async def _task_backend(cls, player: Player) -> None:
-        await asyncio.sleep(60)
-        await player.disconnect()
-
-    def empty_members_start(self, player: Player) -> None:
-        try:
-            self._empty_voice_task = asyncio.create_task(self._task_backend(player))
-        except (RuntimeError, RuntimeWarning):
-            pass
-
-    def empty_members_cancel(self) -> None:
-        try:
-            self._empty_voice_task.cancel()
-        except AttributeError:
-            pass
-
     @CogUI.listener("on_mystic_player_update")
     async def on_mystic_player_update(self, payload: PlayerUpdateEventPayload) -> None:
-        if payload.player:
-            if len(payload.player.channel.members) == 1:
-                return self.empty_members_start(payload.player)
+        if not (player := payload.player) or not player.channel:
+            return
 
-            self.empty_members_cancel()
+        if not any(not member.bot for member in player.channel.members):
+            self.idle.schedule(player, IdleReason.EMPTY)
+        elif player.paused:
+            self.idle.schedule(player, IdleReason.PAUSED)
+        else:
+            self.idle.cancel(player.guild.id)
 
     @CogUI.listener("on_mystic_websocket_closed")
     @CogUI.listener("on_mystic_inactive_player")
@@ -476,7 +466,7 @@ class Music(CogUI):
             if node.status == NodeStatus.CONNECTED:
                 players_total += node.player_count
 
-        await ctx.send(str(players_total))
+        await ctx.send(f"{players_total} ({self.idle.idle_count} idle)")
 
 
 def setup(bot: ChisatoBot) -> None:
@@ -10,6 +10,7 @@ from loguru import logger
 
 from utils.basic import CogUI, EmbedErrorUI, EmbedUI
 from utils.basic.services.database import Databases
+from utils.basic.services.database.handlers import Database
 from utils.consts import ERROR_EMOJI
 from utils.enviroment import env
 from utils.i18n import ChisatoLocalStore
@@ -49,6 +50,45 @@ class DatabaseController(CogUI):
 
         await ctx.send("Успешно")
 
+    @CogUI.context_command(name='database_journal', aliases=['dj'])
+    @is_owner()
+    async def database_journal(self, ctx: Context) -> None:
+        if not self.bot.databases:
+            return await ctx.send("База данных не подключена")
+
+        journal = self.bot.databases.journal
+        await ctx.send(
+            f"```В очереди: {len(journal)}\n"
+            f"Записано: {journal.queued}\n"
+            f"Повторено: {journal.replayed}\n"
+            f"Потеряно: {journal.dropped}```"
+        )
+
+    @CogUI.context_command(name='database_queries', aliases=['dq'])
+    @is_owner()
+    async def database_queries(self, ctx: Context, sort: str = "total", limit: int = 10) -> None:
+        if sort not in ("total", "count", "errors", "p99"):
+            return await ctx.send("Сортировка: `total`, `count`, `errors` или `p99`")
+
+        metrics = Database.metrics
+        lines = [
+            f"{stats.count:>7} | {stats.errors:>4} | {stats.total:>8.2f}s | "
+            f"{stats.percentile(50) * 1000:>7.1f} | {stats.percentile(95) * 1000:>7.1f} | "
+            f"{stats.percentile(99) * 1000:>7.1f} | {stats.fingerprint[:60]}"
+            for stats in metrics.top(limit, key=sort)
+        ]
+        commands = sorted(metrics.commands.items(), key=lambda item: item[1].total, reverse=True)[:5]
+
+        content = (
+                "```  count | errs |    total |  p50 ms |  p95 ms |  p99 ms | query\n"
+                + "\n".join(lines) + "```"
+                + "```Запросов на команду (среднее / максимум):\n"
+                + "\n".join(
+                    f"{name}: {stats.total / stats.invocations:.1f} / {stats.max}" for name, stats in commands
+                ) + "```"
+        )
+        await ctx.send(content[:2000])
+
     async def _check(self) -> bool:
         try:
             con = await self.bot.databases.pool.acquire()
@@ -7,6 +7,7 @@ from disnake.ext.tasks import loop
 from loguru import logger
 
 from utils.basic import CogUI
+from utils.basic.services.draw import DrawService
 from utils.enviroment import env
 
 if TYPE_CHECKING:
@@ -25,6 +26,8 @@ class Monitoring(CogUI):
 
     async def cog_load(self) -> None:
         await self.bot.wait_until_first_connect()
+        DrawService.health.start(self.bot)
+
         await asyncio.sleep(20)
 
         if self.bot.user.id == env.MAIN_ID:
@@ -35,6 +38,8 @@ class Monitoring(CogUI):
             self.sdc_post_loop.start()
 
     def cog_unload(self) -> None:
+        DrawService.health.stop()
+
         if self.bot.user.id == env.MAIN_ID:
             self.sdc_post_loop.cancel()
             try:
@@ -49,7 +49,7 @@ class EditProfile(CogUI):
     @loop(minutes=10)
     async def edit_profile_loop(self):
         try:
-            if await DrawService(self.bot.session).get_status():
+            if DrawService.health.available:
                 await self.change_my_banner()
         except HTTPException:
             logger.warning("Can't edit profile yet")
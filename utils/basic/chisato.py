@@ -27,7 +27,9 @@ from disnake.ext.commands import (
 )
 from loguru import logger
 
+from utils.basic.helpers.components.persistent import PersistentPanels
 from utils.basic.services.database import Databases
+from utils.basic.services.database.handlers import Database
 from utils.consts import ASCII_ART
 from utils.enviroment import env
 from utils.exceptions import DoesntHaveAgreedRole
@@ -49,6 +51,7 @@ class ChisatoBot(AutoShardedBot):
     def __init__(self, shard_count: int) -> None:
         self.databases: Databases | None = None
         self.webhooks = WebhookSender()
+        self.panels = PersistentPanels(self)
 
         self._session: ClientSession = ClientSession()
 
@@ -78,6 +81,9 @@ class ChisatoBot(AutoShardedBot):
         )
         self._add_to_cache(self)
 
+        self.before_slash_command_invoke(self._start_round_trips)
+        self.after_slash_command_invoke(self._finish_round_trips)
+
         self._set_logger_schema()
         logger.info(ASCII_ART)
 
@@ -85,6 +91,21 @@ class ChisatoBot(AutoShardedBot):
     def session(self) -> ClientSession:
         return self._session
 
+    @staticmethod
+    async def _start_round_trips(_: ApplicationCommandInteraction) -> None:
+        Database.metrics.start_interaction()
+
+    @staticmethod
+    async def _finish_round_trips(interaction: ApplicationCommandInteraction) -> None:
+        Database.metrics.finish_interaction(interaction.application_command.qualified_name)
+
+    async def close(self) -> None:
+        if self.databases:
+            await self.databases.flush()
+
+        await self.webhooks.close()
+        await super().close()
+
     @staticmethod
     def _set_logger_schema() -> None:
         split = " <fg #b1b2ff>|</fg #b1b2ff> "
@@ -1,5 +1,5 @@
 from .cog import CogUI
-from .components import View
+from .components import View, PersistentPanels
 from .embed import EmbedUI, EmbedErrorUI
 from .int_formats import IntFormatter
 from .permissions import CommandsPermission
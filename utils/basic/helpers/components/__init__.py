@@ -1 +1,2 @@
 from .view import View
+from .persistent import PersistentPanels
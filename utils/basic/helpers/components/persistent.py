@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from typing import Awaitable, Callable, Iterable, Optional, TYPE_CHECKING
+
+from disnake import Embed, Guild, MessageInteraction
+from disnake.ui import View
+from loguru import logger
+
+from utils.consts import ERROR_EMOJI
+from utils.enviroment import env
+from utils.i18n import ChisatoLocalStore
+
+if TYPE_CHECKING:
+    from utils.basic import ChisatoBot
+
+__all__ = (
+    "PersistentPanels",
+)
+
+_t = ChisatoLocalStore().load(__file__)
+
+PanelFactory = Callable[[Guild], View]
+PanelCheck = Callable[[int, int], Awaitable[bool]]
+
+
+class PersistentPanels:
+    def __init__(self, bot: ChisatoBot) -> None:
+        """
+        Registry of the panels, messages with a persistent view, that must keep working after a restart.
+
+        A cog declares a kind of panel once with the factory of its view, then registers the messages
+        of that kind straight from its database rows, without fetching them. A panel whose message is
+        gone, or that its kind no longer considers current, is dropped on its first failed interaction.
+
+        Args:
+            bot (ChisatoBot): The bot the views are added to.
+        """
+        self._bot = bot
+        self._kinds: dict[str, tuple[PanelFactory, Optional[PanelCheck]]] = {}
+        self._panels: dict[int, tuple[str, View]] = {}
+
+    def __len__(self) -> int:
+        return len(self._panels)
+
+    def __contains__(self, message_id: int) -> bool:
+        return message_id in self._panels
+
+    def kind(self, name: str, factory: PanelFactory, is_current: Optional[PanelCheck] = None) -> None:
+        """
+        Declares a kind of panel.
+
+        Args:
+            name (str): The name of the kind.
+            factory (PanelFactory): Builds the view of a panel for a guild.
+            is_current (Optional[PanelCheck]): Tells from the guild and message ids whether a panel is still in use.
+
+        Returns:
+            None
+        """
+        self._kinds[name] = (factory, is_current)
+
+    def add(self, name: str, guild: Guild, message_id: int) -> View:
+        """
+        Attaches a new view of the kind to a message, replacing the one it had.
+
+        Args:
+            name (str): The name of the kind.
+            guild (Guild): The guild of the message.
+            message_id (int): The ID of the message.
+
+        Returns:
+            View: The attached view.
+        """
+        self.prune(message_id)
+
+        view = self._kinds[name][0](guild)
+        self._bot.add_view(view, message_id=message_id)
+        self._panels[message_id] = (name, view)
+
+        return view
+
+    def add_many(self, name: str, rows: Iterable[tuple[int, Optional[int]]]) -> int:
+        """
+        Attaches views to the messages of the guilds the bot is in, in one pass.
+
+        Args:
+            name (str): The name of the kind.
+            rows (Iterable[tuple[int, Optional[int]]]): The guild and message ids of the panels.
+
+        Returns:
+            int: The number of attached views.
+        """
+        added = 0
+        for guild_id, message_id in rows:
+            if message_id and (guild := self._bot.get_guild(guild_id)):
+                self.add(name, guild, message_id)
+                added += 1
+
+        logger.info(f"Registered {added} persistent panels of {name}")
+        return added
+
+    def prune(self, message_id: int) -> bool:
+        """
+        Detaches the view of a message.
+
+        Args:
+            message_id (int): The ID of the message.
+
+        Returns:
+            bool: Whether the message had a view.
+        """
+        if (panel := self._panels.pop(message_id, None)) is None:
+            return False
+
+        # A stopped view is removed from the view store of the connection
+        panel[1].stop()
+        return True
+
+    async def validate(self, interaction: MessageInteraction) -> bool:
+        """
+        Checks that the panel of an interaction is still current, drops it and answers the member otherwise.
+
+        Args:
+            interaction (MessageInteraction): The interaction on the panel.
+
+        Returns:
+            bool: Whether the interaction can go on.
+        """
+        if (panel := self._panels.get(interaction.message.id)) is None:
+            return True
+
+        is_current = self._kinds[panel[0]][1]
+        if is_current is None or await is_current(interaction.guild.id, interaction.message.id):
+            return True
+
+        self.prune(interaction.message.id)
+        await interaction.response.send_message(
+            embed=Embed(
+                description=f"{ERROR_EMOJI} | "
+                            f"**{interaction.author.name}**, "
+                            f"{_t.get('panel_is_outdated', locale=interaction.guild_locale)}",
+                color=env.COLOR
+            ),
+            ephemeral=True
+        )
+        return False
@@ -7,7 +7,7 @@ from disnake import Guild
 from loguru import logger
 
 from utils.enviroment import env
-from .handlers import Database, ChisatoPool
+from .handlers import Database, ChisatoPool, ReplayJournal, QueryMetrics
 from .interactions.admin import AdminDB
 from .interactions.cards import CardsDB
 from .interactions.economy import EconomyDB
@@ -45,6 +45,9 @@ class Databases:
         "_last_check"
     )
 
+    # Services exposed next to the connections, they have no connection to reload
+    _NOT_RELOADED: tuple[str, ...] = ("journal", "metrics")
+
     def __init__(self, pool: ChisatoPool) -> None:
         self.pool = pool
 
@@ -69,6 +72,14 @@ class Databases:
 
         self._last_check = 0
 
+    @property
+    def journal(self) -> ReplayJournal:
+        return ReplayJournal.from_cache()
+
+    @property
+    def metrics(self) -> QueryMetrics:
+        return Database.metrics
+
     @classmethod
     async def create(cls, bot: ChisatoBot) -> None:
         """
@@ -89,7 +100,7 @@ class Databases:
         Reloads all the database connections.
         """
         for attr in dir(self):
-            if attr.startswith('_') or callable(getattr(self, attr)):
+            if attr.startswith('_') or attr in self._NOT_RELOADED or callable(getattr(self, attr)):
                 continue
 
             try:
@@ -97,6 +108,18 @@ class Databases:
             except Exception as e:
                 self._send_error_log(e)
 
+    async def flush(self) -> None:
+        """
+        Writes everything that is still buffered in memory to the database.
+        """
+        for flush in (
+                self.level.flush_exp, self.admin.flush_command_uses, self.music.flush_history, self.journal.replay
+        ):
+            try:
+                await flush()
+            except Exception as e:
+                self._send_error_log(e)
+
     async def check(self) -> bool | Exception:
         """
         Checks the health of the database connection.
@@ -117,6 +140,10 @@ class Databases:
         return False
 
     async def vipe_tables_from_guild(self, guild: Guild) -> None:
+        self.settings.invalidate(guild.id)
+        self.level.invalidate(guild.id)
+        self.rooms.invalidate(guild.id)
+
         async with self.pool.acquire() as c:
             for i in [
                 "economy_main",
@@ -125,6 +152,7 @@ class Databases:
                 "economy_pets",
                 "economy_shop",
                 "economy_transactions",
+                "economy_transactions_summary",
                 "levels_main",
                 "levels_prestige_rewards",
                 "moderation_global_bans",
@@ -1,2 +1,6 @@
+from .cache import TTLCache
+from .ensure_row import EnsureRow
+from .journal import ReplayJournal
+from .metrics import QueryMetrics
 from .pool import ChisatoPool
 from .postgresql import Database
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Hashable, Callable
+
+__all__ = (
+    "TTLCache",
+)
+
+
+class TTLCache:
+    __slots__ = (
+        "_data",
+        "_max_size",
+        "_ttl"
+    )
+
+    def __init__(self, max_size: int = 10000, ttl: float = 600.0) -> None:
+        """
+        A least recently used cache whose entries also expire after a fixed time.
+
+        Args:
+            max_size (int): The maximum number of entries, the least recently used are evicted first.
+            ttl (float): The lifetime of an entry in seconds.
+        """
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._max_size = max_size
+        self._ttl = ttl
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, self) is not self
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        if (entry := self._data.get(key)) is None:
+            return default
+
+        expires, value = entry
+        if expires < monotonic():
+            del self._data[key]
+            return default
+
+        self._data.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        self._data[key] = (monotonic() + self._ttl, value)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self._max_size:
+            self._data.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> None:
+        for key in [key for key in self._data if predicate(key)]:
+            del self._data[key]
+
+    def clear(self) -> None:
+        self._data.clear()
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from typing import Any, TYPE_CHECKING
+
+import asyncpg
+
+if TYPE_CHECKING:
+    from utils.basic.services.database.handlers.postgresql import Database
+
+__all__ = (
+    "EnsureRow",
+)
+
+
+class EnsureRow:
+    __slots__ = (
+        "_database",
+        "_defaults",
+        "_insert",
+        "_insert_plain",
+        "_fetch",
+        "_select"
+    )
+
+    def __init__(
+            self, database: Database, table: str, *keys: str,
+            defaults: dict[str, Any] | None = None
+    ) -> None:
+        """
+        Makes sure a row exists without any process-wide lock.
+
+        The row is inserted with `INSERT ... ON CONFLICT DO NOTHING` and returned
+        in the same round-trip, whether it was just created or already existed.
+        Until the migrations of the database are applied the table may have no key to
+        conflict on, so the row is looked up first and only inserted when it is missing.
+
+        Args:
+            database (Database): The database the queries are executed on.
+            table (str): The name of the table.
+            *keys (str): The columns identifying the row.
+            defaults (dict[str, Any] | None): Values for non-key columns of a new row.
+        """
+        self._database = database
+
+        defaults = defaults or {}
+        columns = [*keys, *defaults]
+        placeholders = ", ".join(f"${i}" for i in range(1, len(columns) + 1))
+        where = " AND ".join(f"{key} = ${i}" for i, key in enumerate(keys, start=1))
+
+        self._insert_plain = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+        self._insert = f"{self._insert_plain} ON CONFLICT DO NOTHING"
+        self._fetch = f"SELECT * FROM {table} WHERE {where}"
+        self._select = (
+            f"WITH inserted AS ({self._insert} RETURNING *) "
+            f"SELECT * FROM inserted UNION ALL {self._fetch} LIMIT 1"
+        )
+        self._defaults = tuple(defaults.values())
+
+    async def __call__(self, *keys: Any) -> asyncpg.Record | None:
+        """
+        Ensures the row exists and returns it.
+
+        Args:
+            *keys (Any): The values of the key columns.
+
+        Returns:
+            asyncpg.Record | None: The row, or None if the connection to the database is lost.
+        """
+        if not self._database.migrated:
+            if row := await self._database.fetchrow(self._fetch, *keys):
+                return row
+
+            await self._database.execute(self._insert_plain, *keys, *self._defaults)
+            return await self._database.fetchrow(self._fetch, *keys)
+
+        if row := await self._database.fetchrow(self._select, *keys, *self._defaults):
+            return row
+
+        # A concurrent insert committed after this statement took its snapshot
+        return await self._database.fetchrow(self._fetch, *keys)
+
+    async def many(self, rows: list[tuple[Any, ...]]) -> None:
+        """
+        Ensures several rows exist without returning them.
+
+        Args:
+            rows (list[tuple[Any, ...]]): The values of the key columns of every row.
+
+        Returns:
+            None
+        """
+        if not self._database.migrated:
+            for row in rows:
+                await self(*row)
+            return
+
+        await self._database.executemany(self._insert, [(*row, *self._defaults) for row in rows])
@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import pickle
+from collections import deque
+from pathlib import Path
+from typing import Any, NamedTuple, Optional, BinaryIO
+
+from asyncpg import PostgresError, DataError
+from disnake.ext.tasks import loop
+from loguru import logger
+
+from utils.basic.services.database.handlers.pool import ChisatoPool
+
+__all__ = (
+    "ReplayJournal",
+)
+
+
+class _Entry(NamedTuple):
+    seq: int
+    sql: str
+    args: tuple[Any, ...]
+    many: bool
+
+
+class ReplayJournal:
+    _instance: ReplayJournal | None = None
+
+    @classmethod
+    def from_cache(cls) -> ReplayJournal | None:
+        return cls._instance
+
+    def __init__(self, path: str, max_entries: int = 50000, batch_size: int = 500) -> None:
+        """
+        Ordered write-ahead journal of the writes that could not reach the database.
+
+        Every write is appended to a local file before it is acknowledged, so it survives a restart.
+        Once the pool is connected again the writes are replayed in their original order, up to
+        `batch_size` of them per transaction. When the journal is full the oldest writes are dropped.
+
+        Args:
+            path (str): The path of the journal file.
+            max_entries (int): The maximum number of pending writes.
+            batch_size (int): The maximum number of writes replayed in one transaction.
+        """
+        self._path = Path(path)
+        self._max_entries = max_entries
+        self._batch_size = batch_size
+
+        self._entries: deque[_Entry] = deque()
+        self._seq = 0
+        self._file: Optional[BinaryIO] = None
+        self._lock = asyncio.Lock()
+
+        self.queued = 0
+        self.replayed = 0
+        self.dropped = 0
+
+        self._load()
+        self._to_cache(self)
+        self._replay.start()
+
+    @classmethod
+    def _to_cache(cls, obj: ReplayJournal) -> None:
+        cls._instance = obj
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _load(self) -> None:
+        """
+        Restores the pending writes of the previous run and compacts the file.
+
+        Returns:
+            None
+        """
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+
+        entries: dict[int, _Entry] = {}
+        if self._path.exists():
+            with open(self._path, 'rb') as f:
+                while True:
+                    try:
+                        record = pickle.load(f)
+                    except EOFError:
+                        break
+                    except (pickle.UnpicklingError, ValueError, TypeError) as e:
+                        # A record cut in half by a crash, everything before it is still valid
+                        logger.warning(f"Database journal is truncated: {e}")
+                        break
+
+                    if record[0] == 'ack':
+                        entries = {seq: entry for seq, entry in entries.items() if seq > record[1]}
+                    else:
+                        entries[record[1].seq] = record[1]
+
+        self._entries.extend(sorted(entries.values()))
+        self._seq = self._entries[-1].seq if self._entries else 0
+        self._compact()
+
+        if self._entries:
+            logger.warning(f"Database journal restored {len(self._entries)} writes")
+
+    def _compact(self) -> None:
+        if self._file:
+            self._file.close()
+
+        self._file = open(self._path.with_suffix(".tmp"), 'wb')
+        for entry in self._entries:
+            self._write(('add', entry))
+
+        self._file.close()
+        os.replace(self._path.with_suffix(".tmp"), self._path)
+        self._file = open(self._path, 'ab')
+
+    def _write(self, record: tuple) -> None:
+        try:
+            data = pickle.dumps(record)
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            logger.warning(f"Database journal keeps a write in memory only: {e}")
+        else:
+            self._file.write(data)
+            self._file.flush()
+
+    def append(self, sql: str, args: tuple[Any, ...], many: bool = False) -> None:
+        """
+        Appends a write to the end of the journal.
+
+        Args:
+            sql (str): The SQL statement.
+            args (tuple[Any, ...]): The arguments of the statement.
+            many (bool): Whether the statement is executed with `executemany`.
+
+        Returns:
+            None
+        """
+        if len(self._entries) >= self._max_entries:
+            dropped = self._entries.popleft()
+            self.dropped += 1
+            self._write(('ack', dropped.seq))
+            logger.warning(f"Database journal is full, dropped: {dropped.sql[:64]}")
+
+        self._seq += 1
+        entry = _Entry(self._seq, sql, args, many)
+        self._entries.append(entry)
+        self._write(('add', entry))
+        self.queued += 1
+
+    async def replay(self) -> int:
+        """
+        Replays the pending writes in order, one transaction per batch.
+
+        A write rejected by the database is dropped, a lost connection stops the replay
+        and the remaining writes wait for the next attempt.
+
+        Returns:
+            int: The number of writes replayed.
+        """
+        async with self._lock:
+            return await self._replay_batches()
+
+    async def _replay_batches(self) -> int:
+        replayed = 0
+        while self._entries and (pool := ChisatoPool.from_cache()) and pool.connected:
+            batch = [self._entries[i] for i in range(min(self._batch_size, len(self._entries)))]
+            dropped = 0
+            try:
+                async with pool.acquire() as connection:
+                    async with connection.transaction():
+                        for entry in batch:
+                            try:
+                                async with connection.transaction():
+                                    if entry.many:
+                                        await connection.executemany(entry.sql, *entry.args)
+                                    else:
+                                        await connection.execute(entry.sql, *entry.args)
+                            except (PostgresError, DataError) as e:
+                                dropped += 1
+                                logger.error(f"Database journal dropped a write: {type(e).__name__}: {e}")
+            except Exception as e:
+                logger.warning(f"Database journal replay interrupted: {type(e).__name__}: {e}")
+                break
+
+            while self._entries and self._entries[0].seq <= batch[-1].seq:
+                self._entries.popleft()
+            self._write(('ack', batch[-1].seq))
+
+            self.dropped += dropped
+            self.replayed += len(batch) - dropped
+            replayed += len(batch) - dropped
+
+        if replayed:
+            logger.info(f"Database journal replayed {replayed} writes, {len(self._entries)} left")
+
+        if not self._entries and self._path.stat().st_size:
+            self._compact()
+
+        return replayed
+
+    @loop(seconds=5)
+    async def _replay(self) -> None:
+        if self._entries:
+            await self.replay()
+
+    async def close(self) -> None:
+        self._replay.cancel()
+        if self._entries:
+            await self.replay()
+
+        self._file.close()
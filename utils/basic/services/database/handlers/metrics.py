@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import re
+from bisect import bisect_left
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Optional
+
+from loguru import logger
+
+__all__ = (
+    "QueryMetrics",
+    "QueryStats",
+    "RoundTrips",
+)
+
+# Upper bounds of the latency buckets in seconds, from 0.1 ms to about 80 s in steps of 25 %
+_BUCKETS: tuple[float, ...] = tuple(0.0001 * 1.25 ** i for i in range(62))
+
+_STRINGS = re.compile(r"'(?:[^']|'')*'")
+_NUMBERS = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PARAMETERS = re.compile(r"\$\d+")
+_LISTS = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_SPACES = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=2048)
+def fingerprint(sql: str) -> str:
+    """
+    Normalizes a statement so that queries differing only in their values share one fingerprint.
+
+    Args:
+        sql (str): The SQL statement.
+
+    Returns:
+        str: The fingerprint of the statement.
+    """
+    sql = _STRINGS.sub("?", sql)
+    sql = _PARAMETERS.sub("?", sql)
+    sql = _NUMBERS.sub("?", sql)
+    sql = _LISTS.sub("(...)", sql)
+    return _SPACES.sub(" ", sql).strip().lower()
+
+
+@dataclass(slots=True)
+class QueryStats:
+    fingerprint: str
+    count: int = 0
+    errors: int = 0
+    total: float = 0.0
+    buckets: list[int] = field(default_factory=lambda: [0] * (len(_BUCKETS) + 1))
+
+    def record(self, elapsed: float, failed: bool) -> None:
+        self.count += 1
+        self.errors += failed
+        self.total += elapsed
+        self.buckets[bisect_left(_BUCKETS, elapsed)] += 1
+
+    def percentile(self, percent: float) -> float:
+        """
+        Estimates a latency percentile from the histogram.
+
+        Args:
+            percent (float): The percentile, from 0 to 100.
+
+        Returns:
+            float: The upper bound of the bucket holding the percentile, in seconds.
+        """
+        rank = self.count * percent / 100
+        seen = 0
+        for i, amount in enumerate(self.buckets):
+            seen += amount
+            if seen >= rank and amount:
+                return _BUCKETS[min(i, len(_BUCKETS) - 1)]
+
+        return 0.0
+
+
+@dataclass(slots=True)
+class RoundTrips:
+    invocations: int = 0
+    total: int = 0
+    max: int = 0
+
+    def record(self, round_trips: int) -> None:
+        self.invocations += 1
+        self.total += round_trips
+        self.max = max(self.max, round_trips)
+
+
+class QueryMetrics:
+    _current: ContextVar[Optional[list[int]]] = ContextVar("database_round_trips", default=None)
+
+    def __init__(self, slow_threshold: float = 0.25) -> None:
+        """
+        Statistics of every statement that goes through `Database`, grouped by fingerprint.
+
+        Args:
+            slow_threshold (float): Statements slower than this many seconds are logged.
+        """
+        self.slow_threshold = slow_threshold
+        self.queries: dict[str, QueryStats] = {}
+        self.commands: dict[str, RoundTrips] = {}
+
+    def record(self, sql: str, args: tuple[Any, ...], elapsed: float, failed: bool = False) -> None:
+        """
+        Records one executed statement.
+
+        Args:
+            sql (str): The SQL statement.
+            args (tuple[Any, ...]): The arguments, only their types are ever logged.
+            elapsed (float): The time the statement took, in seconds.
+            failed (bool): Whether the statement raised.
+
+        Returns:
+            None
+        """
+        key = fingerprint(sql)
+        if (stats := self.queries.get(key)) is None:
+            stats = self.queries[key] = QueryStats(key)
+        stats.record(elapsed, failed)
+
+        if (counter := self._current.get()) is not None:
+            counter[0] += 1
+
+        if elapsed >= self.slow_threshold:
+            logger.warning(
+                f"Slow query ({elapsed * 1000:.1f} ms): {key} "
+                f"args=({', '.join(type(arg).__name__ for arg in args)})"
+            )
+
+    def start_interaction(self) -> None:
+        """
+        Starts counting the round-trips of the current interaction.
+
+        Returns:
+            None
+        """
+        self._current.set([0])
+
+    def finish_interaction(self, command: str) -> None:
+        """
+        Stops counting the round-trips of the current interaction and records them for the command.
+
+        Args:
+            command (str): The qualified name of the command.
+
+        Returns:
+            None
+        """
+        if (counter := self._current.get()) is None:
+            return
+
+        self._current.set(None)
+        if (stats := self.commands.get(command)) is None:
+            stats = self.commands[command] = RoundTrips()
+        stats.record(counter[0])
+
+    def top(self, limit: int = 10, key: str = "total") -> list[QueryStats]:
+        """
+        Returns the most expensive fingerprints.
+
+        Args:
+            limit (int): The number of fingerprints.
+            key (str): The field to sort by: `total`, `count`, `errors` or `p99`.
+
+        Returns:
+            list[QueryStats]: The fingerprints, the most expensive first.
+        """
+        if key == "p99":
+            return sorted(self.queries.values(), key=lambda stats: stats.percentile(99), reverse=True)[:limit]
+
+        return sorted(self.queries.values(), key=lambda stats: getattr(stats, key), reverse=True)[:limit]
+
+    def reset(self) -> None:
+        self.queries.clear()
+        self.commands.clear()
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+if TYPE_CHECKING:
+    from utils.basic.services.database.handlers.pool import ChisatoPool
+
+__all__ = (
+    "Migrations",
+)
+
+
+class Migrations:
+    __slots__ = (
+        "_pool",
+        "_cluster"
+    )
+
+    _FOLDER: Path = Path('./utils/basic/services/database/scripts/migrations')
+
+    def __init__(self, pool: ChisatoPool, cluster: str) -> None:
+        """
+        Applies the versioned migration scripts of a cluster.
+
+        Scripts live in `scripts/migrations/<cluster>/` and are named `<version>_<description>.sql`,
+        every script is applied once, in version order, inside its own transaction.
+
+        Args:
+            pool (ChisatoPool): The database connection pool.
+            cluster (str): The name of the cluster to migrate.
+        """
+        self._pool = pool
+        self._cluster = cluster
+
+    def _scripts(self) -> list[tuple[int, Path]]:
+        """
+        Collects the migration scripts of the cluster.
+
+        Returns:
+            list[tuple[int, Path]]: The version and path of every script, sorted by version.
+        """
+        if not (folder := self._FOLDER / self._cluster).is_dir():
+            return []
+
+        return sorted(
+            (int(path.stem.split('_', 1)[0]), path)
+            for path in folder.glob('*.sql')
+        )
+
+    async def apply(self) -> int:
+        """
+        Applies every script that is newer than the recorded schema version of the cluster.
+
+        Returns:
+            int: The schema version of the cluster after applying.
+        """
+        version = 0
+        for script_version, path in self._scripts():
+            async with self._pool.acquire() as connection:
+                async with connection.transaction():
+                    await connection.execute("SELECT pg_advisory_xact_lock(hashtext('schema_migrations'))")
+                    await connection.execute(
+                        """
+                        CREATE TABLE IF NOT EXISTS schema_migrations
+                        (
+                            cluster    VARCHAR(64),
+                            version    INTEGER,
+                            applied_at TIMESTAMPTZ DEFAULT NOW(),
+                            PRIMARY KEY (cluster, version)
+                        )
+                        """
+                    )
+                    version = await connection.fetchval(
+                        "SELECT COALESCE(MAX(version), 0) FROM schema_migrations WHERE cluster=$1",
+                        self._cluster
+                    )
+                    if script_version <= version:
+                        continue
+
+                    await connection.execute(path.read_text(encoding='utf-8'))
+                    await connection.execute(
+                        "INSERT INTO schema_migrations(cluster, version) VALUES ($1, $2)",
+                        self._cluster, script_version
+                    )
+
+            version = script_version
+            logger.info(f"Cluster {self._cluster} migrated to version {version} ({path.stem})")
+
+        return version
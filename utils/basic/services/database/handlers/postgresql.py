@@ -1,17 +1,23 @@
 import asyncio
 from pathlib import Path
-from typing import Any
+from time import perf_counter
+from typing import Any, Callable, Awaitable
 
 import aiofiles
 import asyncpg
 from asyncpg.exceptions import ConnectionDoesNotExistError
-from disnake.ext.tasks import loop
 from loguru import logger
 
+from utils.basic.services.database.handlers.journal import ReplayJournal
+from utils.basic.services.database.handlers.metrics import QueryMetrics
+from utils.basic.services.database.handlers.migrations import Migrations
 from utils.basic.services.database.handlers.pool import ChisatoPool
+from utils.enviroment import env
 
 
 class Database:
+    metrics: QueryMetrics = QueryMetrics(slow_threshold=env.SLOW_QUERY_MS / 1000)
+
     def __init__(
             self, pool: ChisatoPool
     ) -> None:
@@ -22,53 +28,16 @@ class Database:
             pool (ChisatoPool): The database connection pool.
         """
         self._pool = pool
-        self._lost_queries: dict[str, Any] = {}
+        self._journal = ReplayJournal.from_cache()
+        if self._journal is None:
+            self._journal = ReplayJournal(env.DATABASE_JOURNAL)
+
+        # Whether the migrations of the cluster are applied, the keys that upserts rely on exist only then
+        self.migrated = False
 
         if hasattr(self, "cluster") and (cluster := getattr(self, "cluster")):
             asyncio.create_task(self._setup(cluster))
 
-        self.lost_queries_task.start()
-
-    def _pops_from_lost_queries(self, keys: list[str]) -> None:
-        """
-        Removes the queries from the lost queries list that are in the keys list.
-
-        Parameters:
-            keys (list[str]): The keys of the queries to remove from the lost queries list.
-
-        Returns:
-            None
-        """
-        for i in keys:
-            try:
-                self._lost_queries.pop(i)
-            except KeyError:
-                pass
-
-    @loop(seconds=10)
-    async def lost_queries_task(self) -> None:
-        """
-        A task that periodically attempts to re-run any queries that were previously executed but failed due to a lost connection.
-
-        This task runs every 10 seconds and attempts to re-run any queries that were previously added to the `_lost_queries` dictionary. If the connection to the database is still active, the query is executed using the `execute` method. If the execution fails, the exception is logged using `loguru`. If the execution is successful, the query is removed from the `_lost_queries` dictionary.
-
-        Parameters:
-            self (Database): The instance of the `Database` class that contains the `_lost_queries` dictionary and the `this_pool` property.
-
-        Returns:
-            None
-        """
-        if self._lost_queries and self._pool.connected:
-            handled = []
-            for sql, args in self._lost_queries.items():
-                try:
-                    await self.execute(sql, *args)
-                except Exception as e:
-                    logger.warning(e)
-                else:
-                    handled.append(sql)
-            self._pops_from_lost_queries(handled)
-
     @staticmethod
     async def _get_script(folder: str, name: str) -> str:
         """
@@ -99,10 +68,50 @@ class Database:
         if script:
             await self.execute(script)
 
+        if self._pool.connected:
+            try:
+                await Migrations(self._pool, cluster).apply()
+                self.migrated = True
+            except Exception as e:
+                logger.critical(f"Migrations of {cluster} failed: {type(e).__name__}: {e}")
+
     async def close(self) -> None:
         await self._pool.close()
         logger.info(f"Connection {self.cluster} was closed successfully")  # type: ignore
 
+    async def _timed(self, method: Callable[..., Awaitable[Any]], sql: str, *args: Any) -> Any:
+        """
+        Runs a pool method and records its latency in the query metrics.
+
+        Args:
+            method (Callable[..., Awaitable[Any]]): The pool method to run.
+            sql (str): The SQL statement to execute.
+            *args (Any): The arguments to pass to the SQL statement.
+
+        Returns:
+            Any: The result of the method.
+        """
+        start = perf_counter()
+        try:
+            result = await method(sql, *args)
+        except Exception:
+            self.metrics.record(sql, args, perf_counter() - start, failed=True)
+            raise
+
+        self.metrics.record(sql, args, perf_counter() - start)
+        return result
+
+    async def _drain(self) -> bool:
+        """
+        Replays the pending writes of the journal before a new statement, so the statements keep their order.
+
+        Returns:
+            bool: Whether the journal is empty, False if the connection was lost during the replay.
+        """
+        if len(self._journal):
+            await self._journal.replay()
+        return not len(self._journal)
+
     async def execute(self, sql: str, *args: Any) -> None:
         """
         Executes the provided SQL statement, with the provided arguments, on the database.
@@ -117,16 +126,16 @@ class Database:
         Raises:
             asyncpg.Error: If the query fails.
         """
-        if not self._pool.connected:
-            self._lost_queries[sql] = args
+        if not self._pool.connected or not await self._drain():
+            self._journal.append(sql, args)
             return None
 
         try:
-            await self._pool.execute(sql, *args)
+            await self._timed(self._pool.execute, sql, *args)
         except OSError:
-            self._lost_queries[sql] = args
+            self._journal.append(sql, args)
         except ConnectionDoesNotExistError as e:
-            self._lost_queries[sql] = args
+            self._journal.append(sql, args)
             logger.error(e)
 
         return None
@@ -145,16 +154,16 @@ class Database:
         Raises:
             asyncpg.Error: If the query fails.
         """
-        if not self._pool.connected:
-            self._lost_queries[sql] = args
+        if not self._pool.connected or not await self._drain():
+            self._journal.append(sql, args, many=True)
             return None
 
         try:
-            await self._pool.executemany(sql, *args)
+            await self._timed(self._pool.executemany, sql, *args)
         except OSError:
-            self._lost_queries[sql] = args
+            self._journal.append(sql, args, many=True)
         except ConnectionDoesNotExistError as e:
-            self._lost_queries[sql] = args
+            self._journal.append(sql, args, many=True)
             logger.error(e)
 
         return None
@@ -177,8 +186,9 @@ class Database:
         if not self._pool.connected:
             return []
 
+        await self._drain()
         try:
-            return await self._pool.fetch(sql, *args)
+            return await self._timed(self._pool.fetch, sql, *args)
         except (ConnectionDoesNotExistError, OSError) as e:
             logger.error(e)
 
@@ -201,8 +211,9 @@ class Database:
         if not self._pool.connected:
             return None
 
+        await self._drain()
         try:
-            return await self._pool.fetchrow(sql, *args)
+            return await self._timed(self._pool.fetchrow, sql, *args)
         except (ConnectionDoesNotExistError, OSError) as e:
             logger.error(e)
 
@@ -223,7 +234,8 @@ class Database:
         if not self._pool.connected:
             return None
 
+        await self._drain()
         try:
-            return await self._pool.fetchval(sql, *args)
+            return await self._timed(self._pool.fetchval, sql, *args)
         except (ConnectionDoesNotExistError, OSError) as e:
             logger.error(e)
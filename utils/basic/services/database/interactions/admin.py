@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from collections import Counter
 from datetime import datetime
 
 from asyncpg import Record
+from disnake.ext.tasks import loop
+from loguru import logger
 
 from utils.basic.services.database import ChisatoPool
 from utils.basic.services.database.handlers import Database
@@ -11,7 +14,8 @@ from utils.enviroment import env
 
 class AdminDB(Database):
     __slots__ = (
-        'bot'
+        'bot',
+        '_command_uses'
     )
 
     cluster: str = "admin"
@@ -20,11 +24,56 @@ class AdminDB(Database):
         super().__init__(pool=pool)
         self.bot = self.this_pool.client
 
+        self._command_uses: Counter[str] = Counter()
+        self._flush_command_uses_task.start()
+
+    @loop(seconds=30)
+    async def _flush_command_uses_task(self) -> None:
+        try:
+            await self.flush_command_uses()
+        except Exception as e:
+            logger.error(f"Command uses flush failed: {type(e).__name__}: {e}")
+
+    async def flush_command_uses(self) -> None:
+        """
+        Writes the command uses counted since the last flush to both tables in one statement,
+        the uses are counted again on the next flush if it fails
+        :return: None
+        """
+        if not self._command_uses:
+            return
+
+        uses, self._command_uses = self._command_uses, Counter()
+        try:
+            await self.execute(
+                """
+                with uses as (select * from unnest($1::varchar[], $2::integer[]) as u(command, uses)),
+                     all_time as (
+                         insert into analytics_commands_all_time(command, uses)
+                         select * from uses
+                         on conflict (command) do update set uses = analytics_commands_all_time.uses + excluded.uses
+                     )
+                insert into analytics_commands_per_day(command, uses)
+                select * from uses
+                on conflict (command) do update set uses = analytics_commands_per_day.uses + excluded.uses
+                """,
+                list(uses.keys()), list(uses.values())
+            )
+        except Exception:
+            self._command_uses.update(uses)
+            raise
+
+    async def close(self) -> None:
+        await self.flush_command_uses()
+        await super().close()
+
     async def get_data_uses(self, name: str, per_day: bool = False) -> Record | None:
         """
         Hru-hru-hru
         :return: int object
         """
+        await self.flush_command_uses()
+
         if per_day:
             data = await self.fetchval('select uses from analytics_commands_per_day where command = $1', name)
         else:
@@ -34,19 +83,11 @@ class AdminDB(Database):
 
     async def reg_command(self, name: str) -> None:
         """
-        Register command in table
+        Register command use, it is written to the tables on the next flush
         :param name: string
         :return: None
         """
-        if not await self.get_data_uses(name=name):
-            await self.execute('insert into analytics_commands_all_time(command) values ($1)', name)
-        else:
-            await self.execute('update analytics_commands_all_time set uses=uses + 1 where command = $1', name)
-
-        if not await self.get_data_uses(name=name, per_day=True):
-            await self.execute('insert into analytics_commands_per_day(command) values ($1)', name)
-        else:
-            await self.execute('update analytics_commands_per_day set uses=uses + 1 where command = $1', name)
+        self._command_uses[name] += 1
 
     async def get_analytics_commands_data(self, per_day: bool = False) -> list[Record] | None:
         """
@@ -54,6 +95,7 @@ class AdminDB(Database):
         :param per_day: boolean
         :return: list with tuples or None
         """
+        await self.flush_command_uses()
 
         if per_day:
             return await self.fetchall('select * from analytics_commands_per_day')
@@ -72,6 +114,9 @@ class AdminDB(Database):
         Truncate the analytics data per day from database
         :return: None
         """
+        # The uses counted before the truncate belong to the day that ends
+        await self.flush_command_uses()
+
         await self.execute('truncate table analytics_commands_per_day')
         await self.execute("truncate table analytics_logs")
 
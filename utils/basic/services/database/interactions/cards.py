@@ -1,4 +1,3 @@
-import asyncio
 import json
 import random
 from datetime import datetime, timedelta
@@ -10,6 +9,7 @@ from asyncpg import Record
 from disnake import Member, User
 
 from utils.basic.services.database import Database, ChisatoPool
+from utils.basic.services.database.handlers import EnsureRow
 from utils.dataclasses import CardItem
 from utils.exceptions import CardNotInTrade
 
@@ -20,7 +20,7 @@ class CardsDB(Database):
         "_cards_list",
         "_cards_config",
         "_probabilities",
-        "_lock"
+        "_ensure_main"
     )
 
     cluster: str = "cards"
@@ -34,7 +34,7 @@ class CardsDB(Database):
 
         self.bot = self.this_pool.client
         self.bot.loop.create_task(self.load_cards())
-        self._lock = asyncio.Lock()
+        self._ensure_main = EnsureRow(self, "cards_main", "user_id", defaults={"rolls": 2})
 
     @property
     def cards_list(self) -> dict[str, dict[str, str | int]]:
@@ -64,16 +64,8 @@ class CardsDB(Database):
             if random_number <= current_probability:
                 return card
 
-    async def check_in_main(self, user: Member | User) -> None:
-        async with self._lock:
-            await self.execute(
-                """
-                INSERT INTO cards_main(user_id, rolls) 
-                SELECT $1, $2 
-                WHERE NOT EXISTS (SELECT 1 FROM cards_main WHERE user_id=$1)
-                """,
-                user.id, 2
-            )
+    async def check_in_main(self, user: Member | User) -> Record | None:
+        return await self._ensure_main(user.id)
 
     async def add_rolls(self, user: Member | Literal["all"], count: int) -> None:
         if user == "all":
@@ -93,8 +85,8 @@ class CardsDB(Database):
             )
 
     async def get_rolls(self, user: Member | User) -> int:
-        await self.check_in_main(user)
-        return await self.fetchval("SELECT rolls FROM cards_main WHERE user_id = $1", user.id)
+        row = await self.check_in_main(user)
+        return row["rolls"] if row else 0
 
     async def create_card(self, card_id: int, user: Member | User, rarity: int | str) -> CardItem:
         await self.execute(
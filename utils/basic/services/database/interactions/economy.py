@@ -1,5 +1,4 @@
 import ast
-import asyncio
 from asyncio import sleep
 from datetime import datetime
 
@@ -7,7 +6,9 @@ from asyncpg import Record
 from disnake import Member, Guild
 
 from utils.basic.services.database import ChisatoPool
-from utils.basic.services.database.handlers import Database
+from utils.basic.services.database.handlers import Database, EnsureRow
+from utils.basic.services.database.interactions.transactions import TransactionsDB
+from utils.dataclasses import LeaderboardEntry, LeaderboardPosition
 from utils.exceptions.errors import *
 from utils.i18n import ChisatoLocalStore
 
@@ -17,17 +18,20 @@ _t = ChisatoLocalStore.load("./cogs/economy/simple.py")
 class EconomyDB(Database):
     __slots__ = (
         "bot",
-        "_lock"
+        "_ensure_member"
     )
 
     cluster: str = "economy"
 
+    # The default of economy_main.money, used when a transfer creates the row of the receiver
+    DEFAULT_MONEY: int = 30
+
     def __init__(self, pool: ChisatoPool) -> None:
         super().__init__(pool=pool)
 
         self.bot = self.this_pool.client
         self.bot.loop.create_task(self._set_in_game())
-        self._lock = asyncio.Lock()
+        self._ensure_member = EnsureRow(self, "economy_main", "guild_id", "user_id")
 
     async def _set_in_game(self) -> None:
         await sleep(2)
@@ -35,48 +39,99 @@ class EconomyDB(Database):
             "UPDATE economy_main SET in_game = FALSE"
         )
 
+    def _credit(self, user: str, amount: str, default: str) -> str:
+        """
+        Builds the `credit` step of a money move, it adds money to a member once `debit` returned a row.
+
+        A member without a row gets one with the default money. Until the migrations are applied
+        economy_main may have no key to conflict on, the row is then inserted only when it is
+        missing and updated otherwise, both steps touching disjoint rows.
+
+        Args:
+            user (str): The placeholder of the member id.
+            amount (str): The placeholder of the amount.
+            default (str): The placeholder of the default money.
+
+        Returns:
+            str: The common table expressions of the step.
+        """
+        if self.migrated:
+            return f"""credit AS (
+                INSERT INTO economy_main (guild_id, user_id, money)
+                SELECT $1, {user}, {default} + {amount} FROM debit
+                ON CONFLICT (guild_id, user_id) DO UPDATE SET money = economy_main.money + {amount}
+            )"""
+
+        return f"""created AS (
+                INSERT INTO economy_main (guild_id, user_id, money)
+                SELECT $1, {user}, {default} + {amount} FROM debit
+                WHERE NOT EXISTS (SELECT 1 FROM economy_main WHERE guild_id = $1 AND user_id = {user})
+            ), credit AS (
+                UPDATE economy_main SET money = money + {amount}
+                WHERE guild_id = $1 AND user_id = {user} AND EXISTS (SELECT 1 FROM debit)
+            )"""
+
     async def member_check_in_main_db(self, guild: int | Member, members: list[int | Member]) -> None:
-        async with self._lock:
-            await self.executemany(
-                """
-                INSERT INTO economy_main (guild_id, user_id) 
-                SELECT $1, $2
-                WHERE NOT EXISTS (
-                    SELECT 1
-                    FROM economy_main 
-                    WHERE guild_id = $1 AND user_id = $2
+        await self._ensure_member.many(
+            [
+                (
+                    guild.id if isinstance(guild, Guild) else guild,
+                    member.id if isinstance(member, Member) else member
                 )
-                """,
-                [
-                    (
-                        guild.id if isinstance(guild, Guild) else guild,
-                        member.id if isinstance(member, Member) else member
-                    )
-                    for member in members
-                ]
+                for member in members
+            ]
+        )
+
+    async def pay(
+            self, member: int, guild: int, member_pay: int, amount: int,
+            locale_keys: tuple[str, str] | None = None
+    ) -> None:
+        """
+        Moves money from one member to another and records both sides in the ledger, in one statement.
+
+        Args:
+            member (int): The id of the paying member.
+            guild (int): The guild id.
+            member_pay (int): The id of the receiving member.
+            amount (int): The amount of money.
+            locale_keys (tuple[str, str] | None): The ledger descriptions of the outgoing and incoming
+                transaction, nothing is recorded if None.
+
+        Returns:
+            None
+
+        Raises:
+            NotEnoughMoney: If the paying member does not have enough money.
+        """
+        outgoing, incoming = locale_keys or (None, None)
+        sql = f"""
+            WITH debit AS (
+                UPDATE economy_main SET money = money - $4
+                WHERE guild_id = $1 AND user_id = $2 AND money >= $4
+                RETURNING user_id
+            ), {self._credit("$3", "$4", "$5")}, ledger AS (
+                INSERT INTO economy_transactions (guild_id, user_id, amount, type, description)
+                SELECT $1, $2, $4, $6, $7 FROM debit WHERE $7::VARCHAR IS NOT NULL AND $4 <> 0
+                UNION ALL
+                SELECT $1, $3, $4, $8, $9 FROM debit WHERE $9::VARCHAR IS NOT NULL AND $4 <> 0
             )
+            SELECT EXISTS (SELECT 1 FROM debit) AS paid,
+                   EXISTS (SELECT 1 FROM economy_main WHERE guild_id = $1 AND user_id = $2) AS registered
+        """
+        args = (
+            guild, member, member_pay, amount, self.DEFAULT_MONEY,
+            TransactionsDB.OUTGOING, outgoing, TransactionsDB.INCOMING, incoming
+        )
 
-    async def pay(self, member: int, guild: int, member_pay: int, amount: int) -> None:
-        await self.member_check_in_main_db(guild=guild, members=[member, member_pay])
+        if not (result := await self.fetchrow(sql, *args)):
+            return
 
-        values_member = (await self.fetchval(
-            'SELECT money FROM economy_main WHERE guild_id = $1 AND user_id = $2', guild, member
-        ))
-        values_member_pay = (await self.fetchval(
-            "SELECT money FROM economy_main WHERE guild_id = $1 AND user_id = $2", guild, member_pay
-        ))
+        if not result['paid'] and not result['registered']:
+            await self.member_check_in_main_db(guild=guild, members=[member])
+            result = await self.fetchrow(sql, *args)
 
-        if amount > values_member:
+        if result and not result['paid']:
             raise NotEnoughMoney(f'User {member} does not have enough money')
-        else:
-            await self.execute(
-                'UPDATE economy_main SET money = $1 WHERE guild_id = $2 AND user_id = $3',
-                values_member - amount, guild, member
-            )
-            await self.execute(
-                'UPDATE economy_main SET money = $1 WHERE guild_id = $2 AND user_id = $3',
-                values_member_pay + amount, guild, member_pay
-            )
 
     async def remove_balance(self, guild: int, member: int, amount: int) -> None:
         await self.member_check_in_main_db(guild=guild, members=[member])
@@ -195,26 +250,108 @@ class EconomyDB(Database):
             )
         )[0]
 
-    async def get_top_position(self, guild: Guild, member: Member) -> str:
-        await self.member_check_in_main_db(guild=guild.id, members=[member])
+    async def get_position(
+            self, guild: int, member: int, neighbours: int = 2, with_total: bool = True
+    ) -> LeaderboardPosition | None:
+        """
+        Returns the exact leaderboard rank of a member with the members around them.
 
-        data = await self.fetchall(
-            """
-            SELECT * FROM economy_main WHERE guild_id=$1 ORDER BY money DESC LIMIT 100
+        Members are ordered by money, ties by user id, the counts use the (guild_id, money DESC, user_id) index.
+
+        Args:
+            guild (int): The guild id.
+            member (int): The member id.
+            neighbours (int): The number of members fetched above and below.
+            with_total (bool): Whether to count the members of the guild, which scans the whole guild.
+
+        Returns:
+            LeaderboardPosition | None: The position, or None if the connection to the database is lost.
+        """
+        await self.member_check_in_main_db(guild=guild, members=[member])
+
+        total = "(SELECT COUNT(*) FROM economy_main WHERE guild_id = $1)" if with_total else "NULL::BIGINT"
+        row = await self.fetchrow(
+            f"""
+            WITH me AS (SELECT money FROM economy_main WHERE guild_id = $1 AND user_id = $2)
+            SELECT me.money,
+                   (SELECT COUNT(*)
+                    FROM economy_main
+                    WHERE guild_id = $1
+                      AND (money > me.money OR (money = me.money AND user_id < $2))) + 1 AS rank,
+                   {total} AS total
+            FROM me
             """,
-            guild.id
+            guild, member
         )
-        row = await self.fetchrow(
+        if not row:
+            return None
+
+        if not neighbours:
+            return LeaderboardPosition(rank=row['rank'], total=row['total'], money=row['money'])
+
+        above = await self.fetchall(
             """
-            SELECT * FROM economy_main WHERE guild_id=$1 AND user_id=$2
+            SELECT user_id, money FROM economy_main
+            WHERE guild_id = $1 AND (money > $2 OR (money = $2 AND user_id < $3))
+            ORDER BY money, user_id DESC
+            LIMIT $4
             """,
-            guild.id, member.id
+            guild, row['money'], member, neighbours
         )
+        below = await self.get_leaderboard(guild, limit=neighbours, after=(row['money'], member), rank=row['rank'])
+
+        return LeaderboardPosition(
+            rank=row['rank'],
+            total=row['total'],
+            money=row['money'],
+            above=[
+                LeaderboardEntry(user_id=record['user_id'], money=record['money'], rank=row['rank'] - i)
+                for i, record in reversed(list(enumerate(above, 1)))
+            ],
+            below=below
+        )
+
+    async def get_leaderboard(
+            self, guild: int, limit: int = 10, after: tuple[int, int] | None = None, rank: int = 0
+    ) -> list[LeaderboardEntry]:
+        """
+        Returns one page of the guild leaderboard, pages are fetched by keyset instead of an offset.
+
+        Args:
+            guild (int): The guild id.
+            limit (int): The size of the page.
+            after (tuple[int, int] | None): The money and user id of the last entry of the previous page.
+            rank (int): The rank of the last entry of the previous page.
+
+        Returns:
+            list[LeaderboardEntry]: The entries of the page.
+        """
+        if after is None:
+            rows = await self.fetchall(
+                "SELECT user_id, money FROM economy_main WHERE guild_id = $1 ORDER BY money DESC, user_id LIMIT $2",
+                guild, limit
+            )
+        else:
+            rows = await self.fetchall(
+                """
+                SELECT user_id, money FROM economy_main
+                WHERE guild_id = $1 AND (money < $2 OR (money = $2 AND user_id > $3))
+                ORDER BY money DESC, user_id
+                LIMIT $4
+                """,
+                guild, *after, limit
+            )
+
+        return [
+            LeaderboardEntry(user_id=record['user_id'], money=record['money'], rank=rank + i)
+            for i, record in enumerate(rows, 1)
+        ]
+
+    async def get_top_position(self, guild: Guild, member: Member) -> str:
+        if not (position := await self.get_position(guild.id, member.id, neighbours=0, with_total=False)):
+            return "?"
 
-        try:
-            return str(data.index(row) + 1)
-        except ValueError:
-            return "100+"
+        return str(position.rank)
 
     async def in_game(self, member: int, guild: int, _set: bool | None = None) -> None | bool:
         await self.member_check_in_main_db(guild=guild, members=[member])
@@ -273,46 +410,77 @@ class EconomyDB(Database):
         raise NotMarried
 
     async def update_marry_balance(self, guild: Guild, member: Member, amount: int, deposit: bool = True) -> None:
-        await self.member_check_in_main_db(guild=guild.id, members=[member.id])
+        """
+        Moves money between a member and the bank of their marriage and records it in the ledger, in one statement.
+
+        Args:
+            guild (Guild): The guild.
+            member (Member): The married member.
+            amount (int): The amount of money.
+            deposit (bool): Whether the money goes to the marriage bank or back to the member.
+
+        Returns:
+            None
+
+        Raises:
+            NotMarried: If the member is not married.
+            NotEnoughMoney: If the member does not have enough money to deposit.
+            MarryNotEnoughMoney: If the marriage bank does not have enough money to withdraw.
+        """
+        if deposit:
+            sql = """
+                WITH marry AS (
+                    SELECT marry_id FROM economy_marry
+                    WHERE guild_id = $1 AND (user1_id = $2 OR user2_id = $2)
+                    LIMIT 1
+                ), debit AS (
+                    UPDATE economy_main SET money = money - $3
+                    WHERE guild_id = $1 AND user_id = $2 AND money >= $3 AND EXISTS (SELECT 1 FROM marry)
+                    RETURNING user_id
+                ), credit AS (
+                    UPDATE economy_marry SET balance = balance + $3
+                    WHERE marry_id = (SELECT marry_id FROM marry) AND EXISTS (SELECT 1 FROM debit)
+                ), ledger AS (
+                    INSERT INTO economy_transactions (guild_id, user_id, amount, type, description)
+                    SELECT $1, $2, $3, $4, $5 FROM debit WHERE $3 <> 0
+                )
+                SELECT EXISTS (SELECT 1 FROM marry) AS married, EXISTS (SELECT 1 FROM debit) AS moved
+            """
+            args = (guild.id, member.id, amount, TransactionsDB.OUTGOING, "loves.balance.incoming")
+        else:
+            sql = f"""
+                WITH marry AS (
+                    SELECT marry_id FROM economy_marry
+                    WHERE guild_id = $1 AND (user1_id = $2 OR user2_id = $2)
+                    LIMIT 1
+                ), debit AS (
+                    UPDATE economy_marry SET balance = balance - $3
+                    WHERE marry_id = (SELECT marry_id FROM marry) AND balance >= $3
+                    RETURNING marry_id
+                ), {self._credit("$2", "$3", "$6")}, ledger AS (
+                    INSERT INTO economy_transactions (guild_id, user_id, amount, type, description)
+                    SELECT $1, $2, $3, $4, $5 FROM debit WHERE $3 <> 0
+                )
+                SELECT EXISTS (SELECT 1 FROM marry) AS married, EXISTS (SELECT 1 FROM debit) AS moved
+            """
+            args = (
+                guild.id, member.id, amount, TransactionsDB.INCOMING, "loves.balance.outgoing", self.DEFAULT_MONEY
+            )
 
-        if marry_data := await self.get_marry_solo(guild=guild, member=member):
-            member_data = await self.values(member=member.id, guild=guild.id)
-            match deposit:
-                case True:
-                    if member_data[2] < amount:
-                        await self.execute(
-                            "UPDATE economy_main SET money=money-$1 WHERE user_id=$2 AND guild_id=$3",
-                            amount, member.id, guild.id
-                        )
-                        await self.execute(
-                            "UPDATE economy_marry SET balance=balance+$1 WHERE marry_id=$2",
-                            amount, marry_data[1]
-                        )
-                        await self.bot.databases.transactions.add(
-                            guild=guild.id, user=member.id, amount=amount, typing=False,
-                            locale_key="loves.balance.incoming"
-                        )
-                        return
-
-                    raise NotEnoughMoney
-                case False:
-                    if marry_data[4] < amount:
-                        await self.execute(
-                            "UPDATE economy_marry SET balance=balance-$1 WHERE marry_id=$2",
-                            amount, marry_data[1]
-                        )
-                        await self.execute(
-                            "UPDATE economy_main SET money=money+$1 WHERE user_id=$2 AND guild_id=$3",
-                            amount, member.id, guild.id
-                        )
-                        await self.bot.databases.transactions.add(
-                            guild=guild.id, user=member.id, amount=amount, typing=True,
-                            locale_key="loves.balance.outgoing"
-                        )
-                        return
-
-                    raise MarryNotEnoughMoney
-        raise NotMarried
+        if not (result := await self.fetchrow(sql, *args)):
+            return
+
+        if not result['married']:
+            raise NotMarried
+
+        if deposit and not result['moved'] and not await self.fetchval(
+                "SELECT 1 FROM economy_main WHERE guild_id = $1 AND user_id = $2", guild.id, member.id
+        ):
+            await self.member_check_in_main_db(guild=guild.id, members=[member.id])
+            result = await self.fetchrow(sql, *args)
+
+        if result and not result['moved']:
+            raise NotEnoughMoney if deposit else MarryNotEnoughMoney
 
     async def marry_discard(self, marry_id: int) -> None:
         await self.execute("DELETE FROM economy_marry WHERE marry_id=$1", marry_id)
@@ -375,34 +543,88 @@ class EconomyDB(Database):
             guild.id, role
         )
 
-    async def remove_count(
-            self, guild: Guild, role: int
-    ) -> None:
-        if not await self.fetchval(
-                "SELECT unlimited FROM economy_shop WHERE guild_id=$1 AND role_id=$2",
-                guild.id, role
-        ):
-            if await self.fetchval(
-                    "SELECT count FROM economy_shop WHERE guild_id=$1 AND role_id=$2",
-                    guild.id, role
-            ) == 0:
-                await self.remove_item(guild, role)
-                raise SubjectEnded
-
-            await self.execute(
-                "UPDATE economy_shop SET count=count-1 WHERE guild_id=$1 AND role_id=$2",
-                guild.id, role
-
+    async def buy_item(self, guild: Guild, member: Member, role: int, locale_key: str) -> int:
+        """
+        Buys a shop item: locks it, charges the member, takes one from the stock and records
+        the purchase in the ledger, in one statement.
+
+        Args:
+            guild (Guild): The guild.
+            member (Member): The buying member.
+            role (int): The role id of the item.
+            locale_key (str): The ledger description of the purchase.
+
+        Returns:
+            int: The price that was paid.
+
+        Raises:
+            SubjectEnded: If the item is out of stock or no longer in the shop.
+            NotEnoughMoney: If the member does not have enough money.
+        """
+        sql = """
+            WITH item AS (
+                SELECT cost, unlimited, count FROM economy_shop
+                WHERE guild_id = $1 AND role_id = $3
+                FOR UPDATE
+            ), debit AS (
+                UPDATE economy_main SET money = money - item.cost
+                FROM item
+                WHERE economy_main.guild_id = $1 AND economy_main.user_id = $2
+                  AND (item.unlimited OR item.count > 0) AND economy_main.money >= item.cost
+                RETURNING item.cost
+            ), stock AS (
+                UPDATE economy_shop SET count = count - 1
+                WHERE guild_id = $1 AND role_id = $3 AND NOT unlimited AND EXISTS (SELECT 1 FROM debit)
+            ), ledger AS (
+                INSERT INTO economy_transactions (guild_id, user_id, amount, type, description)
+                SELECT $1, $2, cost, $4, $5 FROM debit WHERE cost <> 0
             )
-
-    async def add_count(
-            self, guild: Guild, role: int
-    ) -> None:
-        if not await self.fetchval(
-                "SELECT unlimited FROM economy_shop WHERE guild_id=$1 AND role_id=$2",
-                guild.id, role
-        ):
-            await self.execute(
-                "UPDATE economy_shop SET count=count+1 WHERE guild_id=$1 AND role_id=$2",
-                guild.id, role
+            SELECT (SELECT cost FROM debit) AS paid,
+                   (SELECT unlimited OR count > 0 FROM item) AS available,
+                   EXISTS (SELECT 1 FROM economy_main WHERE guild_id = $1 AND user_id = $2) AS registered
+        """
+        args = (guild.id, member.id, role, TransactionsDB.OUTGOING, locale_key)
+
+        if not (result := await self.fetchrow(sql, *args)):
+            raise SubjectEnded
+
+        if result['paid'] is None and result['available'] and not result['registered']:
+            await self.member_check_in_main_db(guild=guild.id, members=[member.id])
+            result = await self.fetchrow(sql, *args) or result
+
+        if result['paid'] is not None:
+            return result['paid']
+
+        if not result['available']:
+            await self.remove_item(guild, role)
+            raise SubjectEnded
+
+        raise NotEnoughMoney
+
+    async def refund_item(self, guild: Guild, member: Member, role: int, amount: int, locale_key: str) -> None:
+        """
+        Reverses a purchase that could not be delivered: returns the money and the stock and records
+        the refund in the ledger, in one statement.
+
+        Args:
+            guild (Guild): The guild.
+            member (Member): The member who bought the item.
+            role (int): The role id of the item.
+            amount (int): The price that was paid.
+            locale_key (str): The ledger description of the refund.
+
+        Returns:
+            None
+        """
+        await self.execute(
+            """
+            WITH credit AS (
+                UPDATE economy_main SET money = money + $4 WHERE guild_id = $1 AND user_id = $2
+            ), stock AS (
+                UPDATE economy_shop SET count = count + 1 WHERE guild_id = $1 AND role_id = $3 AND NOT unlimited
             )
+            INSERT INTO economy_transactions (guild_id, user_id, amount, type, description)
+            SELECT $1, $2, $4, $5, $6 WHERE $4 <> 0
+            """,
+            guild.id, member.id, role, amount, TransactionsDB.INCOMING, locale_key
+        )
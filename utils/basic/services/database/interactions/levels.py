@@ -1,4 +1,3 @@
-import asyncio
 from collections import defaultdict
 from random import randint
 from typing import TYPE_CHECKING
@@ -7,9 +6,10 @@ import asyncpg
 from asyncpg import Record
 from disnake import TextChannel, VoiceChannel, ForumChannel, StageChannel, Member, Guild
 from disnake.ext.tasks import loop
+from loguru import logger
 
 from utils.basic.services.database import ChisatoPool
-from utils.basic.services.database.handlers import Database
+from utils.basic.services.database.handlers import Database, EnsureRow, TTLCache
 from utils.exceptions import MaxPrestige, NotIs100
 
 if TYPE_CHECKING:
@@ -19,24 +19,113 @@ if TYPE_CHECKING:
 class LevelsDB(Database):
     __slots__ = (
         "bot",
-        "_can_exp"
+        "_can_exp",
+        "_exp_cache",
+        "_exp_dirty",
+        "_ensure_member",
+        "_ensure_settings",
+        "_settings_cache"
     )
 
     cluster: str = "levels"
 
+    _EXP_CACHE_LIMIT: int = 10000
+
     def __init__(self, pool: ChisatoPool) -> None:
         super().__init__(pool=pool)
 
         self.bot = self.this_pool.client
-        self._member_lock = asyncio.Lock()
-        self._settings_lock = asyncio.Lock()
+        self._ensure_member = EnsureRow(self, "levels_main", "guild_id", "user_id")
+        self._ensure_settings = EnsureRow(self, "levels_settings", "guild_id")
+        self._settings_cache = TTLCache(max_size=20000, ttl=600)
         self._can_exp: dict[Guild, dict[Member, bool]] = defaultdict(defaultdict)
+
+        # (guild_id, user_id) -> [prestige, level, exp_need, exp_now]
+        self._exp_cache: dict[tuple[int, int], list[int]] = {}
+        self._exp_dirty: set[tuple[int, int]] = set()
+
         self._clear_can_exp.start()
+        self._flush_exp_task.start()
 
     @loop(minutes=1)
     async def _clear_can_exp(self) -> None:
         self._can_exp.clear()
 
+    @loop(seconds=5)
+    async def _flush_exp_task(self) -> None:
+        try:
+            await self.flush_exp()
+        except Exception as e:
+            logger.error(f"Experience flush failed: {type(e).__name__}: {e}")
+
+    async def flush_exp(self) -> None:
+        """
+        Writes every dirty row of the experience accumulator to `levels_main` in one round-trip.
+
+        Returns:
+            None
+        """
+        if not self._exp_dirty:
+            return
+
+        keys, self._exp_dirty = self._exp_dirty, set()
+        rows = [(*key, *self._exp_cache[key][1:]) for key in keys if key in self._exp_cache]
+        if rows:
+            try:
+                await self.execute(
+                    """
+                    UPDATE levels_main AS l
+                    SET level=d.level, exp_need=d.exp_need, exp_now=d.exp_now
+                    FROM UNNEST($1::BIGINT[], $2::BIGINT[], $3::INTEGER[], $4::BIGINT[], $5::BIGINT[])
+                        AS d(guild_id, user_id, level, exp_need, exp_now)
+                    WHERE l.guild_id = d.guild_id AND l.user_id = d.user_id
+                    """,
+                    *map(list, zip(*rows))
+                )
+            except Exception:
+                # The rows stay dirty and are written again on the next flush
+                self._exp_dirty |= keys
+                raise
+
+        if len(self._exp_cache) > self._EXP_CACHE_LIMIT:
+            for key in [k for k in self._exp_cache if k not in self._exp_dirty]:
+                del self._exp_cache[key]
+
+    async def _sync_member(self, guild: int, member: int) -> None:
+        """
+        Flushes the pending experience of a member and drops it from the accumulator,
+        so the next direct read or write of `levels_main` sees the actual row.
+
+        Args:
+            guild (int): The guild id.
+            member (int): The member id.
+
+        Returns:
+            None
+        """
+        key = (guild, member)
+        # Taken out before the write, experience gained meanwhile starts a new entry instead of being dropped
+        dirty = key in self._exp_dirty
+        self._exp_dirty.discard(key)
+        if (values := self._exp_cache.pop(key, None)) is None or not dirty:
+            return
+
+        _, level, exp_need, exp_now = values
+        try:
+            await self.execute(
+                "UPDATE levels_main SET level=$1, exp_need=$2, exp_now=$3 WHERE guild_id=$4 AND user_id=$5",
+                level, exp_need, exp_now, guild, member
+            )
+        except Exception:
+            # The entry stays dirty and is written on the next flush
+            self._exp_cache.setdefault(key, values)
+            self._exp_dirty.add(key)
+            raise
+
+    async def close(self) -> None:
+        await self.flush_exp()
+        await super().close()
+
     @staticmethod
     def calculate_experience(level: int) -> int:
         min_experience = 30
@@ -46,41 +135,34 @@ class LevelsDB(Database):
         return round(experience)
 
     async def settings_values(self, guild: int) -> None | asyncpg.Record:
-        await self._settings_if_not_exists(guild)
-        return await self.fetchrow('SELECT * FROM levels_settings WHERE guild_id=$1', guild)
+        if (row := self._settings_cache.get(guild)) is None:
+            if row := await self._ensure_settings(guild):
+                self._settings_cache.put(guild, row)
+
+        return row
+
+    def invalidate(self, guild: int) -> None:
+        self._settings_cache.invalidate(guild)
+        for key in [key for key in self._exp_cache if key[0] == guild]:
+            self._exp_dirty.discard(key)
+            del self._exp_cache[key]
 
     async def get_member_values(self, guild: int, member: int) -> None | asyncpg.Record:
+        await self._sync_member(guild, member)
         return await self.fetchrow(
             'SELECT * FROM levels_main WHERE guild_id=$1 AND user_id=$2', guild, member
         )
 
     async def _settings_if_not_exists(self, guild: int) -> None:
-        async with self._settings_lock:
-            await self.execute(
-                """
-                INSERT INTO levels_settings (guild_id)
-                SELECT $1
-                WHERE NOT EXISTS (SELECT 1 FROM levels_settings WHERE guild_id = $1)
-                """,
-                guild
-            )
+        await self._ensure_settings(guild)
 
     async def settings_status_switch(self, guild: int, alert: bool = False) -> bool:
-        await self._settings_if_not_exists(guild)
-        if not alert:
-            if (await self.settings_values(guild))[2]:
-                await self.execute("UPDATE levels_settings SET status=FALSE WHERE guild_id=$1", guild)
-                return False
-            else:
-                await self.execute("UPDATE levels_settings SET status=TRUE WHERE guild_id=$1", guild)
-                return True
-        else:
-            if (await self.settings_values(guild))[1]:
-                await self.execute("UPDATE levels_settings SET alert=FALSE WHERE guild_id=$1", guild)
-                return False
-            else:
-                await self.execute("UPDATE levels_settings SET alert=TRUE WHERE guild_id=$1", guild)
-                return True
+        values = await self.settings_values(guild)
+        column, index = ("alert", 1) if alert else ("status", 2)
+
+        await self.execute(f"UPDATE levels_settings SET {column}=$1 WHERE guild_id=$2", not values[index], guild)
+        self._settings_cache.invalidate(guild)
+        return not values[index]
 
     async def set_embed_data(self, guild: int, embed_data: str = None) -> None:
         await self._settings_if_not_exists(guild)
@@ -90,24 +172,14 @@ class LevelsDB(Database):
         else:
             await self.execute("UPDATE levels_settings SET embed_data=NULL WHERE guild_id=$1", guild)
 
+        self._settings_cache.invalidate(guild)
+
     async def add_member_to_table(self, guild: int, member: int) -> None:
-        async with self._member_lock:
-            await self.execute(
-                """
-                INSERT INTO levels_main (guild_id, user_id)
-                SELECT $1, $2
-                WHERE NOT EXISTS (
-                    SELECT 1 
-                    FROM levels_main 
-                    WHERE guild_id = $1 AND user_id = $2
-                )
-                """,
-                guild, member
-            )
+        await self._ensure_member(guild, member)
 
     async def select_data(self, guild: int, member: int) -> Record:
-        await self.add_member_to_table(guild=guild, member=member)
-        return await self.fetchrow('SELECT * FROM levels_main WHERE guild_id=$1 AND user_id=$2', guild, member)
+        await self._sync_member(guild, member)
+        return await self._ensure_member(guild, member)
 
     async def passive_exp(
             self, guild: Guild, member: Member,
@@ -117,66 +189,67 @@ class LevelsDB(Database):
         if not ((s := await self.bot.databases.level.settings_values(guild=guild.id)) and s[2]):
             return
 
-        await self.add_member_to_table(guild=guild.id, member=member.id)
         if not (self._can_exp.get(guild, {}).get(member, True)):
             return
 
         self._can_exp[guild][member] = False
-        values = await self.fetchrow(
-            'SELECT * FROM levels_main WHERE guild_id=$1 AND user_id=$2', guild.id, member.id
-        )
-        if values[5] < values[4]:
-            if values[4] == 1000 and values[5] >= 970:
-                await self.execute(
-                    "UPDATE levels_main SET exp_now=1000 WHERE guild_id=$1 AND user_id=$2",
-                    guild.id, member.id
-                )
+        key = (guild.id, member.id)
+        if (values := self._exp_cache.get(key)) is None:
+            if not (row := await self._ensure_member(guild.id, member.id)):
+                return
+
+            values = self._exp_cache.setdefault(
+                key, [row["prestige"], row["level"], row["exp_need"], row["exp_now"]]
+            )
+
+        prestige, level, exp_need, exp_now = values
+        if exp_now < exp_need:
+            if exp_need == 1000 and exp_now >= 970:
+                exp_now = 1000
             else:
-                await self.execute(
-                    "UPDATE levels_main SET exp_now=exp_now+$3 WHERE guild_id=$1 AND user_id=$2",
-                    guild.id, member.id, randint(1, 20)
-                )
+                exp_now += randint(1, 20)
 
-        values = await self.fetchrow(
-            'SELECT * FROM levels_main WHERE guild_id=$1 AND user_id=$2', guild.id, member.id
-        )
-        if values[4] <= values[5]:
-            if values[2] == 10 and values[3] == 100:
+            values[3] = exp_now
+            self._exp_dirty.add(key)
+
+        if exp_need <= exp_now:
+            if prestige == 10 and level == 100:
                 return
 
-            await self.execute(
-                "UPDATE levels_main SET level=level+1, exp_now=0, exp_need=$1 WHERE guild_id=$2 AND user_id=$3",
-                self.calculate_experience(values[3] + 1), guild.id, member.id
-            )
+            values[1:] = [level + 1, self.calculate_experience(level + 1), 0]
+            self._exp_dirty.add(key)
+
             bot.dispatch(
                 'member_level_upped',
                 guild, member, channel
             )
 
     async def check_now_prestige(self, guild: int, member: int) -> bool:
-        await self.add_member_to_table(guild=guild, member=member)
+        await self._sync_member(guild, member)
 
-        values = await self.fetchrow('SELECT * FROM levels_main WHERE guild_id=$1 AND user_id=$2', guild, member)
+        values = await self._ensure_member(guild, member)
         if values[3] == 100 and values[2] < 10:
             return True
 
         return False
 
     async def set_prestige(self, id: int, guild: int, member: int) -> None:
+        await self._sync_member(guild, member)
         await self.execute(
             'UPDATE levels_main SET prestige=$1 WHERE guild_id=$2 AND user_id=$3', id, guild, member
         )
 
     async def set_level(self, id: int, guild: int, member: int) -> None:
+        await self._sync_member(guild, member)
         await self.execute(
             'UPDATE levels_main SET level=$1, exp_now=0, exp_need=$2 WHERE guild_id=$3 AND user_id=$4',
             id, self.calculate_experience(id), guild, member
         )
 
     async def prestige(self, guild: int, member: int) -> None:
-        await self.add_member_to_table(guild=guild, member=member)
+        await self._sync_member(guild, member)
 
-        values = await self.fetchrow('SELECT * FROM levels_main WHERE guild_id=$1 AND user_id=$2', guild, member)
+        values = await self._ensure_member(guild, member)
         if values[2] == 10:
             raise MaxPrestige
 
@@ -1,12 +1,15 @@
-import ast
+import hashlib
 from datetime import datetime
 from typing import Optional
 
 from asyncpg import Record
 from disnake import Member
+from disnake.ext.tasks import loop
 from lavamystic import Playable
+from loguru import logger
 
 from utils.basic.services.database import Database, ChisatoPool
+from utils.basic.services.database.handlers import TTLCache
 from utils.dataclasses.music import CustomPlaylist
 from utils.exceptions import MaximumPlaylist, AlreadyCreatedPlaylist, PlaylistNotFound
 
@@ -22,66 +25,197 @@ class MusicDB(Database):
         super().__init__(pool)
         self.bot = self.this_pool.client
 
+        # Decoded tracks by their uid in music_tracks, a stored track never changes
+        self._tracks = TTLCache(max_size=10000, ttl=6 * 60 * 60)
+
+        self._history: list[tuple[int, str, int]] = []
+        self._flush_history_task.start()
+
     @staticmethod
     def _serialize_last_track(encoded: str, listened: int) -> tuple[Playable, int]:
         return (
             Playable.decode(encoded), listened
         )
 
-    async def get_last_tracks(self, member: Member) -> list[tuple[Playable, int]]:
-        return sorted(
-            [
-                self._serialize_last_track(i[0], i[1]) for i in
-
-                await self.fetchall(
-                    "SELECT encoded, listened FROM music_last_listened WHERE user_id = $1 ORDER BY listened",
-                    member.id
-                )
-            ],
-            key=lambda x: x[1],
-            reverse=True
-        )
+    HISTORY_SIZE: int = 10
+
+    @loop(seconds=15)
+    async def _flush_history_task(self) -> None:
+        try:
+            await self.flush_history()
+        except Exception as e:
+            logger.error(f"Music history flush failed: {type(e).__name__}: {e}")
+
+    async def flush_history(self) -> None:
+        """
+        Writes the buffered listened tracks with one insert and trims the history of their members.
+
+        Returns:
+            None
+        """
+        if not self._history:
+            return
 
-    async def add_last_track(self, member: Member, track: Playable) -> None:
+        history, self._history = self._history, []
+        user_ids, encodes, listened = map(list, zip(*history))
+
+        try:
+            await self.execute(
+                """
+                INSERT INTO music_last_listened (user_id, encoded, listened)
+                SELECT * FROM unnest($1::BIGINT[], $2::VARCHAR[], $3::INT[])
+                """,
+                user_ids, encodes, listened
+            )
+        except Exception:
+            # Put back ahead of what was buffered meanwhile, it is written on the next flush
+            self._history[:0] = history
+            raise
         await self.execute(
-            "INSERT INTO music_last_listened (user_id, encoded, listened) VALUES ($1, $2, $3)",
-            member.id, track.encoded, datetime.now().timestamp()
+            """
+            DELETE
+            FROM music_last_listened
+            WHERE ctid IN (SELECT ctid
+                           FROM (SELECT ctid, ROW_NUMBER() OVER (PARTITION BY user_id ORDER BY listened DESC) AS rn
+                                 FROM music_last_listened
+                                 WHERE user_id = ANY ($1::BIGINT[])) AS history
+                           WHERE history.rn > $2)
+            """,
+            list(set(user_ids)), self.HISTORY_SIZE
         )
 
+    async def close(self) -> None:
+        await self.flush_history()
+        await super().close()
+
+    async def get_last_tracks(self, member: Member) -> list[tuple[Playable, int]]:
+        await self.flush_history()
+
+        return [
+            self._serialize_last_track(i[0], i[1]) for i in
+
+            await self.fetchall(
+                """
+                SELECT encoded, listened FROM music_last_listened
+                WHERE user_id = $1
+                ORDER BY listened DESC
+                LIMIT $2
+                """,
+                member.id, self.HISTORY_SIZE
+            )
+        ]
+
+    def add_last_track(self, members: list[Member], track: Playable) -> None:
+        """
+        Buffers a listened track for every member, it is written on the next flush.
+
+        Args:
+            members (list[Member]): The members who listened to the track.
+            track (Playable): The listened track.
+
+        Returns:
+            None
+        """
+        listened = int(datetime.now().timestamp())
+        self._history.extend((member.id, track.encoded, listened) for member in members)
+
+    _PLAYLIST_COLUMNS: str = "name, uid, user_id, closed, listened_count"
+
     async def _serialize(self, record: Record) -> CustomPlaylist:
-        return CustomPlaylist(
-            name=record[0],
-            id=record[1],
-            owner=record[2],
-            closed=record[3],
-            tracks=[
-                Playable.decode(i)
-                for i in await self._get_encodes_from_uids(
-                    ast.literal_eval(record[4])
-                )
-            ],
-            listened=record[5]
-        )
+        return (await self._serialize_many([record]))[0]
+
+    async def _serialize_many(self, records: list[Record]) -> list[CustomPlaylist]:
+        items: dict[int, list[int]] = {record['uid']: [] for record in records}
+        if items:
+            for row in await self.fetchall(
+                    """
+                    SELECT playlist_id, track_id
+                    FROM music_playlist_items
+                    WHERE playlist_id = ANY ($1::BIGINT[])
+                    ORDER BY playlist_id, position
+                    """,
+                    list(items)
+            ):
+                items[row['playlist_id']].append(row['track_id'])
+
+        tracks = await self._get_tracks({uid for uids in items.values() for uid in uids})
+        return [
+            CustomPlaylist(
+                name=record['name'],
+                id=record['uid'],
+                owner=record['user_id'],
+                closed=record['closed'],
+                tracks=[tracks[uid] for uid in items[record['uid']] if uid in tracks],
+                listened=record['listened_count']
+            )
+            for record in records
+        ]
 
-    async def _get_track_uid(self, encoded: str) -> int:
-        await self._add_track(encoded)
-        return await self.fetchval(
-            "SELECT uid FROM music_tracks WHERE encoded = $1",
-            encoded
-        )
+    @staticmethod
+    def _hash(encoded: str) -> bytes:
+        return hashlib.sha256(encoded.encode()).digest()
+
+    async def _get_tracks(self, uids: set[int]) -> dict[int, Playable]:
+        """
+        Resolves track uids to decoded tracks, only the uncached ones are fetched and decoded.
+
+        Args:
+            uids (set[int]): The uids of the tracks.
+
+        Returns:
+            dict[int, Playable]: The decoded tracks by their uid.
+        """
+        tracks = {uid: track for uid in uids if (track := self._tracks.get(uid)) is not None}
+        if missing := [uid for uid in uids if uid not in tracks]:
+            for row in await self.fetchall(
+                    "SELECT uid, encoded FROM music_tracks WHERE uid = ANY ($1::BIGINT[])", missing
+            ):
+                tracks[row['uid']] = track = Playable.decode(row['encoded'])
+                self._tracks.put(row['uid'], track)
+
+        return tracks
+
+    async def _store_tracks(self, tracks: list[Playable]) -> list[int]:
+        """
+        Stores tracks by the hash of their encoded data and returns their uids in the same order.
+
+        Args:
+            tracks (list[Playable]): The tracks to store.
+
+        Returns:
+            list[int]: The uids of the tracks.
+        """
+        if not tracks:
+            return []
 
-    async def _get_track_encoded(self, uid: int) -> Optional[str]:
-        return await self.fetchval(
-            "SELECT encoded FROM music_tracks WHERE uid = $1",
-            uid
+        rows = await self.fetchall(
+            """
+            WITH items AS (SELECT *
+                           FROM unnest($1::BYTEA[], $2::VARCHAR[]) WITH ORDINALITY AS items(hash, encoded, position)),
+                 inserted AS (INSERT INTO music_tracks (hash, encoded)
+                     SELECT DISTINCT ON (hash) hash, encoded FROM items
+                     ON CONFLICT (hash) DO NOTHING
+                     RETURNING uid, hash)
+            SELECT COALESCE(inserted.uid, music_tracks.uid) AS uid
+            FROM items
+                     LEFT JOIN inserted ON inserted.hash = items.hash
+                     LEFT JOIN music_tracks ON music_tracks.hash = items.hash
+            ORDER BY items.position
+            """,
+            [self._hash(track.encoded) for track in tracks], [track.encoded for track in tracks]
         )
 
-    async def _add_track(self, encoded: str) -> None:
-        await self.execute("SELECT add_track_if_not_exists($1)", encoded)
+        uids = []
+        for row, track in zip(rows, tracks):
+            if row['uid'] is not None:
+                self._tracks.put(row['uid'], track)
+                uids.append(row['uid'])
+
+        return uids
 
     async def get_playlist(self, owner: Member, name: str) -> Optional[CustomPlaylist]:
         data = await self.fetchrow(
-            "SELECT * FROM music_playlists WHERE name = $1 AND user_id = $2",
+            f"SELECT {self._PLAYLIST_COLUMNS} FROM music_playlists WHERE name = $1 AND user_id = $2",
             name, owner.id
         )
         if data:
@@ -89,7 +223,7 @@ class MusicDB(Database):
 
     async def get_playlist_from_uid(self, uid: int) -> Optional[CustomPlaylist]:
         data = await self.fetchrow(
-            "SELECT * FROM music_playlists WHERE uid = $1",
+            f"SELECT {self._PLAYLIST_COLUMNS} FROM music_playlists WHERE uid = $1",
             uid
         )
         if not data:
@@ -97,36 +231,6 @@ class MusicDB(Database):
 
         return await self._serialize(data)
 
-    async def _get_uids_from_encodes(self, encodes: list[str]) -> list[int]:
-        if encodes:
-            return [
-                i[0] for i in
-
-                await self.fetchall(
-                    f"""
-                    SELECT uid FROM music_tracks
-                    WHERE encoded in ({','.join([f'${i}' for i in range(1, len(encodes) + 1)])})
-                    """,
-                    *encodes
-                )
-            ]
-        return []
-
-    async def _get_encodes_from_uids(self, uids: list[int]) -> list[str]:
-        if uids:
-            return [
-                i[0] for i in
-
-                await self.fetchall(
-                    f"""
-                    SELECT encoded FROM music_tracks
-                    WHERE uid in ({','.join([f'${i}' for i in range(1, len(uids) + 1)])})
-                    """,
-                    *uids
-                )
-            ]
-        return []
-
     async def create_playlist(
             self,
             name: str,
@@ -143,32 +247,36 @@ class MusicDB(Database):
         ):
             raise AlreadyCreatedPlaylist
 
-        await self.executemany(
-            "SELECT add_track_if_not_exists($1)",
-            [(i.encoded,) for i in tracks]
-        )
-
-        await self.execute(
+        uids = await self._store_tracks(tracks or [])
+        uid = await self.fetchval(
             """
-            INSERT INTO music_playlists (name, user_id, tracks, closed)
-            VALUES ($1, $2, $3, $4);
+            INSERT INTO music_playlists (name, user_id, closed)
+            VALUES ($1, $2, $3)
+            RETURNING uid;
             """,
             name,
             owner.id,
-            str(await self._get_uids_from_encodes([i.encoded for i in tracks])),
             closed
         )
+        await self.execute(
+            """
+            INSERT INTO music_playlist_items (playlist_id, track_id, position)
+            SELECT $1, items.track_id, items.position
+            FROM unnest($2::BIGINT[]) WITH ORDINALITY AS items(track_id, position)
+            """,
+            uid, uids
+        )
 
         return await self.get_playlist(owner, name)
 
     async def get_playlists(self, member: Member) -> list[CustomPlaylist]:
         data = await self.fetchall(
-            "SELECT * FROM music_playlists WHERE user_id = $1 ORDER BY uid DESC",
+            f"SELECT {self._PLAYLIST_COLUMNS} FROM music_playlists WHERE user_id = $1 ORDER BY uid DESC",
             member.id
         )
-        if data is None:
+        if not data:
             return []
-        return [await self._serialize(row) for row in data]
+        return await self._serialize_many(data)
 
     async def edit_playlist(self, uid: int, name: str = None, closed: bool = None) -> CustomPlaylist:
         if name:
@@ -190,15 +298,45 @@ class MusicDB(Database):
         )
 
     async def add_track_to_playlist(self, uid: int, track: Playable) -> None:
-        tracks: list[int] = ast.literal_eval(
-            await self.fetchval(
-                "SELECT tracks FROM music_playlists WHERE uid = $1", uid
-            )
-        )
-        tracks.append(await self._get_track_uid(track.encoded))
+        if not (uids := await self._store_tracks([track])):
+            return
 
         await self.execute(
-            "UPDATE music_playlists SET tracks = $1 WHERE uid = $2", str(tracks), uid
+            """
+            INSERT INTO music_playlist_items (playlist_id, track_id, position)
+            SELECT $1, $2, COALESCE(MAX(position), 0) + 1
+            FROM music_playlist_items
+            WHERE playlist_id = $1
+            """,
+            uid, uids[0]
+        )
+
+    async def remove_track_from_playlist(self, uid: int, track: Playable) -> bool:
+        """
+        Removes the first occurrence of a track from a playlist.
+
+        Args:
+            uid (int): The uid of the playlist.
+            track (Playable): The track to remove.
+
+        Returns:
+            bool: Whether the track was in the playlist.
+        """
+        return bool(
+            await self.fetchval(
+                """
+                DELETE
+                FROM music_playlist_items
+                WHERE uid = (SELECT uid
+                             FROM music_playlist_items
+                             WHERE playlist_id = $1
+                               AND track_id = (SELECT uid FROM music_tracks WHERE hash = $2)
+                             ORDER BY position
+                             LIMIT 1)
+                RETURNING uid
+                """,
+                uid, self._hash(track.encoded)
+            )
         )
 
     async def add_listened_to_playlist(self, uid: int) -> None:
@@ -212,24 +350,12 @@ class MusicDB(Database):
         )
 
     async def edit_playlist_tracks(self, uid: int, track: Playable, add: bool = False) -> CustomPlaylist:
-        if fetched := await self.fetchval(
-                "SELECT tracks FROM music_playlists WHERE uid = $1", uid
-        ):
-            track_uid = await self._get_track_uid(track.encoded)
-            tracks: list[int] = ast.literal_eval(fetched)
-
-            try:
-                if add:
-                    tracks.append(track_uid)
-                else:
-                    tracks.remove(track_uid)
-            except ValueError:
-                return await self.get_playlist_from_uid(uid)
-
-            else:
-                await self.execute(
-                    "UPDATE music_playlists SET tracks = $1 WHERE uid = $2", str(tracks), uid
-                )
-                return await self.get_playlist_from_uid(uid)
-        else:
+        if not await self.fetchval("SELECT uid FROM music_playlists WHERE uid = $1", uid):
             raise PlaylistNotFound
+
+        if add:
+            await self.add_track_to_playlist(uid, track)
+        else:
+            await self.remove_track_from_playlist(uid, track)
+
+        return await self.get_playlist_from_uid(uid)
@@ -108,6 +108,55 @@ class PetsDB(Database):
             self._serialize_from_record(i) for i in data
         ]
 
+    async def pets_stamina_tick(self, stamina: int) -> None:
+        """
+        Regenerates the stamina of every pet at once, capped by the stamina of its type.
+
+        Args:
+            stamina (int): The amount of stamina to add.
+
+        Returns:
+            None
+        """
+        pets = self.pets_list
+        await self.execute(
+            """
+            UPDATE economy_pets AS p
+            SET stamina_residue = LEAST(p.stamina_residue + $1, c.stamina)
+            FROM UNNEST($2::VARCHAR[], $3::INTEGER[]) AS c(pet, stamina)
+            WHERE p.pet = c.pet AND p.stamina_residue < c.stamina
+            """,
+            stamina, [pet.name for pet in pets], [pet.stamina for pet in pets]
+        )
+
+    async def pets_mana_tick(self, mana: int) -> list[Record]:
+        """
+        Decays the mana of every pet at once, never below zero.
+
+        A pet at zero mana is kept, as `pet_stats_update` always did, so a walk can restore it.
+
+        Args:
+            mana (int): The amount of mana to remove.
+
+        Returns:
+            list[Record]: `guild_id`, `user_id` and `died` of the pets whose mana has just reached zero,
+            or has just crossed the low (5) threshold.
+        """
+        return await self.fetchall(
+            """
+            WITH ticked AS (
+                UPDATE economy_pets AS p
+                SET mana_residue = GREATEST(p.mana_residue - $1, 0)
+                FROM economy_pets AS o
+                WHERE o.guild_id = p.guild_id AND o.user_id = p.user_id AND o.mana_residue > 0
+                RETURNING p.guild_id, p.user_id, o.mana_residue AS mana_before, p.mana_residue
+            )
+            SELECT guild_id, user_id, mana_residue = 0 AS died FROM ticked
+            WHERE mana_residue = 0 OR (mana_residue <= 5 AND mana_before > 5)
+            """,
+            mana
+        )
+
     def _get_default_object(self, pet_type: str) -> Pet:
         try:
             pet = self._serialized_pets.copy()[pet_type]
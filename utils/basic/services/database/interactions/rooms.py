@@ -1,4 +1,6 @@
+import asyncio
 from datetime import timedelta
+from typing import Optional
 
 from asyncpg import Record
 from disnake import Member, MessageInteraction
@@ -6,6 +8,7 @@ from disnake.utils import utcnow
 
 from utils.basic.services.database import ChisatoPool
 from utils.basic.services.database.handlers import Database
+from utils.dataclasses import RoomHub, TempRoom
 
 
 class RoomsDB(Database):
@@ -20,34 +23,119 @@ class RoomsDB(Database):
 
         self.bot = self.this_pool.client
 
+        # Registry of the hubs and temporary rooms, rooms_temp_data is written through it
+        self._hubs: dict[int, RoomHub] = {}
+        self._rooms: dict[int, TempRoom] = {}
+        self._leaders: dict[tuple[int, int], int] = {}
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+
+    async def load(self) -> None:
+        """
+        Loads every hub and temporary room into the registry, once.
+
+        Returns:
+            None
+        """
+        if self._loaded:
+            return
+
+        async with self._load_lock:
+            if self._loaded or not self.this_pool.connected:
+                return
+
+            hubs = await self.fetchall('SELECT guild_id, founder, love_room, message_id FROM rooms_guild_settings')
+            rooms = await self.fetchall('SELECT guild_id, voice_id, leader, is_love FROM rooms_temp_data')
+            if not self.this_pool.connected:
+                return
+
+            # Entries registered before the load are newer than the rows, they are kept
+            for row in hubs:
+                self._hubs.setdefault(
+                    row['guild_id'],
+                    RoomHub(
+                        guild_id=row['guild_id'], founder=row['founder'],
+                        love_room=row['love_room'], message_id=row['message_id']
+                    )
+                )
+            for row in rooms:
+                if row['voice_id'] not in self._rooms:
+                    self._register(
+                        TempRoom(
+                            guild_id=row['guild_id'], voice_id=row['voice_id'],
+                            leader=row['leader'], is_love=bool(row['is_love'])
+                        )
+                    )
+
+            self._loaded = True
+
+    def invalidate(self, guild: int) -> None:
+        """
+        Drops the hub and the temporary rooms of a guild from the registry.
+
+        Args:
+            guild (int): The ID of the guild.
+
+        Returns:
+            None
+        """
+        self._hubs.pop(guild, None)
+        for room in self.rooms_of(guild):
+            self._unregister(room.voice_id)
+
+    def _register(self, room: TempRoom) -> None:
+        self._rooms[room.voice_id] = room
+        self._leaders[(room.guild_id, room.leader)] = room.voice_id
+
+    def _unregister(self, voice: int) -> Optional[TempRoom]:
+        if room := self._rooms.pop(voice, None):
+            if self._leaders.get((room.guild_id, room.leader)) == voice:
+                del self._leaders[(room.guild_id, room.leader)]
+        return room
+
+    async def get_hub(self, guild: int) -> Optional[RoomHub]:
+        await self.load()
+        return self._hubs.get(guild)
+
+    async def panels(self) -> list[tuple[int, Optional[int]]]:
+        await self.load()
+        return [(hub.guild_id, hub.message_id) for hub in self._hubs.values()]
+
+    def rooms_of(self, guild: int) -> list[TempRoom]:
+        return [room for room in self._rooms.values() if room.guild_id == guild]
+
+    def guilds_with_rooms(self) -> set[int]:
+        return {room.guild_id for room in self._rooms.values()}
+
     async def create_room(self, guild: int, voice: int, user: Member) -> None:
+        self._register(TempRoom(guild_id=guild, voice_id=voice, leader=user.id))
         await self.execute(
             'INSERT INTO rooms_temp_data(guild_id, voice_id, leader) VALUES($1, $2, $3)',
             guild, voice, user.id
         )
 
     async def create_love_room(self, guild: int, voice: int, user: Member) -> None:
+        self._register(TempRoom(guild_id=guild, voice_id=voice, leader=user.id, is_love=True))
         await self.execute(
             'INSERT INTO rooms_temp_data(guild_id, voice_id, leader, is_love) VALUES($1, $2, $3, True)',
             guild, voice, user.id
         )
 
-    async def temp_room_values(self, guild: int, user: int) -> Record | None:
-        return await self.fetchrow(
-            'SELECT * FROM rooms_temp_data WHERE guild_id=$1 AND leader=$2',
-            guild, user
-        )
+    async def temp_room_values(self, guild: int, user: int) -> Optional[TempRoom]:
+        await self.load()
+        if (voice := self._leaders.get((guild, user))) is None:
+            return None
+        return self._rooms.get(voice)
 
     async def is_love_room(self, interaction: MessageInteraction) -> bool:
-        return await self.fetchval(
-            "SELECT is_love FROM rooms_temp_data WHERE guild_id=$1 AND voice_id=$2",
-            interaction.guild.id, interaction.author.voice.channel.id
-        )
+        room = await self.temp_room_values_with_channel(interaction.guild.id, interaction.author.voice.channel.id)
+        return bool(room and room.is_love)
 
-    async def temp_room_values_with_channel(self, guild: int, channel: int) -> Record | None:
-        return await self.fetchrow(
-            'SELECT * FROM rooms_temp_data WHERE guild_id=$1 AND voice_id=$2', guild, channel
-        )
+    async def temp_room_values_with_channel(self, guild: int, channel: int) -> Optional[TempRoom]:
+        await self.load()
+        if (room := self._rooms.get(channel)) and room.guild_id == guild:
+            return room
+        return None
 
     async def settings_room_insert(self, guild: int, user: Member, room_naming: int = None,
                                    limit_user: int = None) -> None:
@@ -109,6 +197,7 @@ class RoomsDB(Database):
         )
 
     async def remove_room(self, guild: int, voice: int) -> None:
+        self._unregister(voice)
         await self.execute(
             'DELETE FROM rooms_temp_data WHERE guild_id=$1 AND voice_id=$2',
             guild, voice
@@ -123,6 +212,7 @@ class RoomsDB(Database):
         return await self.fetchrow('SELECT * FROM rooms_guild_settings WHERE guild_id=$1', guild)
 
     async def room_setup_remove(self, guild: int) -> None:
+        self._hubs.pop(guild, None)
         await self.execute(
             'DELETE FROM rooms_guild_settings WHERE guild_id=$1', guild
         )
@@ -130,12 +220,9 @@ class RoomsDB(Database):
     async def room_settings_remove(self, guild: int) -> None:
         await self.execute('DELETE FROM rooms_users_setting WHERE guild_id=$1', guild)
 
-    async def rooms_voice_channels_fetch(self, guild: int) -> list[Record]:
-        return await self.fetchall(
-            'SELECT * FROM rooms_temp_data WHERE guild_id=$1', guild
-        )
-
     async def rooms_remove_rooms(self, guild: int) -> None:
+        for room in self.rooms_of(guild):
+            self._unregister(room.voice_id)
         await self.execute('DELETE FROM rooms_temp_data WHERE guild_id=$1', guild)
 
     async def room_req_add(self, guild: int, voice: int) -> None:
@@ -166,6 +253,9 @@ class RoomsDB(Database):
         )
 
     async def room_update_leader(self, guild: int, voice: int, new_leader: int) -> None:
+        if room := self._unregister(voice):
+            room.leader = new_leader
+            self._register(room)
         await self.execute(
             "UPDATE rooms_temp_data SET leader=$1 WHERE guild_id=$2 AND voice_id=$3",
             new_leader, guild, voice
@@ -175,6 +265,9 @@ class RoomsDB(Database):
             self, guild: int, voice_channel: int, msg_id: int, category: int, text_channel: int,
             love_channel: int | None
     ) -> None:
+        self._hubs[guild] = RoomHub(
+            guild_id=guild, founder=voice_channel, love_room=love_channel, message_id=msg_id
+        )
         await self.execute(
             """
             INSERT INTO rooms_guild_settings(guild_id, category, founder, message_id, channel, love_room) 
@@ -187,6 +280,8 @@ class RoomsDB(Database):
             self, guild: int, msg_id: int
     ) -> bool:
         if await self.fetchall('select message_id from rooms_guild_settings where guild_id=$1', guild):
+            if hub := self._hubs.get(guild):
+                hub.message_id = msg_id
             await self.execute('update rooms_guild_settings set message_id=$1 where guild_id=$2', msg_id, guild)
             return True
         return False
@@ -195,6 +290,8 @@ class RoomsDB(Database):
             self, guild: int, love_id: int = None
     ) -> bool:
         if await self.fetchall('select love_room from rooms_guild_settings where guild_id=$1', guild):
+            if hub := self._hubs.get(guild):
+                hub.love_room = love_id
             await self.execute(
                 'update rooms_guild_settings set love_room=$1 where guild_id=$2',
                 love_id, guild
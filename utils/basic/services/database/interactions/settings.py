@@ -1,16 +1,20 @@
 import ast
-import asyncio
 
 from asyncpg import Record
 from disnake import Guild
 
 from utils.basic.services.database import ChisatoPool
-from utils.basic.services.database.handlers import Database
+from utils.basic.services.database.handlers import Database, EnsureRow, TTLCache
 
 
 class SettingsDB(Database):
     __slots__ = (
         "bot",
+        "_ensure_main",
+        "_ensure_logs",
+        "_main_cache",
+        "_logs_cache",
+        "_permissions_cache"
     )
 
     cluster: str = "settings"
@@ -18,40 +22,46 @@ class SettingsDB(Database):
     def __init__(self, pool: ChisatoPool) -> None:
         super().__init__(pool=pool)
         self.bot = self.this_pool.client
-        self._lock = asyncio.Lock()
+        self._ensure_main = EnsureRow(self, "settings_main", "guild_id")
+        self._ensure_logs = EnsureRow(self, "settings_logs", "guild_id")
 
-    async def _check_if_in_db(self, *, guild: int) -> None:
+        self._main_cache = TTLCache(max_size=20000, ttl=600)
+        self._logs_cache = TTLCache(max_size=20000, ttl=600)
+        self._permissions_cache = TTLCache(max_size=50000, ttl=600)
+
+    def invalidate(self, guild: int) -> None:
+        """
+        :param guild: int, guild_id
+        :return: None, but drops every cached setting of the guild
+        """
+        self._main_cache.invalidate(guild)
+        self._logs_cache.invalidate(guild)
+        self._permissions_cache.invalidate_where(lambda key: key[0] == guild)
+
+    async def _check_if_in_db(self, *, guild: int) -> Record | None:
         """
         :param guild: integer
-        :return: None, but insert new row in database with guild
+        :return: row of the guild, inserted in database if it was missing
         """
-        async with self._lock:
-            await self.execute(
-                """
-                INSERT INTO settings_main (guild_id)
-                SELECT $1
-                WHERE NOT EXISTS (SELECT 1 FROM settings_main WHERE guild_id = $1)
-                """,
-                guild
-            )
+        if (row := self._main_cache.get(guild)) is None:
+            if row := await self._ensure_main(guild):
+                self._main_cache.put(guild, row)
+
+        return row
 
     async def get(self, *, guild: int) -> Record | None:
         """
         :param guild: int
         :return: tuple obj with all information in table with this guild
         """
-        await self._check_if_in_db(guild=guild)
-
-        return await self.fetchrow('select * from settings_main where guild_id=$1', guild)
+        return await self._check_if_in_db(guild=guild)
 
     async def get_lang(self, *, guild: int) -> str:
         """
         :param guild: int, guild_id
         :return: language
         """
-        await self._check_if_in_db(guild=guild)
-
-        if values := await self.fetchrow('select * from settings_main where guild_id=$1', guild):
+        if values := await self._check_if_in_db(guild=guild):
             return values[3]
         else:
             return 'ru'
@@ -72,12 +82,14 @@ class SettingsDB(Database):
             _language = await self.fetchval('select language from settings_main where guild_id=$1', guild)
 
             await self.execute('update settings_main set language=$1 where guild_id=$2', language, guild)
+            self._main_cache.invalidate(guild)
             return False if _language else True
 
         if banner:
             banner_name = await self.fetchrow('select banner from settings_main where guild_id=$1', guild)
 
             await self.execute('update settings_main set banner=$1 where guild_id=$2', banner, guild)
+            self._main_cache.invalidate(guild)
             return False if banner_name else True
 
     async def remove(
@@ -95,12 +107,14 @@ class SettingsDB(Database):
         if banner:
             if await self.fetchval('select banner from settings_main where guild_id=$1', guild):
                 await self.execute('update settings_main set banner=NULL where guild_id=$1', guild)
+                self._main_cache.invalidate(guild)
                 return True
             return False
 
         if economy:
             if await self.fetchval('select economy from settings_main where guild_id=$1', guild):
                 await self.execute('update settings_main set economy=False where guild_id=$1', guild)
+                self._main_cache.invalidate(guild)
                 return True
             return False
 
@@ -120,13 +134,25 @@ class SettingsDB(Database):
             else:
                 await self.execute('update settings_main set economy=True where guild_id=$1', guild)
 
-    async def _check_in_settings_logs(self, guild: Guild) -> None:
-        if not await self.fetchval('select guild_id from settings_logs where guild_id=$1', guild.id):
-            await self.execute('insert into settings_logs(guild_id) values ($1)', guild.id)
+            self._main_cache.invalidate(guild)
+
+    async def _check_in_settings_logs(self, guild: Guild) -> Record | None:
+        if (row := self._logs_cache.get(guild.id)) is None:
+            if row := await self._ensure_logs(guild.id):
+                self._logs_cache.put(guild.id, row)
+
+        return row
 
     async def get_logs_settings(self, guild: Guild) -> Record:
-        await self._check_in_settings_logs(guild=guild)
-        return await self.fetchrow("select * from settings_logs where guild_id=$1", guild.id)
+        return await self._check_in_settings_logs(guild=guild)
+
+    async def get_all_logs_settings(self) -> list[Record]:
+        return await self.fetchall(
+            """
+            select * from settings_logs
+            where coalesce(server_status, channels_status, members_status, messages_status, automod_status) is not null
+            """
+        )
 
     async def switch_logs(
             self,
@@ -181,17 +207,22 @@ class SettingsDB(Database):
                     'update settings_logs set automod_status=$1 where guild_id=$2', messages_status, guild.id
                 )
 
+        self._logs_cache.invalidate(guild.id)
+        self.bot.dispatch("logs_settings_update", guild, await self._check_in_settings_logs(guild=guild))
+
     async def set_permission_to_command(self, cmd_name: str, *, guild: int, roles: list[int]) -> None:
         if not await self.get_permissions(cmd_name=cmd_name, guild=guild):
-            return await self.execute(
+            await self.execute(
                 'insert into settings_permissions_roles(guild_id, command_name, roles_ids) VALUES ($1, $2, $3)',
                 guild, cmd_name, str(roles)
             )
+        else:
+            await self.execute(
+                'update settings_permissions_roles set roles_ids=$1 where guild_id=$2 and command_name=$3',
+                str(roles), guild, cmd_name
+            )
 
-        await self.execute(
-            'update settings_permissions_roles set roles_ids=$1 where guild_id=$2 and command_name=$3',
-            str(roles), guild, cmd_name
-        )
+        self._permissions_cache.invalidate((guild, cmd_name))
 
     async def get_all_permissions(self, guild: int) -> list[Record]:
         return await self.fetchall(
@@ -199,12 +230,17 @@ class SettingsDB(Database):
         )
 
     async def get_permissions(self, cmd_name: str, *, guild: int) -> list[int]:
-        c = await self.fetchval(
-            'select roles_ids from settings_permissions_roles where command_name=$1 and guild_id=$2',
-            cmd_name, guild
-        )
+        if (roles := self._permissions_cache.get((guild, cmd_name))) is None:
+            c = await self.fetchval(
+                'select roles_ids from settings_permissions_roles where command_name=$1 and guild_id=$2',
+                cmd_name, guild
+            )
+
+            roles = ast.literal_eval(c) if c else []
+            if self.this_pool.connected:
+                self._permissions_cache.put((guild, cmd_name), roles)
 
-        return ast.literal_eval(c) if c else []
+        return list(roles)
 
     async def get_guilds_with_banners(self) -> list[Record]:
         return await self.fetchall(
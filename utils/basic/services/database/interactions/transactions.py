@@ -1,7 +1,13 @@
-from asyncpg import Record
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from asyncpg import Record, PostgresError
+from disnake.ext.tasks import loop
+from loguru import logger
 
 from utils.basic.services.database import ChisatoPool
 from utils.basic.services.database.handlers import Database
+from utils.enviroment import env
 from utils.i18n import ChisatoLocalStore
 
 _t = ChisatoLocalStore.load("./cogs/economy/simple.py")
@@ -12,10 +18,18 @@ class TransactionsDB(Database):
         "bot"
     )
 
+    INCOMING: str = "eco.transaction.true"
+    OUTGOING: str = "eco.transaction.false"
+
+    COMPACT_BATCH: int = 5000
+
     def __init__(self, pool: ChisatoPool) -> None:
         super().__init__(pool=pool)
         self.bot = self.this_pool.client
 
+        if env.TRANSACTIONS_RETENTION_DAYS > 0:
+            self._compact_task.start()
+
     async def add(
             self, guild: int, user: int, amount: int,
             locale_key: str, typing: bool
@@ -24,17 +38,167 @@ class TransactionsDB(Database):
             await self.execute(
                 """
                 INSERT INTO economy_transactions(
-                    guild_id, user_id, amount, 
+                    guild_id, user_id, amount,
                     type, description
-                ) 
+                )
                 VALUES ($1, $2, $3, $4, $5)
                 """,
                 guild, user, amount,
-                f"eco.transaction.{str(typing).lower()}",
+                self.INCOMING if typing else self.OUTGOING,
                 locale_key
             )
 
-    async def get_all(self, guild: int, user: int) -> list[Record] | None:
+    async def count(self, guild: int, user: int) -> int:
+        """
+        Counts the transactions of a member that are still kept in the ledger.
+
+        Args:
+            guild (int): The ID of the guild.
+            user (int): The ID of the member.
+
+        Returns:
+            int: The number of transactions.
+        """
+        return await self.fetchval(
+            'SELECT COUNT(*) FROM economy_transactions WHERE guild_id = $1 AND user_id = $2', guild, user
+        ) or 0
+
+    async def get_page(
+            self, guild: int, user: int, limit: int = 10,
+            before: Optional[int] = None, after: Optional[int] = None
+    ) -> list[Record]:
+        """
+        Reads one page of the transactions of a member, the newest first.
+
+        Pages are addressed by the id of a neighbouring transaction instead of an offset,
+        so every page is a single range scan of the (guild_id, user_id, id) index.
+
+        Args:
+            guild (int): The ID of the guild.
+            user (int): The ID of the member.
+            limit (int): The size of the page.
+            before (Optional[int]): Reads the transactions older than this id.
+            after (Optional[int]): Reads the transactions newer than this id, 0 reads the oldest page.
+
+        Returns:
+            list[Record]: The transactions with their id, amount, type, description and created_at.
+        """
+        if after is not None:
+            rows = await self.fetchall(
+                """
+                SELECT id, amount, type, description, created_at
+                FROM economy_transactions
+                WHERE guild_id = $1 AND user_id = $2 AND id > $3
+                ORDER BY id
+                LIMIT $4
+                """,
+                guild, user, after, limit
+            )
+            return rows[::-1]
+
+        if before is not None:
+            return await self.fetchall(
+                """
+                SELECT id, amount, type, description, created_at
+                FROM economy_transactions
+                WHERE guild_id = $1 AND user_id = $2 AND id < $3
+                ORDER BY id DESC
+                LIMIT $4
+                """,
+                guild, user, before, limit
+            )
+
         return await self.fetchall(
-            'SELECT * FROM economy_transactions WHERE guild_id =$1 AND user_id =$2', guild, user
+            """
+            SELECT id, amount, type, description, created_at
+            FROM economy_transactions
+            WHERE guild_id = $1 AND user_id = $2
+            ORDER BY id DESC
+            LIMIT $3
+            """,
+            guild, user, limit
+        )
+
+    async def get_summary(self, guild: int, user: int) -> Record | None:
+        """
+        Gets the totals of the transactions of a member that were rolled out of the ledger.
+
+        Args:
+            guild (int): The ID of the guild.
+            user (int): The ID of the member.
+
+        Returns:
+            Record | None: The transactions, incoming, outgoing and until columns, or None.
+        """
+        return await self.fetchrow(
+            """
+            SELECT transactions, incoming, outgoing, until
+            FROM economy_transactions_summary
+            WHERE guild_id = $1 AND user_id = $2
+            """,
+            guild, user
         )
+
+    async def compact(self, older_than: timedelta) -> int:
+        """
+        Rolls the transactions older than `older_than` into the per-member summaries.
+
+        Every batch deletes the rows and adds them to the summaries in one statement,
+        so a transaction is never counted twice or lost, even with several bots compacting.
+
+        Args:
+            older_than (timedelta): The age after which a transaction is compacted.
+
+        Returns:
+            int: The number of compacted transactions.
+        """
+        until = datetime.now(timezone.utc) - older_than
+        compacted = 0
+        while self.this_pool.connected:
+            moved = await self.fetchval(
+                """
+                WITH moved AS (
+                    DELETE FROM economy_transactions
+                    WHERE id IN (
+                        SELECT id FROM economy_transactions
+                        WHERE created_at < $1
+                        ORDER BY id
+                        LIMIT $2
+                        FOR UPDATE SKIP LOCKED
+                    )
+                    RETURNING guild_id, user_id, amount, type, created_at
+                ), summed AS (
+                    INSERT INTO economy_transactions_summary AS summary (
+                        guild_id, user_id, transactions, incoming, outgoing, until
+                    )
+                    SELECT guild_id, user_id, COUNT(*),
+                           COALESCE(SUM(amount) FILTER (WHERE type = $3), 0),
+                           COALESCE(SUM(amount) FILTER (WHERE type <> $3), 0),
+                           MAX(created_at)
+                    FROM moved
+                    GROUP BY guild_id, user_id
+                    ON CONFLICT (guild_id, user_id) DO UPDATE SET
+                        transactions = summary.transactions + excluded.transactions,
+                        incoming = summary.incoming + excluded.incoming,
+                        outgoing = summary.outgoing + excluded.outgoing,
+                        until = GREATEST(summary.until, excluded.until)
+                )
+                SELECT COUNT(*) FROM moved
+                """,
+                until, self.COMPACT_BATCH, self.INCOMING
+            )
+            compacted += moved or 0
+            if not moved or moved < self.COMPACT_BATCH:
+                break
+
+        if compacted:
+            logger.info(f"Compacted {compacted} transactions older than {until:%Y-%m-%d}")
+
+        return compacted
+
+    @loop(hours=1)
+    async def _compact_task(self) -> None:
+        try:
+            await self.compact(timedelta(days=env.TRANSACTIONS_RETENTION_DAYS))
+        except PostgresError as e:
+            logger.error(f"Transactions compaction failed: {type(e).__name__}: {e}")
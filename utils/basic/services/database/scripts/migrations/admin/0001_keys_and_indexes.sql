@@ -0,0 +1,24 @@
+WITH merged AS (DELETE FROM analytics_commands_all_time RETURNING command, uses)
+INSERT
+INTO analytics_commands_all_time(command, uses)
+SELECT command, SUM(uses)
+FROM merged
+WHERE command IS NOT NULL
+GROUP BY command;
+
+ALTER TABLE analytics_commands_all_time
+    ADD PRIMARY KEY (command);
+
+WITH merged AS (DELETE FROM analytics_commands_per_day RETURNING command, uses)
+INSERT
+INTO analytics_commands_per_day(command, uses)
+SELECT command, SUM(uses)
+FROM merged
+WHERE command IS NOT NULL
+GROUP BY command;
+
+ALTER TABLE analytics_commands_per_day
+    ADD PRIMARY KEY (command);
+
+ALTER TABLE analytics_logs
+    ADD PRIMARY KEY (id);
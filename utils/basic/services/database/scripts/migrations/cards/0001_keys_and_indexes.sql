@@ -0,0 +1,42 @@
+DELETE
+FROM cards_main
+WHERE user_id IS NULL;
+
+DELETE
+FROM cards_main
+WHERE ctid IN (SELECT ctid
+               FROM (SELECT ctid, ROW_NUMBER() OVER (PARTITION BY user_id ORDER BY ctid) AS rn
+                     FROM cards_main) AS duplicates
+               WHERE duplicates.rn > 1);
+
+ALTER TABLE cards_main
+    ADD PRIMARY KEY (user_id);
+
+ALTER TABLE cards_store
+    ADD PRIMARY KEY (id);
+
+CREATE INDEX IF NOT EXISTS cards_store_user_id_idx
+    ON cards_store (user_id);
+
+ALTER TABLE cards_trades
+    ADD PRIMARY KEY (id);
+
+CREATE INDEX IF NOT EXISTS cards_trades_card_id_idx
+    ON cards_trades (card_id);
+
+CREATE INDEX IF NOT EXISTS cards_trades_to_card_id_idx
+    ON cards_trades (to_card_id);
+
+DELETE
+FROM cards_timely
+WHERE user_id IS NULL;
+
+DELETE
+FROM cards_timely
+WHERE ctid IN (SELECT ctid
+               FROM (SELECT ctid, ROW_NUMBER() OVER (PARTITION BY user_id ORDER BY ctid) AS rn
+                     FROM cards_timely) AS duplicates
+               WHERE duplicates.rn > 1);
+
+ALTER TABLE cards_timely
+    ADD PRIMARY KEY (user_id);
@@ -0,0 +1,67 @@
+DELETE
+FROM economy_main
+WHERE guild_id IS NULL OR user_id IS NULL;
+
+DELETE
+FROM economy_main
+WHERE ctid IN (SELECT ctid
+               FROM (SELECT ctid, ROW_NUMBER() OVER (PARTITION BY guild_id, user_id ORDER BY ctid) AS rn
+                     FROM economy_main) AS duplicates
+               WHERE duplicates.rn > 1);
+
+ALTER TABLE economy_main
+    ADD PRIMARY KEY (guild_id, user_id);
+
+DELETE
+FROM economy_bank
+WHERE guild_id IS NULL OR user_id IS NULL;
+
+DELETE
+FROM economy_bank
+WHERE ctid IN (SELECT ctid
+               FROM (SELECT ctid, ROW_NUMBER() OVER (PARTITION BY guild_id, user_id ORDER BY ctid) AS rn
+                     FROM economy_bank) AS duplicates
+               WHERE duplicates.rn > 1);
+
+ALTER TABLE economy_bank
+    ADD PRIMARY KEY (guild_id, user_id);
+
+DELETE
+FROM economy_pets
+WHERE guild_id IS NULL OR user_id IS NULL;
+
+DELETE
+FROM economy_pets
+WHERE ctid IN (SELECT ctid
+               FROM (SELECT ctid, ROW_NUMBER() OVER (PARTITION BY guild_id, user_id ORDER BY ctid) AS rn
+                     FROM economy_pets) AS duplicates
+               WHERE duplicates.rn > 1);
+
+ALTER TABLE economy_pets
+    ADD PRIMARY KEY (guild_id, user_id);
+
+DELETE
+FROM economy_shop
+WHERE guild_id IS NULL OR role_id IS NULL;
+
+DELETE
+FROM economy_shop
+WHERE ctid IN (SELECT ctid
+               FROM (SELECT ctid, ROW_NUMBER() OVER (PARTITION BY guild_id, role_id ORDER BY ctid) AS rn
+                     FROM economy_shop) AS duplicates
+               WHERE duplicates.rn > 1);
+
+ALTER TABLE economy_shop
+    ADD PRIMARY KEY (guild_id, role_id);
+
+ALTER TABLE economy_marry
+    ADD PRIMARY KEY (marry_id);
+
+CREATE INDEX IF NOT EXISTS economy_marry_guild_id_user1_id_idx
+    ON economy_marry (guild_id, user1_id);
+
+CREATE INDEX IF NOT EXISTS economy_marry_guild_id_user2_id_idx
+    ON economy_marry (guild_id, user2_id);
+
+CREATE INDEX IF NOT EXISTS economy_transactions_guild_id_user_id_idx
+    ON economy_transactions (guild_id, user_id);
@@ -0,0 +1,2 @@
+CREATE INDEX IF NOT EXISTS economy_main_guild_id_money_user_id_idx
+    ON economy_main (guild_id, money DESC, user_id);
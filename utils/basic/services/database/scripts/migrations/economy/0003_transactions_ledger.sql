@@ -0,0 +1,22 @@
+ALTER TABLE economy_transactions
+    ADD COLUMN IF NOT EXISTS id         BIGSERIAL PRIMARY KEY,
+    ADD COLUMN IF NOT EXISTS created_at TIMESTAMPTZ NOT NULL DEFAULT NOW();
+
+DROP INDEX IF EXISTS economy_transactions_guild_id_user_id_idx;
+
+CREATE INDEX IF NOT EXISTS economy_transactions_guild_id_user_id_id_idx
+    ON economy_transactions (guild_id, user_id, id DESC);
+
+CREATE INDEX IF NOT EXISTS economy_transactions_created_at_idx
+    ON economy_transactions USING BRIN (created_at);
+
+CREATE TABLE IF NOT EXISTS economy_transactions_summary
+(
+    guild_id     BIGINT,
+    user_id      BIGINT,
+    transactions BIGINT      DEFAULT 0,
+    incoming     BIGINT      DEFAULT 0,
+    outgoing     BIGINT      DEFAULT 0,
+    until        TIMESTAMPTZ DEFAULT NOW(),
+    PRIMARY KEY (guild_id, user_id)
+);
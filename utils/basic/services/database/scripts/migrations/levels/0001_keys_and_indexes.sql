@@ -0,0 +1,41 @@
+DELETE
+FROM levels_main
+WHERE guild_id IS NULL OR user_id IS NULL;
+
+DELETE
+FROM levels_main
+WHERE ctid IN (SELECT ctid
+               FROM (SELECT ctid, ROW_NUMBER() OVER (PARTITION BY guild_id, user_id ORDER BY prestige DESC, level DESC, exp_now DESC, ctid) AS rn
+                     FROM levels_main) AS duplicates
+               WHERE duplicates.rn > 1);
+
+ALTER TABLE levels_main
+    ADD PRIMARY KEY (guild_id, user_id);
+
+DELETE
+FROM levels_settings
+WHERE guild_id IS NULL;
+
+DELETE
+FROM levels_settings
+WHERE ctid IN (SELECT ctid
+               FROM (SELECT ctid, ROW_NUMBER() OVER (PARTITION BY guild_id ORDER BY ctid) AS rn
+                     FROM levels_settings) AS duplicates
+               WHERE duplicates.rn > 1);
+
+ALTER TABLE levels_settings
+    ADD PRIMARY KEY (guild_id);
+
+DELETE
+FROM levels_prestige_rewards
+WHERE guild_id IS NULL OR prestige_id IS NULL;
+
+DELETE
+FROM levels_prestige_rewards
+WHERE ctid IN (SELECT ctid
+               FROM (SELECT ctid, ROW_NUMBER() OVER (PARTITION BY guild_id, prestige_id ORDER BY ctid) AS rn
+                     FROM levels_prestige_rewards) AS duplicates
+               WHERE duplicates.rn > 1);
+
+ALTER TABLE levels_prestige_rewards
+    ADD PRIMARY KEY (guild_id, prestige_id);
@@ -0,0 +1,64 @@
+CREATE INDEX IF NOT EXISTS moderation_global_warns_guild_id_member_id_idx
+    ON moderation_global_warns (guild_id, member_id);
+
+CREATE INDEX IF NOT EXISTS moderation_global_warns_guild_id_warning_id_idx
+    ON moderation_global_warns (guild_id, warning_id);
+
+DELETE
+FROM moderation_global_warns_settings
+WHERE guild_id IS NULL;
+
+DELETE
+FROM moderation_global_warns_settings
+WHERE ctid IN (SELECT ctid
+               FROM (SELECT ctid, ROW_NUMBER() OVER (PARTITION BY guild_id ORDER BY ctid) AS rn
+                     FROM moderation_global_warns_settings) AS duplicates
+               WHERE duplicates.rn > 1);
+
+ALTER TABLE moderation_global_warns_settings
+    ADD PRIMARY KEY (guild_id);
+
+DELETE
+FROM moderation_global_bans
+WHERE guild_id IS NULL OR member_id IS NULL;
+
+DELETE
+FROM moderation_global_bans
+WHERE ctid IN (SELECT ctid
+               FROM (SELECT ctid, ROW_NUMBER() OVER (PARTITION BY guild_id, member_id ORDER BY ctid) AS rn
+                     FROM moderation_global_bans) AS duplicates
+               WHERE duplicates.rn > 1);
+
+ALTER TABLE moderation_global_bans
+    ADD PRIMARY KEY (guild_id, member_id);
+
+CREATE INDEX IF NOT EXISTS moderation_global_bans_unban_time_idx
+    ON moderation_global_bans (unban_time);
+
+DELETE
+FROM moderation_global_reports_settings
+WHERE guild_id IS NULL;
+
+DELETE
+FROM moderation_global_reports_settings
+WHERE ctid IN (SELECT ctid
+               FROM (SELECT ctid, ROW_NUMBER() OVER (PARTITION BY guild_id ORDER BY ctid) AS rn
+                     FROM moderation_global_reports_settings) AS duplicates
+               WHERE duplicates.rn > 1);
+
+ALTER TABLE moderation_global_reports_settings
+    ADD PRIMARY KEY (guild_id);
+
+DELETE
+FROM moderation_stats
+WHERE guild_id IS NULL OR member_id IS NULL;
+
+DELETE
+FROM moderation_stats
+WHERE ctid IN (SELECT ctid
+               FROM (SELECT ctid, ROW_NUMBER() OVER (PARTITION BY guild_id, member_id ORDER BY ctid) AS rn
+                     FROM moderation_stats) AS duplicates
+               WHERE duplicates.rn > 1);
+
+ALTER TABLE moderation_stats
+    ADD PRIMARY KEY (guild_id, member_id);
@@ -0,0 +1,14 @@
+CREATE INDEX IF NOT EXISTS music_last_listened_user_id_listened_idx
+    ON music_last_listened (user_id, listened);
+
+ALTER TABLE music_playlists
+    ADD PRIMARY KEY (uid);
+
+CREATE INDEX IF NOT EXISTS music_playlists_user_id_idx
+    ON music_playlists (user_id);
+
+ALTER TABLE music_tracks
+    ADD PRIMARY KEY (uid);
+
+CREATE INDEX IF NOT EXISTS music_tracks_encoded_idx
+    ON music_tracks USING hash (encoded);
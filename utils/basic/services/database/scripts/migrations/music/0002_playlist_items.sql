@@ -0,0 +1,20 @@
+CREATE TABLE IF NOT EXISTS music_playlist_items
+(
+    uid         BIGSERIAL PRIMARY KEY,
+    playlist_id BIGINT           NOT NULL REFERENCES music_playlists (uid) ON DELETE CASCADE,
+    track_id    BIGINT           NOT NULL REFERENCES music_tracks (uid),
+    position    DOUBLE PRECISION NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS music_playlist_items_playlist_id_position_idx
+    ON music_playlist_items (playlist_id, position);
+
+INSERT INTO music_playlist_items (playlist_id, track_id, position)
+SELECT music_playlists.uid, music_tracks.uid, items.position
+FROM music_playlists,
+     LATERAL regexp_matches(music_playlists.tracks, '(\d+)', 'g') WITH ORDINALITY AS items(track_id, position)
+         JOIN music_tracks ON music_tracks.uid = items.track_id[1]::BIGINT
+ORDER BY music_playlists.uid, items.position;
+
+ALTER TABLE music_playlists
+    DROP COLUMN tracks;
@@ -0,0 +1,37 @@
+ALTER TABLE music_tracks
+    ADD COLUMN IF NOT EXISTS hash BYTEA;
+
+UPDATE music_tracks
+SET hash = sha256(convert_to(encoded, 'UTF8'))
+WHERE hash IS NULL AND encoded IS NOT NULL;
+
+DELETE
+FROM music_playlist_items
+WHERE track_id IN (SELECT uid FROM music_tracks WHERE encoded IS NULL);
+
+DELETE
+FROM music_tracks
+WHERE encoded IS NULL;
+
+UPDATE music_playlist_items
+SET track_id = canonical.uid
+FROM music_tracks
+         JOIN (SELECT hash, MIN(uid) AS uid FROM music_tracks GROUP BY hash) AS canonical
+              ON canonical.hash = music_tracks.hash
+WHERE music_playlist_items.track_id = music_tracks.uid
+  AND music_tracks.uid <> canonical.uid;
+
+DELETE
+FROM music_tracks
+WHERE uid NOT IN (SELECT MIN(uid) FROM music_tracks GROUP BY hash);
+
+ALTER TABLE music_tracks
+    ALTER COLUMN hash SET NOT NULL,
+    ALTER COLUMN encoded SET NOT NULL;
+
+CREATE UNIQUE INDEX IF NOT EXISTS music_tracks_hash_idx
+    ON music_tracks (hash);
+
+DROP INDEX IF EXISTS music_tracks_encoded_idx;
+
+DROP FUNCTION IF EXISTS add_track_if_not_exists(VARCHAR);
@@ -0,0 +1,10 @@
+DROP TRIGGER IF EXISTS music_last_trigger ON music_last_listened;
+
+DROP FUNCTION IF EXISTS music_last_trigger();
+
+DELETE
+FROM music_last_listened
+WHERE ctid IN (SELECT ctid
+               FROM (SELECT ctid, ROW_NUMBER() OVER (PARTITION BY user_id ORDER BY listened DESC) AS rn
+                     FROM music_last_listened) AS history
+               WHERE history.rn > 10);
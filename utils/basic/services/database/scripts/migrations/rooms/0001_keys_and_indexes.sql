@@ -0,0 +1,47 @@
+DELETE
+FROM rooms_users_setting
+WHERE guild_id IS NULL OR user_id IS NULL;
+
+DELETE
+FROM rooms_users_setting
+WHERE ctid IN (SELECT ctid
+               FROM (SELECT ctid, ROW_NUMBER() OVER (PARTITION BY guild_id, user_id ORDER BY ctid) AS rn
+                     FROM rooms_users_setting) AS duplicates
+               WHERE duplicates.rn > 1);
+
+ALTER TABLE rooms_users_setting
+    ADD PRIMARY KEY (guild_id, user_id);
+
+DELETE
+FROM rooms_temp_data
+WHERE voice_id IS NULL;
+
+DELETE
+FROM rooms_temp_data
+WHERE ctid IN (SELECT ctid
+               FROM (SELECT ctid, ROW_NUMBER() OVER (PARTITION BY voice_id ORDER BY ctid) AS rn
+                     FROM rooms_temp_data) AS duplicates
+               WHERE duplicates.rn > 1);
+
+ALTER TABLE rooms_temp_data
+    ADD PRIMARY KEY (voice_id);
+
+CREATE INDEX IF NOT EXISTS rooms_temp_data_guild_id_leader_idx
+    ON rooms_temp_data (guild_id, leader);
+
+CREATE INDEX IF NOT EXISTS rooms_temp_data_requests_time_idx
+    ON rooms_temp_data (requests_time);
+
+DELETE
+FROM rooms_guild_settings
+WHERE guild_id IS NULL;
+
+DELETE
+FROM rooms_guild_settings
+WHERE ctid IN (SELECT ctid
+               FROM (SELECT ctid, ROW_NUMBER() OVER (PARTITION BY guild_id ORDER BY ctid) AS rn
+                     FROM rooms_guild_settings) AS duplicates
+               WHERE duplicates.rn > 1);
+
+ALTER TABLE rooms_guild_settings
+    ADD PRIMARY KEY (guild_id);
@@ -0,0 +1,41 @@
+DELETE
+FROM settings_main
+WHERE guild_id IS NULL;
+
+DELETE
+FROM settings_main
+WHERE ctid IN (SELECT ctid
+               FROM (SELECT ctid, ROW_NUMBER() OVER (PARTITION BY guild_id ORDER BY ctid) AS rn
+                     FROM settings_main) AS duplicates
+               WHERE duplicates.rn > 1);
+
+ALTER TABLE settings_main
+    ADD PRIMARY KEY (guild_id);
+
+DELETE
+FROM settings_logs
+WHERE guild_id IS NULL;
+
+DELETE
+FROM settings_logs
+WHERE ctid IN (SELECT ctid
+               FROM (SELECT ctid, ROW_NUMBER() OVER (PARTITION BY guild_id ORDER BY ctid) AS rn
+                     FROM settings_logs) AS duplicates
+               WHERE duplicates.rn > 1);
+
+ALTER TABLE settings_logs
+    ADD PRIMARY KEY (guild_id);
+
+DELETE
+FROM settings_permissions_roles
+WHERE guild_id IS NULL OR command_name IS NULL;
+
+DELETE
+FROM settings_permissions_roles
+WHERE ctid IN (SELECT ctid
+               FROM (SELECT ctid, ROW_NUMBER() OVER (PARTITION BY guild_id, command_name ORDER BY ctid) AS rn
+                     FROM settings_permissions_roles) AS duplicates
+               WHERE duplicates.rn > 1);
+
+ALTER TABLE settings_permissions_roles
+    ADD PRIMARY KEY (guild_id, command_name);
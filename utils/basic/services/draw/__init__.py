@@ -1,3 +1,4 @@
 from .consts import DEFAULT_AVATAR
 from .exceptions import *
+from .health import BreakerState, DrawHealth
 from .service import DrawService
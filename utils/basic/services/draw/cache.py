@@ -1,23 +1,153 @@
+from __future__ import annotations
+
+import os
+from collections import OrderedDict
+from pathlib import Path
+from time import monotonic, time
 from typing import Optional
 
+import aiofiles
 from disnake.ext.tasks import loop
+from loguru import logger
 
 
 class Cache:
-    def __init__(self) -> None:
-        self._cac: dict[str, str] = {}
+    def __init__(
+            self,
+            max_bytes: int = 64 * 1024 * 1024,
+            ttl: float = 600.0,
+            negative_ttl: float = 60.0,
+            directory: Optional[str] = None,
+            disk_ttl: float = 7 * 24 * 60 * 60
+    ) -> None:
+        """
+        Least recently used cache of rendered images, bounded by their total size.
+
+        Every entry expires after `ttl` seconds. Failed renders are remembered for `negative_ttl`
+        seconds. With a `directory` the images are also stored on disk for `disk_ttl` seconds and
+        survive restarts, a failed disk write only leaves the image in memory.
+
+        Args:
+            max_bytes (int): The memory budget in bytes.
+            ttl (float): The lifetime of an image in seconds.
+            negative_ttl (float): The lifetime of a failed render in seconds.
+            directory (Optional[str]): The directory of the disk tier, disabled if None.
+            disk_ttl (float): The lifetime of an image on disk in seconds.
+        """
+        self._cac: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._failed: dict[str, tuple[float, str]] = {}
+        self._size = 0
+
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+        self._disk_ttl = disk_ttl
+
+        self._directory = Path(directory) if directory else None
+        if self._directory:
+            self._directory.mkdir(parents=True, exist_ok=True)
 
         self._clear.start()
 
-    def put(self, key: str, value: str) -> None:
-        self._cac[key] = value
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def _path(self, key: str) -> Path:
+        return self._directory / f"{key}.png"
+
+    def _pop(self, key: str) -> None:
+        if entry := self._cac.pop(key, None):
+            self._size -= len(entry[1])
+
+    def _put_memory(self, key: str, value: bytes, expires: float) -> None:
+        if len(value) > self._max_bytes:
+            return
+
+        self._pop(key)
+        self._cac[key] = (expires, value)
+        self._size += len(value)
+
+        while self._size > self._max_bytes:
+            _, (_, evicted) = self._cac.popitem(last=False)
+            self._size -= len(evicted)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        if entry := self._cac.get(key):
+            expires, value = entry
+            if expires >= monotonic():
+                self._cac.move_to_end(key)
+                return value
+
+            self._pop(key)
 
-    def get(self, key: str) -> Optional[str]:
-        return self._cac.get(key)
+        if self._directory:
+            path = self._path(key)
+            try:
+                if time() - path.stat().st_mtime >= self._disk_ttl:
+                    path.unlink(missing_ok=True)
+                    return None
+
+                async with aiofiles.open(path, 'rb') as f:
+                    value = await f.read()
+            except FileNotFoundError:
+                return None
+            except OSError as e:
+                logger.warning(f"Draw cache could not read {key} from disk: {type(e).__name__}: {e}")
+                return None
+
+            self._put_memory(key, value, monotonic() + self._ttl)
+            return value
+
+        return None
+
+    async def put(self, key: str, value: bytes) -> None:
+        self._failed.pop(key, None)
+        self._put_memory(key, value, monotonic() + self._ttl)
+
+        if self._directory:
+            tmp = self._path(key).with_suffix(".tmp")
+            try:
+                async with aiofiles.open(tmp, 'wb') as f:
+                    await f.write(value)
+                os.replace(tmp, self._path(key))
+            except OSError as e:
+                logger.warning(f"Draw cache could not write {key} to disk: {type(e).__name__}: {e}")
+
+    def get_failed(self, key: str) -> Optional[str]:
+        if entry := self._failed.get(key):
+            expires, message = entry
+            if expires >= monotonic():
+                return message
+
+            del self._failed[key]
+
+        return None
+
+    def put_failed(self, key: str, message: str) -> None:
+        self._failed[key] = (monotonic() + self._negative_ttl, message)
 
     def remove(self, key: str) -> None:
-        del self._cac[key]
+        self._pop(key)
+        if self._directory:
+            try:
+                self._path(key).unlink(missing_ok=True)
+            except OSError as e:
+                logger.warning(f"Draw cache could not remove {key} from disk: {type(e).__name__}: {e}")
 
     @loop(minutes=10)
     async def _clear(self) -> None:
-        self._cac.clear()
+        now = monotonic()
+        for key in [key for key, (expires, _) in self._cac.items() if expires < now]:
+            self._pop(key)
+
+        for key in [key for key, (expires, _) in self._failed.items() if expires < now]:
+            del self._failed[key]
+
+        if self._directory:
+            for path in self._directory.glob("*.png"):
+                try:
+                    if time() - path.stat().st_mtime >= self._disk_ttl:
+                        path.unlink(missing_ok=True)
+                except OSError:
+                    pass
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+from enum import Enum
+from time import monotonic
+from typing import Optional, TYPE_CHECKING
+
+from aiohttp import ClientError
+from disnake.ext.tasks import loop
+from loguru import logger
+
+from utils.basic.helpers import EmbedUI
+from utils.consts import ERROR_EMOJI, SUCCESS_EMOJI
+from utils.enviroment import env
+
+if TYPE_CHECKING:
+    from utils.basic import ChisatoBot
+
+__all__ = (
+    "BreakerState",
+    "DrawHealth",
+)
+
+
+class BreakerState(Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class DrawHealth:
+    def __init__(
+            self,
+            url: str,
+            failure_threshold: int = 3,
+            recovery_timeout: float = 30.0,
+            probe_timeout: float = 2.0
+    ) -> None:
+        """
+        Circuit breaker over the render API, fed by a background prober and by the draw requests themselves.
+
+        After `failure_threshold` consecutive failures the breaker opens and `available` turns False.
+        Once `recovery_timeout` seconds passed it becomes half-open: the next request or probe decides
+        whether it closes again or reopens. An outage is reported to the webhook once, when it starts,
+        and once more when the API recovers.
+
+        Args:
+            url (str): The status endpoint of the render API.
+            failure_threshold (int): The consecutive failures needed to open the breaker.
+            recovery_timeout (float): The seconds the breaker stays open before a new attempt.
+            probe_timeout (float): The timeout of a probe request in seconds.
+        """
+        self._bot: Optional[ChisatoBot] = None
+        self._url = url
+        self._state = BreakerState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._outage_started: Optional[datetime] = None
+
+        self._failure_threshold = failure_threshold
+        self._recovery_timeout = recovery_timeout
+        self._probe_timeout = probe_timeout
+
+    @property
+    def state(self) -> BreakerState:
+        if self._state is BreakerState.OPEN and monotonic() - self._opened_at >= self._recovery_timeout:
+            self._state = BreakerState.HALF_OPEN
+
+        return self._state
+
+    @property
+    def available(self) -> bool:
+        return self.state is not BreakerState.OPEN
+
+    def start(self, bot: ChisatoBot) -> None:
+        self._bot = bot
+        if not self._probe.is_running():
+            self._probe.start()
+
+    def stop(self) -> None:
+        self._probe.cancel()
+
+    def record_success(self) -> None:
+        self._failures = 0
+        if self._state is BreakerState.CLOSED:
+            return
+
+        self._state = BreakerState.CLOSED
+        logger.info("Draw API recovered, circuit closed")
+
+        if started := self._outage_started:
+            self._outage_started = None
+            self._alert(
+                EmbedUI(
+                    title=f"{SUCCESS_EMOJI} API снова доступно",
+                    description=f"> **Недоступно с:** {started} | `{started.timestamp()}`\n"
+                                f"> **Время:** {(n := datetime.now())} | `{n.timestamp()}`"
+                )
+            )
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self.state is BreakerState.HALF_OPEN or (
+                self._state is BreakerState.CLOSED and self._failures >= self._failure_threshold
+        ):
+            self._state = BreakerState.OPEN
+            self._opened_at = monotonic()
+            logger.warning(f"Draw API is not responding, circuit opened for {self._recovery_timeout}s")
+
+            if self._outage_started is None:
+                self._outage_started = datetime.now()
+                self._alert(
+                    EmbedUI(
+                        title=f"{ERROR_EMOJI} Проблема с API",
+                        description=f"> **Причина:** `API не дает ответа.`\n"
+                                    f"> **Время:** {(n := self._outage_started)} | `{n.timestamp()}`"
+                    )
+                )
+
+    def _alert(self, embed: EmbedUI) -> None:
+        if self._bot and self._bot.user and self._bot.user.id == env.MAIN_ID:
+            asyncio.create_task(self._bot.webhooks.post({"embed": embed}, type="command"))
+
+    @loop(seconds=10)
+    async def _probe(self) -> None:
+        if self.state is BreakerState.OPEN:
+            return
+
+        try:
+            async with self._bot.session.get(url=self._url, timeout=self._probe_timeout) as response:
+                healthy = response.status < 500
+        except (ClientError, asyncio.TimeoutError):
+            healthy = False
+
+        if healthy:
+            self.record_success()
+        else:
+            self.record_failure()
@@ -1,29 +1,29 @@
 import asyncio
 import base64
+import hashlib
 import json
 import secrets
-from datetime import datetime
 from inspect import Traceback
 from io import BytesIO
 from json import JSONDecodeError
 from typing import Final
 
-from aiohttp import ClientSession, ClientConnectorError
+from aiohttp import ClientSession, ClientError
 from disnake import File
 
 from utils.abstract import AbstractService
-from utils.basic import EmbedUI
-from utils.basic.chisato import ChisatoBot
 from utils.basic.services.draw.cache import Cache
 from utils.basic.services.draw.exceptions import DrawBadRequest
+from utils.basic.services.draw.health import DrawHealth
 from utils.basic.services.draw.types import ContentType
-from utils.consts import ERROR_EMOJI
 from utils.enviroment import env
 
 
 class DrawService(AbstractService):
-    __cache: Cache = Cache()
+    __cache: Cache = Cache(directory=env.DRAW_CACHE_DIR)
+    __in_flight: dict[str, asyncio.Future[bytes]] = {}
     BASE: Final[str] = env.DSU + "/v1"
+    health: Final[DrawHealth] = DrawHealth(BASE + "/status")
 
     def __init__(self, client: ClientSession = None) -> None:
         self._client = client or ClientSession()
@@ -36,15 +36,15 @@ class DrawService(AbstractService):
 
     @classmethod
     def __encode_key(cls, **kwargs: any) -> str:
-        data = json.dumps(kwargs)
-        return base64.b64encode(data.encode()).decode()
+        data = json.dumps(kwargs, sort_keys=True, default=str)
+        return hashlib.sha256(data.encode()).hexdigest()
 
     @classmethod
     def _decode_image(
-            cls, encode_base64: str, content_type: ContentType
+            cls, image: bytes, content_type: ContentType
     ) -> File | bytes:
         if content_type == ContentType.FILE:
-            buffer = BytesIO(base64.b64decode(encode_base64))
+            buffer = BytesIO(image)
             buffer.seek(0)
 
             file = File(buffer, f"{secrets.token_hex(6)}.png")
@@ -52,7 +52,34 @@ class DrawService(AbstractService):
             buffer.close()
             return file
         elif content_type == ContentType.BYTES:
-            return base64.b64decode(encode_base64)
+            return image
+
+    async def _request_image(self, image_name: str, **kwargs) -> bytes:
+        try:
+            response = await self._client.get(
+                url=self.BASE + "/draw",
+                params={**kwargs, "name": image_name},
+                timeout=10
+            )
+        except (ClientError, asyncio.TimeoutError):
+            self.health.record_failure()
+            raise
+
+        async with response:
+            if response.status >= 500:
+                self.health.record_failure()
+            else:
+                self.health.record_success()
+
+            if response.status != 200:
+                try:
+                    response_text = (await response.json()).get("message")
+                except JSONDecodeError:
+                    response_text = await response.text(encoding="utf-8")
+
+                raise DrawBadRequest(response_text)
+
+            return base64.b64decode((await response.json()).get("encode"))
 
     async def draw_image(
             self,
@@ -61,37 +88,38 @@ class DrawService(AbstractService):
             cache: bool = True,
             **kwargs
     ) -> File | bytes:
-        if _selected := self.__cache.get(
-                self.__encode_key(image_name=image_name, **kwargs)
-        ):
-            try:
-                return self._decode_image(_selected, content_type=content_type)
-            except FileNotFoundError:
-                self.__cache.remove(self.__encode_key(image_name=image_name, **kwargs))
-                return await self.draw_image(
-                    image_name,
-                    content_type=content_type,
-                    cache=cache,
-                    **kwargs
-                )
+        if not cache:
+            return self._decode_image(await self._request_image(image_name, **kwargs), content_type=content_type)
+
+        key = self.__encode_key(image_name=image_name, **kwargs)
+        if (image := await self.__cache.get(key)) is not None:
+            return self._decode_image(image, content_type=content_type)
+
+        if (message := self.__cache.get_failed(key)) is not None:
+            raise DrawBadRequest(message)
+
+        if future := self.__in_flight.get(key):
+            return self._decode_image(await asyncio.shield(future), content_type=content_type)
+
+        future = self.__in_flight[key] = self._loop.create_future()
+        try:
+            image = await self._request_image(image_name, **kwargs)
+        except Exception as e:
+            if isinstance(e, DrawBadRequest):
+                self.__cache.put_failed(key, str(e))
+
+            future.set_exception(e)
+            future.exception()  # Mark as retrieved, the waiters re-raise it themselves
+            raise
         else:
-            async with self._client.get(
-                    url=self.BASE + "/draw",
-                    params={**kwargs, "name": image_name},
-                    timeout=10
-            ) as response:
-                if response.status != 200:
-                    try:
-                        response_text = (await response.json()).get("message")
-                    except JSONDecodeError:
-                        response_text = await response.text(encoding="utf-8")
-
-                    raise DrawBadRequest(response_text)
-
-                _path = (await response.json()).get("encode")
-                if cache:
-                    self.__cache.put(self.__encode_key(image_name=image_name, **kwargs), _path)
-                return self._decode_image(_path, content_type=content_type)
+            future.set_result(image)
+            await self.__cache.put(key, image)
+        finally:
+            if not future.done():
+                future.cancel()
+            self.__in_flight.pop(key, None)
+
+        return self._decode_image(image, content_type=content_type)
 
     async def get_stats(self) -> dict[str]:
         async with self._client.get(url=self.BASE + "/stats") as response:
@@ -99,25 +127,3 @@ class DrawService(AbstractService):
                 raise DrawBadRequest((await response.json()).get("message"))
 
             return await response.json()
-
-    async def get_status(self) -> bool:
-        try:
-            async with self._client.get(url=self.BASE + "/status", timeout=0.5):
-                pass
-        except (ClientConnectorError, TimeoutError):
-            bot = ChisatoBot.from_cache()
-            if env.MAIN_ID == bot.user.id:
-                await bot.webhooks.post(
-                    type="command",
-                    data={
-                        "embed": EmbedUI(
-                            title=f"{ERROR_EMOJI} Проблема с API",
-                            description=f"> **Причина:** `API не дает ответа.`\n"
-                                        f"> **Время:** {datetime.now()} | `{datetime.now().timestamp()}`"
-                        )
-                    }
-                )
-
-            return False
-        else:
-            return True
@@ -1,3 +1,5 @@
 from .card_item import CardItem
 from .pet import Pet
 from .work import Work
+from .leaderboard import LeaderboardEntry, LeaderboardPosition
+from .rooms import RoomHub, TempRoom
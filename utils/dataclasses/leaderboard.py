@@ -0,0 +1,26 @@
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+@dataclass(kw_only=True)
+class LeaderboardEntry:
+    user_id: int
+    money: int
+    rank: int
+
+
+@dataclass(kw_only=True)
+class LeaderboardPosition:
+    rank: int
+    money: int
+    # The number of members of the guild, only counted when asked for
+    total: Optional[int] = None
+    above: list[LeaderboardEntry] = field(default_factory=list)
+    below: list[LeaderboardEntry] = field(default_factory=list)
+
+    @property
+    def percentile(self) -> Optional[float]:
+        """The share of members this member is ahead of, in percent, None if the members were not counted"""
+        if self.total is None:
+            return None
+        return 100.0 if self.total <= 1 else (self.total - self.rank) / (self.total - 1) * 100
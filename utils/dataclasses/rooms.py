@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(kw_only=True)
+class RoomHub:
+    guild_id: int
+    founder: int
+    love_room: Optional[int] = None
+    message_id: Optional[int] = None
+
+
+@dataclass(kw_only=True)
+class TempRoom:
+    guild_id: int
+    voice_id: int
+    leader: int
+    is_love: bool = False
@@ -30,4 +30,9 @@ env = Environment(
 
     SDC_TOKEN=str(getenv("SDC_TOKEN")),
     BOTICORD_TOKEN=str(getenv("BOTICORD_TOKEN")),
+
+    DRAW_CACHE_DIR=getenv("DRAW_CACHE_DIR") or None,
+    DATABASE_JOURNAL=getenv("DATABASE_JOURNAL") or "./database.journal",
+    SLOW_QUERY_MS=int(getenv("SLOW_QUERY_MS") or 250),
+    TRANSACTIONS_RETENTION_DAYS=int(getenv("TRANSACTIONS_RETENTION_DAYS") or 180),
 )
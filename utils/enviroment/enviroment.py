@@ -23,3 +23,8 @@ class Environment:
 
     BOTICORD_TOKEN: str
     SDC_TOKEN: str
+
+    DRAW_CACHE_DIR: str | None = None
+    DATABASE_JOURNAL: str = "./database.journal"
+    SLOW_QUERY_MS: int = 250
+    TRANSACTIONS_RETENTION_DAYS: int = 180
@@ -1,14 +1,31 @@
+from __future__ import annotations
+
+import asyncio
 import re
+from typing import Any, Optional
 
 import aiohttp
-from disnake import Webhook
+from disnake import Webhook, HTTPException, Embed
 from loguru import logger
 
 from utils.enviroment import env
 
 
 class WebhookSender:
-    def __init__(self) -> None:
+    MAX_EMBEDS: int = 10
+    MAX_EMBEDS_LENGTH: int = 6000
+
+    def __init__(self, queue_size: int = 100) -> None:
+        """
+        Delivers webhook messages in the background over one shared connection pool.
+
+        Every destination has its own bounded queue and worker, so a slow or rate limited
+        webhook never blocks the caller or the other destinations. Queued messages that only
+        carry embeds are merged into a single request, up to 10 embeds per message.
+
+        Args:
+            queue_size (int): The maximum number of pending messages per destination.
+        """
         self._from_type = {
             'command': env.COMMAND_ERROR_WEBHOOK,
             'translation': env.COMMAND_ERROR_WEBHOOK,
@@ -16,7 +33,11 @@ class WebhookSender:
             'day_statistic': env.DAY_STATISTIC_WEBHOOK,
             'shard_control': env.SHARDS_CONTROL_WEBHOOK
         }
-        self._headers = {'Content-Type': 'multipart/form-data'}
+        self._queue_size = queue_size
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._queues: dict[str, asyncio.Queue[dict[str, Any]]] = {}
+        self._workers: dict[str, asyncio.Task] = {}
 
     @staticmethod
     def _is_reference(uri: str) -> bool:
@@ -24,7 +45,21 @@ class WebhookSender:
             re.compile(r'https?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+').match(uri)
         )
 
+    @property
+    def pending(self) -> int:
+        return sum(queue.qsize() for queue in self._queues.values())
+
     async def post(self, data: dict, *, type: str) -> bool:
+        """
+        Queues a message for delivery.
+
+        Args:
+            data (dict): The keyword arguments of `Webhook.send`.
+            type (str): The destination name or a webhook url.
+
+        Returns:
+            bool: Whether the message was queued.
+        """
         if not self._is_reference(type):
             try:
                 type = self._from_type[type]
@@ -32,8 +67,111 @@ class WebhookSender:
                 logger.error(f'Webhook ({type}) url not found!')
                 return False
 
-        async with aiohttp.ClientSession() as session:
-            webhook = Webhook.from_url(type, session=session)
-            await webhook.send(**data)
+        if (queue := self._queues.get(type)) is None:
+            queue = self._queues[type] = asyncio.Queue(maxsize=self._queue_size)
+
+        if type not in self._workers or self._workers[type].done():
+            self._workers[type] = asyncio.create_task(self._worker(type, queue))
+
+        try:
+            queue.put_nowait(data)
+        except asyncio.QueueFull:
+            logger.warning(f'Webhook queue is full, message dropped ({queue.qsize()} pending)')
+            return False
 
         return True
+
+    @staticmethod
+    def _embeds(data: dict[str, Any]) -> Optional[list[Embed]]:
+        """
+        Returns the embeds of a message that can be merged with others.
+
+        Args:
+            data (dict[str, Any]): The keyword arguments of `Webhook.send`.
+
+        Returns:
+            Optional[list[Embed]]: The embeds, or None if the message carries anything else.
+        """
+        if set(data) - {'embed', 'embeds'}:
+            return None
+
+        return [data['embed']] if 'embed' in data else list(data.get('embeds', []))
+
+    def _coalesce(
+            self, data: dict[str, Any], queue: asyncio.Queue[dict[str, Any]]
+    ) -> tuple[dict[str, Any], int, Optional[dict[str, Any]]]:
+        """
+        Merges the following embed-only messages of the queue into the first one.
+
+        Args:
+            data (dict[str, Any]): The first message.
+            queue (asyncio.Queue[dict[str, Any]]): The queue of the destination.
+
+        Returns:
+            tuple[dict[str, Any], int, Optional[dict[str, Any]]]: The message to send, the number of queue
+            items it covers and the message taken from the queue that could not be merged, sent next.
+        """
+        if (embeds := self._embeds(data)) is None:
+            return data, 1, None
+
+        count, length = 1, sum(map(len, embeds))
+        while True:
+            try:
+                held = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return {'embeds': embeds}, count, None
+
+            following = self._embeds(held)
+            if (
+                    following is None
+                    or len(embeds) + len(following) > self.MAX_EMBEDS
+                    or length + sum(map(len, following)) > self.MAX_EMBEDS_LENGTH
+            ):
+                return {'embeds': embeds}, count, held
+
+            embeds += following
+            length += sum(map(len, following))
+            count += 1
+
+    async def _worker(self, url: str, queue: asyncio.Queue[dict[str, Any]]) -> None:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+
+        # The webhook adapter waits on the X-RateLimit headers and retries 429 responses itself
+        webhook = Webhook.from_url(url, session=self._session)
+        held: Optional[dict[str, Any]] = None
+        while True:
+            data, count, held = self._coalesce(held if held is not None else await queue.get(), queue)
+            try:
+                await webhook.send(**data)
+            except HTTPException as e:
+                logger.error(f'Webhook message was not delivered: {e}')
+            except aiohttp.ClientError as e:
+                logger.error(f'Webhook is unreachable: {e}')
+            except Exception as e:
+                logger.error(f'Webhook message was dropped: {type(e).__name__}: {e}')
+            finally:
+                for _ in range(count):
+                    queue.task_done()
+
+    async def close(self, timeout: float = 5.0) -> None:
+        """
+        Delivers the pending messages and closes the connection pool.
+
+        Args:
+            timeout (float): The maximum time to wait for pending messages in seconds.
+
+        Returns:
+            None
+        """
+        try:
+            await asyncio.wait_for(asyncio.gather(*(queue.join() for queue in self._queues.values())), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f'{self.pending} webhook messages were not delivered before shutdown')
+
+        for worker in self._workers.values():
+            worker.cancel()
+        self._workers.clear()
+
+        if self._session:
+            await self._session.close()
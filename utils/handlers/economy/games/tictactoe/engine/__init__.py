@@ -1,2 +1,3 @@
+from .bitboard import BitboardEngine
 from .board import Board
 from .minimax import MinimaxEngine
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import asyncio
+import random
+from time import monotonic
+from typing import Optional, TYPE_CHECKING
+
+from .enums import Symbol
+
+Square = int
+Score = int
+
+if TYPE_CHECKING:
+    from . import Board
+
+__all__ = (
+    "BitboardEngine",
+)
+
+_WIN: Score = 1_000_000
+_EXACT, _LOWER, _UPPER = 0, 1, 2
+
+
+class _Timeout(Exception):
+    pass
+
+
+class BitboardEngine:
+    MAX_TABLE_SIZE: int = 500_000
+
+    def __init__(
+            self, ai: Symbol, size: int = 3,
+            time_budget: float = 1.5, max_depth: Optional[int] = None
+    ) -> None:
+        """
+        Negamax search with alpha-beta pruning over integer bitboards.
+
+        Every side is one integer with a bit per square, a line is won when its precomputed mask
+        is fully set. Positions already searched are kept in a transposition table for the whole
+        game, and the search deepens one ply at a time until `time_budget` runs out, so the engine
+        stays responsive on 4x4 and 5x5 boards where a full search is out of reach.
+
+        Args:
+            ai (Symbol): The symbol the engine plays.
+            size (int): The side of the board.
+            time_budget (float): The maximum thinking time per move in seconds.
+            max_depth (Optional[int]): The maximum search depth, the whole game by default.
+        """
+        self.ai = ai
+        self.foe = Symbol.CROSS if ai == Symbol.CIRCLE else Symbol.CIRCLE
+        self.size = size
+        self.time_budget = time_budget
+
+        self._cells = size * size
+        self._full = (1 << self._cells) - 1
+        self._max_depth = max_depth or self._cells
+
+        self._masks: list[int] = self._win_masks(size)
+        self._lines_of: list[list[int]] = [
+            [mask for mask in self._masks if mask >> square & 1] for square in range(self._cells)
+        ]
+        # Squares on more lines first: the center, then the corners of the diagonals
+        self._order: list[Square] = sorted(range(self._cells), key=lambda square: -len(self._lines_of[square]))
+        # The same order with the move from the transposition table tried first
+        self._order_from: list[list[Square]] = [
+            [first, *(square for square in self._order if square != first)] for first in range(self._cells)
+        ]
+        self._weights: list[Score] = [0] + [4 ** count for count in range(1, size + 1)]
+
+        self._table: dict[int, tuple[int, Score, int, Optional[Square]]] = {}
+        self._deadline = 0.0
+        self._nodes = 0
+
+    @staticmethod
+    def _win_masks(size: int) -> list[int]:
+        rows = [sum(1 << (r * size + c) for c in range(size)) for r in range(size)]
+        cols = [sum(1 << (r * size + c) for r in range(size)) for c in range(size)]
+        diagonals = [
+            sum(1 << (i * size + i) for i in range(size)),
+            sum(1 << (i * size + size - 1 - i) for i in range(size))
+        ]
+        return rows + cols + diagonals
+
+    def bitboards(self, board: Board) -> tuple[int, int]:
+        """
+        Converts a board into the bitboards of the engine and of its opponent.
+
+        Args:
+            board (Board): The board.
+
+        Returns:
+            tuple[int, int]: The squares of the engine and the squares of the opponent.
+        """
+        circles, crosses = board.state
+        return (circles, crosses) if self.ai == Symbol.CIRCLE else (crosses, circles)
+
+    def _evaluate(self, me: int, foe: int) -> Score:
+        score = 0
+        for mask in self._masks:
+            mine, theirs = me & mask, foe & mask
+            if mine and not theirs:
+                score += self._weights[mine.bit_count()]
+            elif theirs and not mine:
+                score -= self._weights[theirs.bit_count()]
+        return score
+
+    def _negamax(self, me: int, foe: int, depth: int, alpha: Score, beta: Score, ply: int) -> Score:
+        self._nodes += 1
+        if not self._nodes & 1023 and monotonic() > self._deadline:
+            raise _Timeout
+
+        occupied = me | foe
+        if occupied == self._full:
+            return 0
+        if depth == 0:
+            return self._evaluate(me, foe)
+
+        key = me << self._cells | foe
+        table_move = None
+        if entry := self._table.get(key):
+            entry_depth, score, flag, table_move = entry
+            if entry_depth >= depth:
+                # Wins are stored as a distance from this node, not from the root
+                if score > _WIN - self._cells:
+                    score -= ply
+                elif score < self._cells - _WIN:
+                    score += ply
+
+                if flag == _EXACT:
+                    return score
+                elif flag == _LOWER:
+                    alpha = max(alpha, score)
+                else:
+                    beta = min(beta, score)
+                if alpha >= beta:
+                    return score
+
+        original_alpha = alpha
+        best, best_move = -_WIN - 1, None
+        for square in self._order if table_move is None else self._order_from[table_move]:
+            bit = 1 << square
+            if occupied & bit:
+                continue
+
+            mine = me | bit
+            if any(mine & mask == mask for mask in self._lines_of[square]):
+                score = _WIN - ply - 1
+            else:
+                score = -self._negamax(foe, mine, depth - 1, -beta, -alpha, ply + 1)
+
+            if score > best:
+                best, best_move = score, square
+            alpha = max(alpha, score)
+            if alpha >= beta:
+                break
+
+        stored = best + ply if best > _WIN - self._cells else best - ply if best < self._cells - _WIN else best
+        flag = _UPPER if best <= original_alpha else _LOWER if best >= beta else _EXACT
+
+        if len(self._table) >= self.MAX_TABLE_SIZE:
+            self._table.clear()
+        self._table[key] = (depth, stored, flag, best_move)
+
+        return best
+
+    def search(self, ai: int, foe: int) -> Optional[Square]:
+        """
+        Finds the best move with iterative deepening, synchronously.
+
+        Args:
+            ai (int): The bitboard of the engine.
+            foe (int): The bitboard of the opponent.
+
+        Returns:
+            Optional[Square]: The best square, or None if the board is full.
+        """
+        empty = [square for square in self._order if not (ai | foe) >> square & 1]
+        if not empty:
+            return None
+        if len(empty) == self._cells:
+            return random.choice(empty)
+
+        self._deadline = monotonic() + self.time_budget
+        self._nodes = 0
+
+        best_move = empty[0]
+        for depth in range(1, min(len(empty), self._max_depth) + 1):
+            try:
+                score = self._negamax(ai, foe, depth, -_WIN - 1, _WIN + 1, 0)
+            except _Timeout:
+                break
+
+            best_move = self._table[ai << self._cells | foe][3]
+            if abs(score) > _WIN - self._cells:
+                break
+
+        return best_move
+
+    async def evaluate_best_move(self, board: Board) -> Optional[Square]:
+        """
+        Finds the best move in a worker thread, so the event loop keeps running while the engine thinks.
+
+        Args:
+            board (Board): The board, the engine is the side to move.
+
+        Returns:
+            Optional[Square]: The best square, or None if the board is full.
+        """
+        return await asyncio.to_thread(self.search, *self.bitboards(board))
@@ -29,9 +29,26 @@ class Board:
         self.table: list[Symbol] = self.get_table()
         self.win_conditions: list[list[Square]] = self.get_win_conditions()
 
+        # Indexes of the win conditions that go through every square
+        self._lines_of: list[list[int]] = [[] for _ in range(self.size ** 2)]
+        for line, condition in enumerate(self.win_conditions):
+            for square in condition:
+                self._lines_of[square].append(line)
+
+        self._reset_counters()
+
         self.first_move: Symbol = Symbol.CIRCLE
         self.turn: Symbol = self.first_move
 
+    def _reset_counters(self) -> None:
+        self._counts: dict[Symbol, list[int]] = {
+            Symbol.CIRCLE: [0] * len(self.win_conditions),
+            Symbol.CROSS: [0] * len(self.win_conditions)
+        }
+        self._bits: dict[Symbol, int] = {Symbol.CIRCLE: 0, Symbol.CROSS: 0}
+        self._completed: set[int] = set()
+        self._empty: int = self.size ** 2
+
     def get_win_conditions(self) -> list[list[Square]]:
         rows, cols = self.get_rows_cols()
         diagonals = self.get_diagonals()
@@ -67,18 +84,38 @@ class Board:
     @property
     def empty_squares(self) -> list[Square]:
         return [
-            square for square in self.squares.values() if self.is_empty(square)
+            square for square, value in enumerate(self.table) if value == Symbol.EMPTY
         ]
 
+    @property
+    def empty_count(self) -> int:
+        return self._empty
+
+    @property
+    def state(self) -> tuple[int, int]:
+        """
+        The position as two bitboards, one bit per square: the circles and the crosses.
+        """
+        return self._bits[Symbol.CIRCLE], self._bits[Symbol.CROSS]
+
+    def serialize(self) -> tuple[int, int, Symbol]:
+        """
+        Returns a compact, hashable snapshot of the position and of the side to move.
+
+        Returns:
+            tuple[int, int, Symbol]: The circles bitboard, the crosses bitboard and the turn.
+        """
+        return *self.state, self.turn
+
     def reset(self) -> None:
         self.table = self.get_table()
+        self._reset_counters()
         self.first_move = Symbol.CROSS if self.first_move == Symbol.CIRCLE else Symbol.CIRCLE
         self.turn = self.first_move
 
     def square_pos(self, square: Square) -> Optional[tuple[int, int]]:
-        for pos, sq in self.squares.items():
-            if sq == square:
-                return pos
+        if 0 <= square < self.size ** 2:
+            return divmod(square, self.size)
         return None
 
     def square_name(self, row: int, col: int) -> Square:
@@ -91,61 +128,84 @@ class Board:
         return self.table[square] == Symbol.EMPTY
 
     def get_connection(self) -> list[Square]:
-        for row in self.win_conditions:
-            checklist = []
-            for square in row:
-                if self.is_empty(square):
-                    continue
-                checklist.append(self.square_value(square))
-            if len(checklist) == self.size and len(set(checklist)) == 1:
-                return row
-        return []
+        if not self._completed:
+            return []
+        return self.win_conditions[min(self._completed)]
 
     def is_draw(self) -> bool:
-        if len(self.empty_squares) == 0 and len(self.get_connection()) == 0:
-            return True
-        return False
+        return self._empty == 0 and not self._completed
+
+    def _winning_symbol(self) -> Optional[Symbol]:
+        if not self._completed:
+            return None
+        return self.table[self.win_conditions[min(self._completed)][0]]
 
     def winner(self) -> Optional[Member | int | str]:
-        connection = self.get_connection()
-        if len(connection) == 0:
+        symbol = self._winning_symbol()
+        if symbol is None:
             return None
-        elif self.square_value(connection[0]) == Symbol.CIRCLE:
+        elif symbol == Symbol.CIRCLE:
             return self.player1
         else:
             return self.player2
 
     def is_gameover(self) -> bool:
-        return self.winner() is not None or self.is_draw()
+        return bool(self._completed) or self._empty == 0
 
     def _update(self) -> None:
         self.turn = Symbol.CROSS if self.turn == Symbol.CIRCLE else Symbol.CIRCLE
-        if self.winner() == Symbol.CIRCLE:
+        symbol = self._winning_symbol()
+        if symbol == Symbol.CIRCLE:
             self.p1_score += 1
-        elif self.winner() == Symbol.CROSS:
+        elif symbol == Symbol.CROSS:
             self.p2_score += 1
 
-    def push(self, square: Square, value: Symbol) -> None:
+    def _place(self, square: Square, value: Symbol) -> None:
         self.table[square] = value
+        self._empty -= 1
+        self._bits[value] |= 1 << square
 
-    def undo(self, square: Square) -> None:
+        counts = self._counts[value]
+        for line in self._lines_of[square]:
+            counts[line] += 1
+            if counts[line] == self.size:
+                self._completed.add(line)
+
+    def _remove(self, square: Square) -> None:
+        value = self.table[square]
         self.table[square] = Symbol.EMPTY
+        self._empty += 1
+        self._bits[value] &= ~(1 << square)
+
+        counts = self._counts[value]
+        for line in self._lines_of[square]:
+            if counts[line] == self.size:
+                self._completed.discard(line)
+            counts[line] -= 1
+
+    def push(self, square: Square, value: Symbol) -> None:
+        if not self.is_empty(square):
+            self._remove(square)
+        if value != Symbol.EMPTY:
+            self._place(square, value)
+
+    def undo(self, square: Square) -> None:
+        if not self.is_empty(square):
+            self._remove(square)
 
     def move(self, square: Square) -> None:
         if square >= self.size ** 2 or square < 0 or not self.is_empty(square):
             logger.warning('TIC-TAC-TOE, INVALID MOVE!')
             return
 
-        self.table[square] = self.turn
+        self._place(square, self.turn)
         self._update()
 
     def get_player_turn(self) -> Member | int | str:
         return self.player1 if self.turn == Symbol.CIRCLE else self.player2
 
     def get(self) -> list:
-        indexes_with_signs = {}
-        for i, square in self.squares.items():
-            indexes_with_signs[i] = str(square) if self.is_empty(square) else "O" if self.square_value(
-                square) == Symbol.CIRCLE else "X"
-
-        return list(indexes_with_signs.items())
+        return [
+            (divmod(square, self.size), str(square) if value == Symbol.EMPTY else value.value)
+            for square, value in enumerate(self.table)
+        ]
@@ -10,7 +10,7 @@ from utils.basic import EmbedUI, EmbedErrorUI, View, IntFormatter
 from utils.consts import REGULAR_CURRENCY, SUCCESS_EMOJI, ERROR_EMOJI
 from utils.consts import TOES_EMOJIS
 from utils.i18n import ChisatoLocalStore
-from ..engine import Board, MinimaxEngine
+from ..engine import Board, BitboardEngine
 from ..engine.enums import Symbol
 
 if TYPE_CHECKING:
@@ -81,17 +81,8 @@ class Game(View):
                             member=self.__b.winner().id,
                             member_pay=self._p2.id if self.__b.winner() != self._p2 else self._p1.id,
                             guild=interaction.guild.id,
-                            amount=self.__b.bid
-                        )
-
-                        await self._bot.databases.transactions.add(
-                            guild=interaction.guild.id, user=self.__b.winner().id, typing=False,
-                            amount=self.__b.bid, locale_key="game.win.tic_tac_toe.transactions"
-                        )
-                        await self._bot.databases.transactions.add(
-                            guild=interaction.guild.id, typing=True,
-                            user=self._p2.id if self.__b.winner() != self._p2 else self._p1.id,
-                            amount=self.__b.bid, locale_key="game.lose.tic_tac_toe.transactions"
+                            amount=self.__b.bid,
+                            locale_keys=("game.win.tic_tac_toe.transactions", "game.lose.tic_tac_toe.transactions")
                         )
 
                     isis = isinstance(self.__b.winner(), Member)
@@ -135,7 +126,7 @@ class Game(View):
         async def make_ai_move(self, interaction: MessageInteraction) -> None:
             if self.__b.get_player_turn() == "ai":
                 await sleep(2)
-                self.__b.move(self.last_view.ai.evaluate_best_move(self.__b))
+                self.__b.move(await self.last_view.ai.evaluate_best_move(self.__b))
 
                 turn = self.__b.get_player_turn()
                 try:
@@ -210,7 +201,9 @@ class Game(View):
 
         self.loc = interaction.guild_locale
         self.board = Board([player2, player1], bid=bid)
-        self.ai = MinimaxEngine(Symbol.CIRCLE, Symbol.CROSS, (self.board.size ** self.board.size) - 1)
+        self.ai = BitboardEngine(
+            Symbol.CIRCLE if self.board.player1 == "ai" else Symbol.CROSS, size=self.board.size
+        )
 
         self._p1 = self.board.player1
         self._p2 = self.board.player2
@@ -279,7 +272,7 @@ class Game(View):
     async def start(self) -> None:
         if self._p1 == "ai" or self._p2 == "ai":
             if self.board.get_player_turn() == "ai":
-                self.board.move(self.ai.evaluate_best_move(self.board))
+                self.board.move(await self.ai.evaluate_best_move(self.board))
 
                 turn = self.board.get_player_turn()
                 await self._interaction.edit_original_response(
@@ -1 +1 @@
-from .owner_alert import OwnerAlertManager
+from .owner_alert import OwnerAlertManager, AlertKind
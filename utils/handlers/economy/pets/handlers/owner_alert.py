@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+from enum import Enum
 from typing import Union, TYPE_CHECKING
 
 from disnake import (
@@ -16,6 +18,8 @@ from disnake import (
     PartialMessageable
 )
 
+from loguru import logger
+
 from utils.basic import (
     EmbedUI
 )
@@ -29,10 +33,57 @@ GuildMessageable = Union[TextChannel, Thread, VoiceChannel, StageChannel]
 _t = ChisatoLocalStore.load("./cogs/economy/pets.py")
 
 
+class AlertKind(Enum):
+    LOW_STAT = "low_stat"
+    REACHED_MAX_LVL = "reached_max_lvl"
+    DIED = "died"
+
+
 class OwnerAlertManager:
-    def __init__(self, bot: ChisatoBot) -> None:
+    def __init__(self, bot: ChisatoBot, queue_size: int = 1000) -> None:
         self.bot: ChisatoBot = bot
 
+        self._queue: asyncio.Queue[tuple[AlertKind, int, int]] = asyncio.Queue(maxsize=queue_size)
+        self._worker: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if not self._worker or self._worker.done():
+            self._worker = asyncio.create_task(self._process_queue())
+
+    def stop(self) -> None:
+        if self._worker:
+            self._worker.cancel()
+
+    def enqueue(self, kind: AlertKind, guild_id: int, member_id: int) -> bool:
+        """
+        Queues an alert for the owner of a pet, the alert is dropped when the queue is full.
+
+        Returns:
+            bool: Whether the alert was queued.
+        """
+        try:
+            self._queue.put_nowait((kind, guild_id, member_id))
+        except asyncio.QueueFull:
+            return False
+        return True
+
+    async def _process_queue(self) -> None:
+        alerts = {
+            AlertKind.LOW_STAT: self.pet_owner_alert_low_stat,
+            AlertKind.REACHED_MAX_LVL: self.pet_owner_alert_reached_max_lvl,
+            AlertKind.DIED: self.pet_owner_alert_died
+        }
+
+        while True:
+            kind, guild_id, member_id = await self._queue.get()
+            try:
+                if (guild := self.bot.get_guild(guild_id)) and (member := guild.get_member(member_id)):
+                    await alerts[kind](member=member, guild=guild)
+            except Exception as e:
+                logger.warning(f"{type(e).__name__}: {e}")
+            finally:
+                self._queue.task_done()
+
     async def send_member(self, member: Member, guild: Guild, embed: Embed) -> None:
         try:
             if await self.bot.databases.pets.owner_alert(guild=guild.id, member=member.id):
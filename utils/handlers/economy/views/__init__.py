@@ -1 +1,2 @@
 from .shop import ShopView
+from .transactions import TransactionsPaginator
@@ -355,22 +355,19 @@ class ShopView(View):
                     if role in interaction.author.roles:
                         raise AlreadyHaveThisSubject
 
-                    await self._bot.databases.economy.remove_balance(
-                        guild=interaction.guild.id,
-                        member=interaction.author.id,
-                        amount=self._item[5]
+                    paid = await self._bot.databases.economy.buy_item(
+                        guild=interaction.guild, member=interaction.author, role=self._item[1],
+                        locale_key="simple.shop.local.role_bought.transaction"
                     )
 
-                    await self._bot.databases.economy.remove_count(
-                        guild=interaction.guild, role=self._item[1]
-                    )
-
-                    await interaction.author.add_roles(role)
-
-                    await self._bot.databases.transactions.add(
-                        guild=interaction.guild.id, user=interaction.author.id, amount=self._item[5],
-                        locale_key="simple.shop.local.role_bought.transaction", typing=False
-                    )
+                    try:
+                        await interaction.author.add_roles(role)
+                    except Forbidden:
+                        await self._bot.databases.economy.refund_item(
+                            guild=interaction.guild, member=interaction.author, role=self._item[1], amount=paid,
+                            locale_key="simple.shop.local.role_refunded.transaction"
+                        )
+                        raise
                 except NotEnoughMoney:
                     return await interaction.response.send_message(
                         embed=EmbedErrorUI(
@@ -382,17 +379,6 @@ class ShopView(View):
                         ), ephemeral=True
                     )
                 except Forbidden:
-                    await self._bot.databases.economy.add_count(
-                        guild=interaction.guild,
-                        role=self._item[1]
-                    )
-
-                    await self._bot.databases.economy.add_balance(
-                        guild=interaction.guild.id,
-                        member=interaction.author.id,
-                        amount=self._item[5]
-                    )
-
                     return await interaction.response.send_message(
                         embed=EmbedErrorUI(
                             description=_t.get(
@@ -403,12 +389,6 @@ class ShopView(View):
                         ), ephemeral=True
                     )
                 except SubjectEnded:
-                    await self._bot.databases.economy.add_balance(
-                        guild=interaction.guild.id,
-                        member=interaction.author.id,
-                        amount=self._item[5]
-                    )
-
                     return await interaction.response.send_message(
                         embed=EmbedErrorUI(
                             description=_t.get(
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
+from asyncpg import Record
+from disnake import ApplicationCommandInteraction, MessageInteraction
+
+from utils.basic import EmbedUI, IntFormatter
+from utils.consts import REGULAR_CURRENCY
+from utils.handlers.pagination import PaginatorView
+from utils.i18n import ChisatoLocalStore
+
+if TYPE_CHECKING:
+    from utils.basic import ChisatoBot
+
+__all__ = (
+    "TransactionsPaginator",
+)
+
+_t = ChisatoLocalStore.load("./cogs/economy/simple.py")
+
+
+class TransactionsPaginator(PaginatorView):
+    PER_PAGE: int = 10
+
+    def __init__(
+            self, interaction: ApplicationCommandInteraction | MessageInteraction,
+            total: int, summary: Optional[Record] = None
+    ) -> None:
+        """
+        Paginator over the ledger of a member that reads every page from the database when it is opened.
+
+        Only the page count is known upfront, the embeds start empty and are filled on demand.
+        A page is read with the id of an already loaded neighbour, so moving to the next or the
+        previous page, or jumping to either end, never scans the pages in between.
+
+        Args:
+            interaction (ApplicationCommandInteraction | MessageInteraction): The interaction of the command.
+            total (int): The number of transactions of the member.
+            summary (Optional[Record]): The totals of the compacted transactions, shown on the last page.
+        """
+        self._bot: ChisatoBot = interaction.bot  # type: ignore
+        self._interaction = interaction
+        self._total = total
+        self._summary = summary
+
+        # The newest and the oldest transaction id of every loaded page
+        self._bounds: dict[int, tuple[int, int]] = {}
+
+        pages = max(1, -(-total // self.PER_PAGE))
+        super().__init__(
+            embeds=[
+                EmbedUI(title=_t.get("simple.transactions.title", locale=interaction.guild_locale))
+                for _ in range(pages)
+            ],
+            author=interaction.author,
+            footer=True,
+            delete_button=True,
+            interaction=interaction
+        )
+
+    @classmethod
+    async def generate(
+            cls, interaction: ApplicationCommandInteraction | MessageInteraction
+    ) -> tuple[TransactionsPaginator | None, EmbedUI | None]:
+        databases = interaction.bot.databases  # type: ignore
+
+        total = await databases.transactions.count(guild=interaction.guild.id, user=interaction.author.id)
+        summary = await databases.transactions.get_summary(guild=interaction.guild.id, user=interaction.author.id)
+        if not total and not summary:
+            return None, None
+
+        view = cls(interaction=interaction, total=total, summary=summary)
+        await view.load(1)
+        return view, view.embeds[0]
+
+    async def load(self, page: int) -> None:
+        """
+        Reads a page from the database into its embed, unless it is already loaded.
+
+        Args:
+            page (int): The number of the page, starting from 1.
+
+        Returns:
+            None
+        """
+        if page in self._bounds:
+            return
+
+        guild, user = self._interaction.guild.id, self._interaction.author.id
+        pages = len(self.embeds)
+
+        if page == 1:
+            rows = await self._bot.databases.transactions.get_page(guild, user, limit=self.PER_PAGE)
+        elif page - 1 in self._bounds:
+            rows = await self._bot.databases.transactions.get_page(
+                guild, user, limit=self.PER_PAGE, before=self._bounds[page - 1][1]
+            )
+        elif page + 1 in self._bounds:
+            rows = await self._bot.databases.transactions.get_page(
+                guild, user, limit=self.PER_PAGE, after=self._bounds[page + 1][0]
+            )
+        else:
+            rows = await self._bot.databases.transactions.get_page(
+                guild, user, limit=self._total - (pages - 1) * self.PER_PAGE, after=0
+            )
+
+        if rows:
+            self._bounds[page] = (rows[0]['id'], rows[-1]['id'])
+
+        locale = self._interaction.guild_locale
+        part = _t.get("simple.transactions.history.part", locale=locale)
+        lines = [
+            part.format(
+                (page - 1) * self.PER_PAGE + i,
+                _t.get(row['type'], locale=locale),
+                IntFormatter(row['amount']).format_number(),
+                REGULAR_CURRENCY,
+                _t.get(row['description'], locale=locale)
+            )
+            for i, row in enumerate(rows, 1)
+        ]
+
+        if page == pages and self._summary:
+            lines.append(
+                _t.get("simple.transactions.summary", locale=locale).format(
+                    self._summary['transactions'],
+                    IntFormatter(self._summary['incoming']).format_number(),
+                    IntFormatter(self._summary['outgoing']).format_number(),
+                    REGULAR_CURRENCY,
+                    f"<t:{int(self._summary['until'].timestamp())}:d>"
+                )
+            )
+
+        self.embeds[page - 1].description = "\n".join(lines)
+
+    async def before_edit_message(self, interaction: MessageInteraction) -> any:
+        await self.load(self.page)
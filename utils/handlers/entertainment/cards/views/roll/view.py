@@ -51,7 +51,7 @@ class CardRollView(View):
             rarity=card.rarity
         )
 
-        if not await DrawService(self._bot.session).get_status():
+        if not DrawService.health.available:
             return await interaction.response.edit_message(
                 embed=EmbedErrorUI(
                     description=_t.get(
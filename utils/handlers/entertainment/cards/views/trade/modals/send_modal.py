@@ -229,7 +229,7 @@ class ModalTrades(ui.Modal):
             )
         )
 
-        if await DrawService(self._bot.session).get_status():
+        if DrawService.health.available:
             embed.set_image(
                 file=await Card.draw_trade_image(cards, bot=self._bot)
             )
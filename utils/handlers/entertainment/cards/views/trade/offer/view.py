@@ -128,7 +128,7 @@ class OfferUI(View):
                 values=generate_func(_l)
             )
         )
-        if _draw and await DrawService(self._bot.session).get_status():
+        if _draw and DrawService.health.available:
             embed.set_image(
                 file=await Card.draw_trade_image(
                     [self._cards[1], self._cards[0]], bot=self._bot
@@ -192,7 +192,7 @@ class OfferUI(View):
                 values=generate_func(_l)
             )
         )
-        if _draw and await DrawService(self._bot.session).get_status():
+        if _draw and DrawService.health.available:
             embed.set_image(
                 file=await Card.draw_trade_image(
                     [self._cards[1], self._cards[0]], bot=self._bot
@@ -208,7 +208,7 @@ class CardTradeMenu(View):
             )
         )
 
-        if await DrawService(self._bot.session).get_status():
+        if DrawService.health.available:
             embed.set_image(file=await Card.draw_trade_image(cards, bot=self._bot))
 
         await interaction.edit_original_response(embed=embed, view=view)
@@ -46,7 +46,7 @@ class PrestigeView(View):
                 guild=interaction.guild.id, member=interaction.author.id
             )
 
-        if not await DrawService(self._bot.session).get_status():
+        if not DrawService.health.available:
             return await interaction.response.edit_message(
                 embed=EmbedErrorUI(
                     description=_t.get(
@@ -33,8 +33,8 @@ class PlayerEmbed:
             text=_t.get("music.player.footer", locale=locale, values=(player.node.identifier,))
         )
 
-        async with DrawService(cls.bot.session) as ir:
-            if await ir.get_status():
+        if DrawService.health.available:
+            async with DrawService(cls.bot.session) as ir:
                 try:
                     file = await ir.draw_image(
                         "music_card",
@@ -1,2 +1,3 @@
 from .check_on_uri import if_uri
+from .idle import IdleScheduler, IdleReason
 from .int_operations import *
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+from dataclasses import dataclass
+from enum import Enum
+from time import monotonic
+from typing import Optional
+
+from lavamystic import Player
+from loguru import logger
+
+__all__ = (
+    "IdleReason",
+    "IdleScheduler"
+)
+
+
+class IdleReason(Enum):
+    EMPTY = 60
+    PAUSED = 600
+
+    @property
+    def timeout(self) -> int:
+        return self.value
+
+
+@dataclass(slots=True)
+class _IdleEntry:
+    player: Player
+    reason: IdleReason
+    deadline: float
+    generation: int
+
+
+class IdleScheduler:
+    def __init__(self) -> None:
+        """
+        Disconnects idle players once their deadline passes.
+
+        Deadlines of every player are kept in one heap, drained by a single task
+        that sleeps until the earliest deadline.
+        """
+        self._entries: dict[int, _IdleEntry] = {}
+        self._heap: list[tuple[float, int, int]] = []
+        self._generation = 0
+
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def idle_count(self) -> int:
+        return len(self._entries)
+
+    def schedule(self, player: Player, reason: IdleReason) -> None:
+        """
+        Starts the idle countdown of a player, a running countdown for the same reason is kept.
+
+        Args:
+            player (Player): The idle player.
+            reason (IdleReason): Why the player is idle.
+        """
+        guild_id = player.guild.id
+        if (entry := self._entries.get(guild_id)) and entry.reason == reason:
+            return
+
+        self._generation += 1
+        entry = self._entries[guild_id] = _IdleEntry(
+            player=player, reason=reason,
+            deadline=monotonic() + reason.timeout,
+            generation=self._generation
+        )
+        heapq.heappush(self._heap, (entry.deadline, guild_id, entry.generation))
+
+        if self._heap[0][2] == entry.generation:
+            self._wakeup.set()
+
+        if not self._task or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def cancel(self, guild_id: int) -> None:
+        self._entries.pop(guild_id, None)
+
+    def close(self) -> None:
+        self._entries.clear()
+        self._heap.clear()
+        if self._task:
+            self._task.cancel()
+
+    async def _run(self) -> None:
+        while self._heap:
+            deadline, guild_id, generation = self._heap[0]
+            if (delay := deadline - monotonic()) > 0:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            heapq.heappop(self._heap)
+            if (entry := self._entries.get(guild_id)) and entry.generation == generation:
+                del self._entries[guild_id]
+                asyncio.create_task(self._expire(entry))
+
+    @staticmethod
+    async def _expire(entry: _IdleEntry) -> None:
+        try:
+            await entry.player.disconnect()
+        except Exception as e:
+            logger.warning(f"Idle player disconnect raised {type(e).__name__}: {e}")
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+from time import monotonic
+from typing import Any, Awaitable, Callable
+
+from disnake import Guild
+from loguru import logger
+
+__all__ = (
+    "BannerScheduler",
+)
+
+BannerInputs = Callable[[Guild, str], dict[str, Any]]
+BannerApply = Callable[[Guild, dict[str, Any]], Awaitable[None]]
+
+
+class BannerScheduler:
+    WORKERS: int = 4
+    INTERVAL: float = 60.0
+    MAX_BACKOFF: float = 3600.0
+
+    def __init__(self, inputs: BannerInputs, apply: BannerApply) -> None:
+        """
+        Renders and uploads guild banners through a bounded pool of workers.
+
+        Every guild is queued at its own offset within the interval, derived from its id, so the
+        renders are spread instead of all starting on the minute. The render inputs are hashed and
+        a banner is only rendered and uploaded when they differ from the last successful upload.
+        A guild whose banner failed waits twice as long after every consecutive failure.
+
+        Args:
+            inputs (BannerInputs): Builds the render inputs of a guild from its banner name.
+            apply (BannerApply): Renders the banner from the inputs and uploads it.
+        """
+        self._inputs = inputs
+        self._apply = apply
+
+        self._queue: asyncio.Queue[tuple[Guild, str]] = asyncio.Queue()
+        self._workers: list[asyncio.Task] = []
+        self._pending: dict[int, asyncio.TimerHandle] = {}
+
+        self._hashes: dict[int, str] = {}
+        self._failures: dict[int, int] = {}
+        self._retry_at: dict[int, float] = {}
+
+    def start(self) -> None:
+        if not self._workers:
+            self._workers = [asyncio.create_task(self._worker()) for _ in range(self.WORKERS)]
+
+    def close(self) -> None:
+        for handle in self._pending.values():
+            handle.cancel()
+        self._pending.clear()
+
+        for worker in self._workers:
+            worker.cancel()
+        self._workers.clear()
+
+    def schedule(self, guild: Guild, banner_name: str) -> bool:
+        """
+        Queues the banner of a guild at the offset of the guild within the interval.
+
+        Args:
+            guild (Guild): The guild.
+            banner_name (str): The name of the banner of the guild.
+
+        Returns:
+            bool: Whether the banner was queued, False if it is already queued or the guild is backing off.
+        """
+        if guild.id in self._pending or self._retry_at.get(guild.id, 0) > monotonic():
+            return False
+
+        delay = (guild.id >> 22) % 1000 / 1000 * self.INTERVAL
+        self._pending[guild.id] = asyncio.get_running_loop().call_later(
+            delay, self._queue.put_nowait, (guild, banner_name)
+        )
+        return True
+
+    @staticmethod
+    def _hash(inputs: dict[str, Any]) -> str:
+        return hashlib.sha256(json.dumps(inputs, sort_keys=True, default=str).encode()).hexdigest()
+
+    async def _worker(self) -> None:
+        while True:
+            guild, banner_name = await self._queue.get()
+            try:
+                await self._run(guild, banner_name)
+            except Exception as e:
+                self._fail(guild, e)
+            finally:
+                self._pending.pop(guild.id, None)
+                self._queue.task_done()
+
+    def _fail(self, guild: Guild, error: Exception) -> None:
+        failures = self._failures[guild.id] = self._failures.get(guild.id, 0) + 1
+        backoff = min(self.MAX_BACKOFF, self.INTERVAL * 2 ** failures)
+        self._retry_at[guild.id] = monotonic() + backoff
+
+        logger.warning(
+            f"Banner of {guild.id} failed {failures} times in a row, next try in {backoff:.0f}s: "
+            f"{type(error).__name__}: {error}"
+        )
+
+    async def _run(self, guild: Guild, banner_name: str) -> None:
+        inputs = self._inputs(guild, banner_name)
+        digest = self._hash(inputs)
+        if self._hashes.get(guild.id) == digest:
+            return
+
+        await self._apply(guild, inputs)
+
+        self._hashes[guild.id] = digest
+        self._failures.pop(guild.id, None)
+        self._retry_at.pop(guild.id, None)
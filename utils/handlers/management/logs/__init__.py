@@ -0,0 +1,2 @@
+from .audit import AuditLogService
+from .dispatcher import LogsDispatcher, LogsCategory
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict, deque
+from datetime import datetime, timezone
+from time import monotonic
+from typing import Optional
+
+from disnake import Guild, AuditLogEntry, AuditLogAction, Forbidden, HTTPException
+
+__all__ = (
+    "AuditLogService",
+)
+
+
+class AuditLogService:
+    BUFFER_SIZE: int = 50
+    FRESHNESS: float = 15.0
+    WAIT_TIMEOUT: float = 2.0
+    REFRESH_INTERVAL: float = 5.0
+
+    def __init__(self) -> None:
+        """
+        Keeps the recent audit log entries of every guild.
+
+        Entries come from `on_audit_log_entry_create`, a listener resolves the actor of an
+        event from them instead of requesting the audit log itself. When the gateway entry
+        does not arrive in time, one request per guild is shared by every waiting listener.
+        """
+        self._entries: defaultdict[int, deque[AuditLogEntry]] = defaultdict(
+            lambda: deque(maxlen=self.BUFFER_SIZE)
+        )
+        self._events: defaultdict[int, asyncio.Event] = defaultdict(asyncio.Event)
+        self._requests: dict[int, asyncio.Task] = {}
+        self._refreshed_at: dict[int, float] = {}
+
+    def add(self, entry: AuditLogEntry) -> None:
+        entries = self._entries[entry.guild.id]
+        if any(cached.id == entry.id for cached in entries):
+            return
+
+        entries.append(entry)
+        if event := self._events.pop(entry.guild.id, None):
+            event.set()
+
+    def forget(self, guild: Guild) -> None:
+        self._entries.pop(guild.id, None)
+        self._refreshed_at.pop(guild.id, None)
+
+    def _find(
+            self, guild: Guild, action: Optional[AuditLogAction], *, fresh: bool
+    ) -> Optional[AuditLogEntry]:
+        now = datetime.now(timezone.utc)
+        return max(
+            (
+                entry for entry in self._entries.get(guild.id, ())
+                if (action is None or entry.action == action)
+                and (not fresh or (now - entry.created_at).total_seconds() <= self.FRESHNESS)
+            ),
+            key=lambda entry: entry.id,
+            default=None
+        )
+
+    async def _refresh(self, guild: Guild) -> None:
+        try:
+            async for entry in guild.audit_logs(limit=25):
+                self.add(entry)
+        except (Forbidden, HTTPException):
+            pass
+        finally:
+            self._requests.pop(guild.id, None)
+
+    async def fetch(self, guild: Guild, action: Optional[AuditLogAction] = None) -> list[AuditLogEntry]:
+        """
+        Resolves the latest audit log entry of a guild.
+
+        Args:
+            guild (Guild): The guild.
+            action (Optional[AuditLogAction]): The action of the entry, any action if None.
+
+        Returns:
+            list[AuditLogEntry]: The entry, or an empty list if there is none.
+        """
+        if entry := self._find(guild, action, fresh=True):
+            return [entry]
+
+        deadline = monotonic() + self.WAIT_TIMEOUT
+        while (remaining := deadline - monotonic()) > 0:
+            try:
+                await asyncio.wait_for(self._events[guild.id].wait(), remaining)
+            except asyncio.TimeoutError:
+                break
+
+            if entry := self._find(guild, action, fresh=True):
+                return [entry]
+
+        if not (task := self._requests.get(guild.id)) and (
+                monotonic() - self._refreshed_at.get(guild.id, 0) > self.REFRESH_INTERVAL
+        ):
+            self._refreshed_at[guild.id] = monotonic()
+            task = self._requests[guild.id] = asyncio.create_task(self._refresh(guild))
+
+        if task:
+            await asyncio.shield(task)
+
+        return [entry] if (entry := self._find(guild, action, fresh=False)) else []
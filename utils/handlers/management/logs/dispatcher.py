@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+from enum import IntEnum
+from time import monotonic
+from typing import TYPE_CHECKING, Optional
+
+from asyncpg import Record
+from disnake import Guild, Embed, TextChannel, Forbidden, HTTPException
+from disnake.ext.tasks import loop
+
+if TYPE_CHECKING:
+    from utils.basic import ChisatoBot
+
+__all__ = (
+    "LogsCategory",
+    "LogsDispatcher"
+)
+
+
+class LogsCategory(IntEnum):
+    """Index of the category column in a `settings_logs` row."""
+    SERVER = 1
+    CHANNELS = 2
+    MEMBERS = 3
+    MESSAGES = 4
+    AUTOMOD = 5
+
+
+class LogsDispatcher:
+    MAX_EMBEDS: int = 10
+    MAX_EMBEDS_LENGTH: int = 6000
+    FLUSH_DELAY: float = 1.5
+    RELOAD_INTERVAL: float = 600.0
+
+    def __init__(self, bot: ChisatoBot) -> None:
+        """
+        Routes logging embeds of a guild to its configured channels.
+
+        The routing table (guild -> category -> channel) is kept in memory, so events of
+        guilds without logging are dropped before any database or formatting work, and
+        embeds going to the same channel are sent together, up to 10 per message.
+
+        Args:
+            bot (ChisatoBot): The bot instance.
+        """
+        self.bot = bot
+
+        self._routes: dict[int, tuple[Optional[int], ...]] = {}
+        self._loaded_at: float | None = None
+
+        self._buffers: defaultdict[int, list[Embed]] = defaultdict(list)
+        self._flushes: dict[int, asyncio.TimerHandle] = {}
+
+    def __contains__(self, guild_id: int) -> bool:
+        return guild_id in self._routes
+
+    def start(self) -> None:
+        self._reload_routes.start()
+
+    def stop(self) -> None:
+        self._reload_routes.cancel()
+        for handle in self._flushes.values():
+            handle.cancel()
+
+        for channel_id in list(self._buffers):
+            self._flush(channel_id)
+
+    @loop(seconds=30)
+    async def _reload_routes(self) -> None:
+        if not self.bot.databases or not self.bot.databases.pool.connected:
+            return
+        if self._loaded_at and monotonic() - self._loaded_at < self.RELOAD_INTERVAL:
+            return
+
+        rows = await self.bot.databases.settings.get_all_logs_settings()
+        self._routes = {row[0]: tuple(row) for row in rows}
+        self._loaded_at = monotonic()
+
+    def update(self, guild: Guild, settings: Record | None) -> None:
+        """
+        Replaces the route of a guild after its logging settings changed.
+
+        Args:
+            guild (Guild): The guild.
+            settings (Record | None): The new `settings_logs` row of the guild.
+        """
+        if settings and any(settings[category] for category in LogsCategory):
+            self._routes[guild.id] = tuple(settings)
+        else:
+            self._routes.pop(guild.id, None)
+
+    def get_channel(self, guild: Guild | None, category: LogsCategory) -> TextChannel | None:
+        """
+        Resolves the channel for the logs of a category without touching the database.
+
+        Args:
+            guild (Guild | None): The guild the event happened in.
+            category (LogsCategory): The category of the event.
+
+        Returns:
+            TextChannel | None: The channel, or None if the guild does not log this category.
+        """
+        if guild is None or not (route := self._routes.get(guild.id)) or not route[category]:
+            return None
+
+        return guild.get_channel(route[category])  # type: ignore
+
+    def send(self, channel: TextChannel, embed: Embed) -> None:
+        """
+        Queues an embed for the channel, the queued embeds are sent together shortly after.
+
+        Args:
+            channel (TextChannel): The logs channel.
+            embed (Embed): The embed to send.
+        """
+        buffer = self._buffers[channel.id]
+        if buffer and (
+                len(buffer) >= self.MAX_EMBEDS
+                or sum(map(len, buffer)) + len(embed) > self.MAX_EMBEDS_LENGTH
+        ):
+            self._flush(channel.id)
+            buffer = self._buffers[channel.id]
+
+        buffer.append(embed)
+        if channel.id not in self._flushes:
+            self._flushes[channel.id] = self.bot.loop.call_later(
+                self.FLUSH_DELAY, self._flush, channel.id
+            )
+
+    def _flush(self, channel_id: int) -> None:
+        if handle := self._flushes.pop(channel_id, None):
+            handle.cancel()
+
+        if (embeds := self._buffers.pop(channel_id, None)) and (channel := self.bot.get_channel(channel_id)):
+            asyncio.create_task(self._deliver(channel, embeds))  # type: ignore
+
+    @staticmethod
+    async def _deliver(channel: TextChannel, embeds: list[Embed]) -> None:
+        try:
+            await channel.send(embeds=embeds)
+        except (HTTPException, Forbidden, TypeError, ValueError, AttributeError):
+            pass
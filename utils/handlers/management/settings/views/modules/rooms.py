@@ -219,6 +219,7 @@ class RoomsModule(View, SettingModule):
                 guild=interaction.guild.id, voice_channel=voice_channel.id, msg_id=control_message.id,
                 category=category.id, text_channel=channel_with_message.id, love_channel=love_channel
             )
+            self.bot.panels.add("rooms", interaction.guild, control_message.id)
 
             embed = EmbedUI(
                 title=_st.get("settings.success.title", locale=interaction.guild_locale),
@@ -423,6 +424,8 @@ class RoomsModule(View, SettingModule):
             )
 
             await self.bot.databases.rooms.room_update_setup(guild=interaction.guild.id, msg_id=message.id)
+            self.bot.panels.prune(data_obj[3])
+            self.bot.panels.add("rooms", interaction.guild, message.id)
             await interaction.edit_original_response(
                 embed=embed,
                 view=EndView(